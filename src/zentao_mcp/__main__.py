@@ -1,9 +1,53 @@
 """Entry point for running Zentao MCP Server"""
+import argparse
 import asyncio
+import importlib
 import sys
-from .server import main
+import time
+
+# Startup budget enforced by --measure-startup: import of the server plus the first list_tools
+DEFAULT_MAX_STARTUP_MS = 1500.0
+
+
+def measure_startup(max_startup_ms: float) -> int:
+    """Report how long a session takes to become ready; non-zero exit if over budget"""
+    start = time.perf_counter()
+    server = importlib.import_module("zentao_mcp.server")
+    imported = time.perf_counter()
+    tools = asyncio.run(server.list_tools())
+    ready = time.perf_counter()
+
+    total_ms = (ready - start) * 1000
+    print(f"import zentao_mcp.server: {(imported - start) * 1000:8.1f} ms")
+    print(f"first list_tools ({len(tools)}): {(ready - imported) * 1000:8.1f} ms")
+    print(f"total:                    {total_ms:8.1f} ms (budget {max_startup_ms:.0f} ms)")
+    if "zentao_mcp.client" in sys.modules:
+        print("zentao_mcp.client was imported before the first tool call")
+        return 1
+    return 0 if total_ms <= max_startup_ms else 1
+
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m zentao_mcp", description="Zentao MCP Server")
+    parser.add_argument("--transport", choices=("stdio", "http"), default="stdio",
+                        help="stdio for one client per process (default), or http to serve many sessions "
+                             "(Streamable HTTP at /mcp, SSE at /sse) from one shared process")
+    parser.add_argument("--host", default="127.0.0.1", help="with --transport http, address to bind")
+    parser.add_argument("--port", type=int, default=8000, help="with --transport http, port to listen on")
+    parser.add_argument("--measure-startup", action="store_true",
+                        help="measure import time and first list_tools latency, then exit")
+    parser.add_argument("--max-startup-ms", type=float, default=DEFAULT_MAX_STARTUP_MS,
+                        help="with --measure-startup, exit with status 1 above this total")
+    args = parser.parse_args()
+    if args.measure_startup:
+        sys.exit(measure_startup(args.max_startup_ms))
+
+    if args.transport == "http":
+        from .http_server import main as serve_http
+        serve_http(args.host, args.port)
+        sys.exit(0)
+
+    from .server import main
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -0,0 +1,75 @@
+"""Single-pass group-by over streamed Zentao records"""
+from typing import Optional, Dict, Any, List, AsyncIterator, Tuple
+
+BUG_GROUP_FIELDS = ("status", "severity", "pri", "type", "module", "assignedTo", "resolution", "execution", "openedBy")
+TASK_GROUP_FIELDS = ("status", "type", "pri", "module", "assignedTo", "story", "finishedBy")
+# Numeric task fields summed per group (hours)
+TASK_SUM_FIELDS = ("estimate", "consumed", "left")
+
+
+def field_value(record: Dict[str, Any], field: str) -> Any:
+    """Groupable value of a field; embedded users and objects collapse to their account or ID"""
+    value = record.get(field)
+    if isinstance(value, dict):
+        return value.get("account") or value.get("id")
+    if value == "":
+        return None
+    return value
+
+
+def _number(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _matches(record: Dict[str, Any], filters: Dict[str, List[str]]) -> bool:
+    return all(str(field_value(record, field)) in allowed for field, allowed in filters.items())
+
+
+async def aggregate(
+    records: AsyncIterator[Dict[str, Any]],
+    group_by: List[str],
+    filters: Optional[Dict[str, Any]] = None,
+    sum_fields: Tuple[str, ...] = ()
+) -> Dict[str, Any]:
+    """Count (and sum ``sum_fields`` of) records per distinct ``group_by`` value
+
+    Records are consumed as they stream in and only one accumulator per
+    group is kept, so memory depends on the number of groups, not on the
+    number of records. ``filters`` maps a field to the values to keep,
+    e.g. ``{"status": ["active"], "severity": [1, 2]}``.
+    """
+    filters = {
+        field: {str(v) for v in (allowed if isinstance(allowed, list) else [allowed])}
+        for field, allowed in (filters or {}).items()
+    }
+    groups: Dict[Tuple, List[float]] = {}
+    scanned = 0
+    async for record in records:
+        scanned += 1
+        if filters and not _matches(record, filters):
+            continue
+        key = tuple(field_value(record, field) for field in group_by)
+        acc = groups.get(key)
+        if acc is None:
+            acc = groups[key] = [0] + [0.0] * len(sum_fields)
+        acc[0] += 1
+        for i, field in enumerate(sum_fields, 1):
+            acc[i] += _number(record.get(field))
+
+    rows = []
+    for key, acc in groups.items():
+        row = dict(zip(group_by, key))
+        row["count"] = acc[0]
+        for i, field in enumerate(sum_fields, 1):
+            row[field] = round(acc[i], 2)
+        rows.append(row)
+    rows.sort(key=lambda row: (-row["count"], [str(row[field]) for field in group_by]))
+    return {
+        "scanned": scanned,
+        "total": sum(row["count"] for row in rows),
+        "group_by": group_by,
+        "groups": rows,
+    }
@@ -0,0 +1,136 @@
+"""Execution progress analytics computed from task rows"""
+from datetime import date, timedelta
+from typing import Optional, Dict, Any, List, Iterable
+
+from .aggregate import field_value
+
+DONE_STATUSES = frozenset({"done", "closed"})
+CANCELLED_STATUSES = frozenset({"cancel"})
+# Longest burndown series returned, in days
+MAX_BURNDOWN_DAYS = 366
+
+
+def parse_date(value: Any) -> Optional[date]:
+    """Date part of a Zentao date or datetime string; None for empty or zero dates"""
+    if not isinstance(value, str) or len(value) < 10 or value.startswith("0000"):
+        return None
+    try:
+        return date.fromisoformat(value[:10])
+    except ValueError:
+        return None
+
+
+def _hours(value: Any) -> float:
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def leaf_tasks(tasks: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Tasks without children, so parent tasks' rolled-up hours are not counted twice"""
+    leaves: Dict[Any, Dict[str, Any]] = {}
+    for task in tasks:
+        children = task.get("children")
+        if isinstance(children, dict):
+            children = list(children.values())
+        if children:
+            for child in leaf_tasks(children):
+                leaves[child.get("id")] = child
+        else:
+            leaves.setdefault(task.get("id"), task)
+    return list(leaves.values())
+
+
+def build_report(execution: Dict[str, Any], tasks: Iterable[Dict[str, Any]], today: date) -> Dict[str, Any]:
+    """Totals, per-assignee load, overdue tasks and a burndown series for an execution
+
+    One pass over the tasks collects per-task values and buckets completed
+    estimate by completion day; the burndown is then a running sum over the
+    days of the execution. Remaining work on a day is the estimate of tasks
+    not yet finished on that day (Zentao's REST API exposes no per-day
+    history of ``left``); cancelled tasks are left out of the burndown.
+    """
+    totals = {"tasks": 0, "estimate": 0.0, "consumed": 0.0, "left": 0.0}
+    by_status: Dict[str, int] = {}
+    load: Dict[Any, Dict[str, Any]] = {}
+    overdue: List[Dict[str, Any]] = []
+    completed_per_day: Dict[date, float] = {}
+    scope_estimate = 0.0
+    first_opened: Optional[date] = None
+
+    for task in leaf_tasks(tasks):
+        status = task.get("status") or ""
+        estimate, consumed, left = _hours(task.get("estimate")), _hours(task.get("consumed")), _hours(task.get("left"))
+        totals["tasks"] += 1
+        totals["estimate"] += estimate
+        totals["consumed"] += consumed
+        totals["left"] += left
+        by_status[status] = by_status.get(status, 0) + 1
+
+        opened = parse_date(task.get("openedDate"))
+        if opened and (first_opened is None or opened < first_opened):
+            first_opened = opened
+        if status in CANCELLED_STATUSES:
+            continue
+        scope_estimate += estimate
+        if status in DONE_STATUSES:
+            finished = parse_date(task.get("finishedDate")) or parse_date(task.get("closedDate")) or today
+            completed_per_day[finished] = completed_per_day.get(finished, 0.0) + estimate
+            continue
+
+        assignee = field_value(task, "assignedTo")
+        entry = load.get(assignee)
+        if entry is None:
+            entry = load[assignee] = {"assignedTo": assignee, "tasks": 0, "estimate": 0.0, "consumed": 0.0, "left": 0.0}
+        entry["tasks"] += 1
+        entry["estimate"] += estimate
+        entry["consumed"] += consumed
+        entry["left"] += left
+
+        deadline = parse_date(task.get("deadline"))
+        if deadline and deadline < today:
+            overdue.append({
+                "id": task.get("id"),
+                "name": task.get("name"),
+                "assignedTo": assignee,
+                "status": status,
+                "deadline": deadline.isoformat(),
+                "days_overdue": (today - deadline).days,
+                "left": left,
+            })
+
+    begin = parse_date(execution.get("begin")) or first_opened or today
+    end = parse_date(execution.get("end")) or max(today, begin)
+    end = min(end, begin + timedelta(days=MAX_BURNDOWN_DAYS - 1))
+    days = (end - begin).days + 1
+    # Work finished before the execution began counts on its first day
+    burned = sum(hours for day, hours in completed_per_day.items() if day < begin)
+    burndown = []
+    for offset in range(days):
+        day = begin + timedelta(days=offset)
+        burned += completed_per_day.get(day, 0.0)
+        ideal = scope_estimate * (1 - offset / (days - 1)) if days > 1 else 0.0
+        burndown.append({
+            "date": day.isoformat(),
+            "remaining": round(scope_estimate - burned, 2) if day <= today else None,
+            "ideal": round(ideal, 2),
+        })
+
+    spent = totals["consumed"] + totals["left"]
+    overdue.sort(key=lambda task: -task["days_overdue"])
+    return {
+        "execution": {key: execution.get(key) for key in ("id", "name", "status", "begin", "end")},
+        "today": today.isoformat(),
+        "totals": {
+            **{key: round(value, 2) for key, value in totals.items()},
+            "progress": round(100 * totals["consumed"] / spent, 1) if spent else 0.0,
+        },
+        "by_status": by_status,
+        "by_assignee": sorted(
+            ({**entry, **{k: round(entry[k], 2) for k in ("estimate", "consumed", "left")}} for entry in load.values()),
+            key=lambda entry: -entry["left"]
+        ),
+        "overdue": overdue,
+        "burndown": burndown,
+    }
@@ -0,0 +1,184 @@
+"""In-memory response cache for Zentao GET requests"""
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Iterable, Set, Tuple
+
+# Default time-to-live in seconds per resource type (the last non-numeric path segment)
+DEFAULT_TTLS: Dict[str, float] = {
+    "users": 600.0,
+    "user": 600.0,
+    "programs": 300.0,
+    "products": 300.0,
+    "projects": 120.0,
+    "executions": 120.0,
+    "plans": 120.0,
+    "productplans": 120.0,
+    "builds": 120.0,
+    "stories": 30.0,
+    "tasks": 30.0,
+    "bugs": 30.0,
+    "testcases": 30.0,
+    "testtasks": 30.0,
+}
+
+# Resource type -> (entity field, parent collection) pairs whose sub-lists include it
+PARENT_COLLECTIONS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "tasks": (("execution", "executions"), ("project", "projects")),
+    "bugs": (("product", "products"), ("project", "projects"), ("execution", "executions")),
+    "stories": (("product", "products"), ("project", "projects"), ("execution", "executions")),
+    "testcases": (("product", "products"),),
+    "executions": (("project", "projects"),),
+    "builds": (("project", "projects"), ("execution", "executions")),
+}
+
+CacheKey = Tuple[str, str, Tuple[Tuple[str, str], ...]]
+
+
+def resource_type(path: str) -> str:
+    """Resource type of an API path, e.g. ``/executions/3/tasks`` -> ``tasks``"""
+    for segment in reversed(path.strip("/").split("/")):
+        if segment and not segment.isdigit():
+            return segment
+    return ""
+
+
+def entity_id_of(value: Any) -> Optional[int]:
+    """Extract an ID from a plain ID or an embedded ``{"id": ...}`` object"""
+    if isinstance(value, dict):
+        value = value.get("id")
+    if isinstance(value, int) or (isinstance(value, str) and value.isdigit()):
+        return int(value)
+    return None
+
+
+class ResponseCache:
+    """TTL + LRU cache of parsed GET responses
+
+    Cached values are shared with callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        default_ttl: float = 60.0,
+        ttls: Optional[Dict[str, float]] = None
+    ):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()
+        self._by_path: Dict[str, Set[CacheKey]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(method: str, path: str, params: Optional[Dict] = None) -> CacheKey:
+        items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items() if v is not None))
+        return (method.upper(), path, items)
+
+    def ttl_for(self, path: str) -> float:
+        return self.ttls.get(resource_type(path), self.default_ttl)
+
+    def get(self, key: CacheKey) -> Tuple[bool, Any]:
+        """Return ``(hit, value)`` and refresh the entry's LRU position"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, value
+            self._remove(key)
+        self.misses += 1
+        return False, None
+
+    def peek(self, path: str) -> Any:
+        """Return an unexpired parameterless entry for path without touching stats"""
+        entry = self._entries.get(self.make_key("GET", path))
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def set(self, key: CacheKey, value: Any):
+        ttl = self.ttl_for(key[1])
+        if ttl <= 0:
+            return
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._by_path.setdefault(key[1], set()).add(key)
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: CacheKey):
+        self._entries.pop(key, None)
+        keys = self._by_path.get(key[1])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_path[key[1]]
+
+    def invalidate_path(self, path: str):
+        """Drop every cached response for path, whatever its params"""
+        for key in list(self._by_path.get(path, ())):
+            self._remove(key)
+            self.invalidations += 1
+
+    def invalidate_suffix(self, suffix: str):
+        """Drop every cached response whose path ends with suffix"""
+        for path in [p for p in self._by_path if p.endswith(suffix)]:
+            self.invalidate_path(path)
+
+    def invalidate_write(self, path: str, result: Any = None):
+        """Evict everything a successful POST/PUT/DELETE on path may have changed
+
+        That is the path itself, its ancestors (``/stories/5/change`` also
+        evicts ``/stories/5`` and ``/stories``) and the parent collections the
+        entity appears in, e.g. ``/executions/{id}/tasks`` for a task.
+        """
+        segments = path.strip("/").split("/")
+        kind = resource_type(path)
+        # Parent IDs come from the entity as cached before the write and as returned by it
+        entities = [e for e in (self.peek(self._entity_path(segments, kind)), result) if isinstance(e, dict)]
+
+        for end in range(len(segments), 0, -1):
+            self.invalidate_path("/" + "/".join(segments[:end]))
+
+        if kind not in PARENT_COLLECTIONS:
+            return
+        for field, parent in PARENT_COLLECTIONS[kind]:
+            parent_ids = {entity_id_of(e.get(field)) for e in entities} - {None}
+            if not parent_ids and segments[0] != parent:
+                # Unknown parent: every sub-list of this type may be stale
+                self.invalidate_suffix(f"/{kind}")
+                continue
+            for parent_id in parent_ids:
+                self.invalidate_path(f"/{parent}/{parent_id}/{kind}")
+
+    @staticmethod
+    def _entity_path(segments: Iterable[str], kind: str) -> str:
+        segments = list(segments)
+        if kind in segments:
+            index = segments.index(kind)
+            return "/" + "/".join(segments[:index + 2])
+        return "/" + "/".join(segments)
+
+    def clear(self):
+        self._entries.clear()
+        self._by_path.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
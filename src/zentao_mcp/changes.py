@@ -0,0 +1,288 @@
+"""Cursor-based change feeds over Zentao list endpoints"""
+import base64
+import binascii
+import hashlib
+import logging
+import time
+from typing import Optional, Dict, Any, List, Tuple, Callable, TYPE_CHECKING
+
+from . import jsonlib
+from .replica import EDITED_FIELD, edited_at
+from .sqlite_store import SQLiteStore, default_path as _default_path
+
+if TYPE_CHECKING:
+    from .client import AsyncZentaoClient
+
+logger = logging.getLogger(__name__)
+
+# Source name -> (list endpoint template, record key)
+SOURCES: Dict[str, Tuple[str, str]] = {
+    "product_bugs": ("/products/{id}/bugs", "bugs"),
+    "product_stories": ("/products/{id}/stories", "stories"),
+    "product_testcases": ("/products/{id}/testcases", "testcases"),
+    "project_stories": ("/projects/{id}/stories", "stories"),
+    "project_executions": ("/projects/{id}/executions", "executions"),
+    "execution_tasks": ("/executions/{id}/tasks", "tasks"),
+    "execution_stories": ("/executions/{id}/stories", "stories"),
+}
+CLOSED_STATUSES = frozenset({"closed", "done", "cancel", "resolved"})
+# Records per page while walking the change streams; a quiet poll reads one such page
+PROBE_LIMIT = 20
+# Cursors older than this are forgotten
+CURSOR_TTL = 30 * 86400
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS fingerprints (
+    scope TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    fingerprint TEXT NOT NULL,
+    status TEXT,
+    changed_seq INTEGER NOT NULL,
+    closed_seq INTEGER,
+    PRIMARY KEY (scope, id)
+);
+CREATE TABLE IF NOT EXISTS cursors (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    scope TEXT NOT NULL,
+    edited TEXT,
+    max_id INTEGER,
+    total INTEGER,
+    created_at REAL NOT NULL
+);
+"""
+
+
+class CursorError(ValueError):
+    """The cursor is malformed, belongs to another source or has expired"""
+
+
+def default_path(base_url: str, username: str) -> str:
+    return _default_path("changes", base_url, username)
+
+
+def fingerprint(record: Dict[str, Any]) -> str:
+    return hashlib.blake2b(jsonlib.dumps_bytes(record), digest_size=16).hexdigest()
+
+
+def encode_cursor(scope: str, seq: int) -> str:
+    raw = jsonlib.dumps_bytes({"scope": scope, "seq": seq})
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    try:
+        data = jsonlib.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return str(data["scope"]), int(data["seq"])
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise CursorError(f"Malformed cursor: {cursor!r}")
+
+
+class ChangeStore(SQLiteStore):
+    """Fingerprints of the records each scope had at every cursor
+
+    A record's row remembers the cursor sequence at which its content last
+    changed (and at which it was closed), so any older cursor can tell
+    whether the record changed after it, however many polls came between.
+    """
+
+    thread_name = "zentao-changes"
+
+    def __init__(self, path: str):
+        super().__init__(path, SCHEMA)
+
+    def cursor(self, seq: int) -> Optional[Tuple[str, Optional[str], Optional[int], Optional[int]]]:
+        """``(scope, edited watermark, max id, total)`` of a cursor"""
+        with self._lock:
+            return self._db.execute(
+                "SELECT scope, edited, max_id, total FROM cursors WHERE seq = ?", (seq,)
+            ).fetchone()
+
+    def new_cursor(self, scope: str, edited: Optional[str], max_id: Optional[int], total: Optional[int]) -> int:
+        now = time.time()
+        with self._lock:
+            self._db.execute("DELETE FROM cursors WHERE created_at < ?", (now - CURSOR_TTL,))
+            row = self._db.execute(
+                "INSERT INTO cursors (scope, edited, max_id, total, created_at) VALUES (?, ?, ?, ?, ?)",
+                (scope, edited, max_id, total, now)
+            )
+        return row.lastrowid
+
+    def record(self, scope: str, records: List[Dict[str, Any]], seq: int) -> Dict[int, Tuple[int, Optional[int]]]:
+        """Store fingerprints observed at ``seq``; returns ``{id: (changed_seq, closed_seq)}``"""
+        marks = {}
+        with self._transaction():
+            for record in records:
+                entity_id = int(record["id"])
+                digest, status = fingerprint(record), record.get("status")
+                row = self._db.execute(
+                    "SELECT fingerprint, status, changed_seq, closed_seq FROM fingerprints WHERE scope = ? AND id = ?",
+                    (scope, entity_id)
+                ).fetchone()
+                if row is not None and row[0] == digest:
+                    marks[entity_id] = (row[2], row[3])
+                    continue
+                closed_seq = row[3] if row is not None else None
+                if status in CLOSED_STATUSES and (row is None or row[1] not in CLOSED_STATUSES):
+                    closed_seq = seq
+                self._db.execute(
+                    "INSERT OR REPLACE INTO fingerprints (scope, id, fingerprint, status, changed_seq, closed_seq) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (scope, entity_id, digest, status, seq, closed_seq)
+                )
+                marks[entity_id] = (seq, closed_seq)
+        return marks
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            fingerprints = self._db.execute("SELECT COUNT(*) FROM fingerprints").fetchone()[0]
+            cursors = self._db.execute("SELECT COUNT(*) FROM cursors").fetchone()[0]
+        return {"path": self.path, "fingerprints": fingerprints, "cursors": cursors}
+
+
+class ChangeTracker:
+    """Answer "what changed since this cursor" with as few requests as possible
+
+    Edits (and status changes such as closing, which touch the last-edited
+    date) are found by reading ``lastEditedDate_desc`` pages of
+    ``PROBE_LIMIT`` records down to the cursor's watermark, so a quiet poll
+    costs one small request. Records created without a last-edited date
+    are found through ``id_desc`` pages above the cursor's highest ID, read
+    only when the list's ``total`` moved. Fingerprints drop records that
+    were merely re-read at the watermark. If Zentao ignores the requested
+    order, the whole list is read instead.
+    """
+
+    def __init__(self, client: "AsyncZentaoClient", store: ChangeStore):
+        self.client = client
+        self.store = store
+        self.requests = 0
+
+    async def changes_since(self, source: str, entity_id: int, cursor: Optional[str] = None) -> Dict[str, Any]:
+        if source not in SOURCES:
+            raise ValueError(f"Unknown change source: {source!r}")
+        template, key = SOURCES[source]
+        scope = template.format(id=entity_id)
+        if cursor is None:
+            return await self._baseline(scope, key)
+        cursor_scope, seq = decode_cursor(cursor)
+        if cursor_scope != scope:
+            raise CursorError(f"Cursor belongs to {cursor_scope}, not {scope}")
+        state = await self.store.run(self.store.cursor, seq)
+        if state is None:
+            raise CursorError("Cursor expired or unknown; call without a cursor to start over")
+        _, watermark, max_id, total = state
+
+        requests_before = self.requests
+        candidates: Dict[int, Dict[str, Any]] = {}
+        ordered, new_total = await self._walk(scope, key, f"{EDITED_FIELD}_desc", edited_at, watermark, candidates)
+        if ordered and new_total != total:
+            ordered, new_total = await self._walk(scope, key, "id_desc", _record_id, max_id, candidates)
+        if not ordered:
+            new_total = await self._read_all(scope, key, candidates)
+        edited = max(filter(None, [watermark, *(edited_at(r) for r in candidates.values())]), default=None)
+        highest = max(filter(None, [max_id, *candidates]), default=None)
+
+        new_seq = await self.store.run(self.store.new_cursor, scope, edited, highest, new_total)
+        marks = await self.store.run(self.store.record, scope, list(candidates.values()), new_seq)
+        changes = []
+        for entity_id_, record in candidates.items():
+            changed_seq, closed_seq = marks[entity_id_]
+            if changed_seq <= seq:
+                continue
+            if max_id is None or entity_id_ > max_id:
+                change = "created"
+            elif closed_seq is not None and closed_seq > seq:
+                change = "closed"
+            else:
+                change = "edited"
+            changes.append({"change": change, **record})
+        changes.sort(key=lambda record: int(record["id"]))
+        return {
+            "source": source,
+            "entity_id": entity_id,
+            "cursor": encode_cursor(scope, new_seq),
+            "count": len(changes),
+            "changes": changes,
+            "requests": self.requests - requests_before,
+        }
+
+    async def _baseline(self, scope: str, key: str) -> Dict[str, Any]:
+        """Fingerprint the whole list once and hand out the first cursor"""
+        records: Dict[int, Dict[str, Any]] = {}
+        total = await self._read_all(scope, key, records)
+        edited = max(filter(None, (edited_at(r) for r in records.values())), default=None)
+        seq = await self.store.run(self.store.new_cursor, scope, edited, max(records, default=None), total)
+        await self.store.run(self.store.record, scope, list(records.values()), seq)
+        return {"cursor": encode_cursor(scope, seq), "count": 0, "changes": [], "baseline": len(records)}
+
+    async def _page(self, scope: str, key: str, order: Optional[str], page: int, limit: int) -> Tuple[list, Any]:
+        params = {"page": page, "limit": limit}
+        if order:
+            params["order"] = order
+        self.requests += 1
+        data = await self.client._request("GET", scope, params=params, cached=False) or {}
+        return data.get(key) or [], data.get("total")
+
+    async def _walk(
+        self,
+        scope: str,
+        key: str,
+        order: str,
+        sort_key: Callable[[Dict[str, Any]], Any],
+        floor: Any,
+        found: Dict[int, Dict[str, Any]]
+    ) -> Tuple[bool, Optional[int]]:
+        """Collect records of a descending stream down to ``floor``
+
+        Last-edited dates equal to the floor are kept, since several edits
+        can share a second; fingerprints sort those out. IDs stop at the
+        floor. Returns ``(whether the stream was ordered, list total)``.
+        """
+        inclusive = order != "id_desc"
+        page, previous = 1, None
+        while True:
+            records, total = await self._page(scope, key, order, page, PROBE_LIMIT)
+            values = [sort_key(record) for record in records]
+            if not _descending(values, previous):
+                # Zentao ignored the order, so no stop point can be trusted
+                return False, total
+            for record, value in zip(records, values):
+                if value is None:
+                    # Never-edited records sort last; everything edited has been seen
+                    return True, total
+                if floor is not None and (value < floor or (value == floor and not inclusive)):
+                    return True, total
+                found[int(record["id"])] = record
+            if len(records) < PROBE_LIMIT:
+                return True, total
+            previous = values[-1]
+            page += 1
+
+    async def _read_all(self, scope: str, key: str, found: Dict[int, Dict[str, Any]]) -> Optional[int]:
+        """Read every page in plain order; returns the list total"""
+        totals = []
+
+        def on_page(data: Dict[str, Any]):
+            self.requests += 1
+            totals.append(data.get("total"))
+
+        async for record in self.client._iter_pages(scope, key, cached=False, on_page=on_page):
+            found[int(record["id"])] = record
+        return totals[0] if totals else None
+
+
+def _record_id(record: Dict[str, Any]) -> int:
+    return int(record["id"])
+
+
+def _descending(values: List[Any], previous: Any) -> bool:
+    """Whether a page continues a descending stream, missing values last"""
+    missing = False
+    for value in values:
+        if value is None:
+            missing = True
+        elif missing or (previous is not None and value > previous):
+            return False
+        else:
+            previous = value
+    return True
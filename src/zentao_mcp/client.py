@@ -1,28 +1,207 @@
 """Zentao API Client"""
-import requests
-from typing import Optional, Dict, Any, List
+import asyncio
+import inspect
+import math
+import threading
+import time
+from collections import deque
+from datetime import date
+from typing import Optional, Dict, Any, List, Tuple, AsyncIterator, Callable, Awaitable
 import logging
 
+import httpx
+
+from . import jsonlib
+from .aggregate import TASK_SUM_FIELDS, aggregate
+from .analytics import build_report
+from .cache import ResponseCache
+from .changes import ChangeStore, ChangeTracker, default_path as default_changes_path
 from .config import ZentaoConfig
+from .export import SOURCES as EXPORT_SOURCES, DEFAULT_COLUMNS as EXPORT_COLUMNS, export_records, output_path
+from .export import default_dir as default_export_dir
+from .replica import Replica, SyncEngine, default_path, path_kind
+from .resilience import CircuitBreaker, IDEMPOTENT_METHODS, backoff_delay
+from .search import SearchIndex, default_path as default_search_path
+from .token_store import TokenStore
 
 logger = logging.getLogger(__name__)
 
 
-class ZentaoClient:
-    """Client for Zentao API"""
+def make_http_client(
+    config: ZentaoConfig,
+    transport: Optional[httpx.AsyncBaseTransport] = None
+) -> httpx.AsyncClient:
+    """Connection pool for talking to Zentao"""
+    # Zentao is a single host, so the pool-wide connection cap is the per-host cap
+    return httpx.AsyncClient(
+        transport=transport,
+        limits=httpx.Limits(
+            max_connections=config.max_connections_per_host,
+            max_keepalive_connections=config.pool_size,
+            keepalive_expiry=config.keepalive_expiry
+        ),
+        headers={"Accept-Encoding": "gzip, deflate" if config.compression else "identity"},
+        timeout=httpx.Timeout(config.read_timeout, connect=config.connect_timeout),
+        # Like requests: instances behind an http->https or path redirect keep working
+        follow_redirects=True
+    )
+
+
+class AsyncZentaoClient:
+    """Asynchronous client for Zentao API
+
+    All requests share one ``httpx.AsyncClient`` connection pool, so concurrent
+    tool calls run side by side instead of queueing behind each other. Pass
+    ``http`` to share a pool between clients of different accounts; the
+    token travels per request, and a shared pool is left open on close.
+    """
     
-    def __init__(self, config: Optional[ZentaoConfig] = None):
+    def __init__(
+        self,
+        config: Optional[ZentaoConfig] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        http: Optional[httpx.AsyncClient] = None
+    ):
         self.config = config or ZentaoConfig.from_env()
-        self.session = requests.Session()
+        self._owns_http = http is None
+        self.http = http if http is not None else make_http_client(self.config, transport)
+        self.breaker = CircuitBreaker(self.config.breaker_threshold, self.config.breaker_cooldown)
+        self.retries = 0
+        self._connection_stats = {"requests": 0, "new_connections": 0}
         self._token: Optional[str] = None
+        self._token_acquired_at = 0.0
+        self._auth_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.auth_stats = {"logins": 0, "cached_tokens": 0, "proactive_refreshes": 0, "unauthorized": 0}
+        self.token_store: Optional[TokenStore] = None
+        if self.config.token_cache:
+            self.token_store = TokenStore(self.config.token_cache_path or None)
         self.base_path = f"{self.config.base_url.rstrip('/')}/api.php/v1"
+        self.cache: Optional[ResponseCache] = None
+        if self.config.cache_enabled:
+            self.cache = ResponseCache(
+                max_entries=self.config.cache_max_entries,
+                default_ttl=self.config.cache_ttl,
+                ttls=self.config.cache_ttls
+            )
+        self.writes = 0
+        # Identical GETs in flight, keyed by request and write count
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        self.coalescing = {"calls": 0, "saved": 0}
+        # Execution reports, evicted like cached task lists when a task changes
+        self.report_cache = ResponseCache(
+            max_entries=256,
+            default_ttl=self.config.cache_ttl,
+            ttls=self.config.cache_ttls
+        )
+        self.replica: Optional[Replica] = None
+        self.sync_engine: Optional[SyncEngine] = None
+        if self.config.replica_enabled:
+            self.replica = Replica(
+                self.config.replica_path or default_path(self.config.base_url, self.config.username)
+            )
+            self.sync_engine = SyncEngine(self, self.replica)
+        self.search_index: Optional[SearchIndex] = None
+        if self.config.search_enabled:
+            self.search_index = SearchIndex(
+                self.config.search_path or default_search_path(self.config.base_url, self.config.username)
+            )
+        # Created on first changes_since call
+        self.change_tracker: Optional[ChangeTracker] = None
+    
+    async def aclose(self):
+        """Close the underlying connection pool"""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+        if self.change_tracker is not None:
+            await asyncio.to_thread(self.change_tracker.store.close)
+        if self.sync_engine is not None:
+            await self.sync_engine.aclose()
+            await asyncio.to_thread(self.replica.close)
+        if self.search_index is not None:
+            await asyncio.to_thread(self.search_index.close)
+        if self._owns_http:
+            await self.http.aclose()
+    
+    async def _trace(self, event: str, info: Dict[str, Any]):
+        """httpcore trace hook counting requests and newly opened connections"""
+        if event == "connection.connect_tcp.complete":
+            self._connection_stats["new_connections"] += 1
+        elif event.endswith(".send_request_headers.started"):
+            self._connection_stats["requests"] += 1
+    
+    def connection_stats(self) -> Dict[str, int]:
+        """Connection reuse counters for the shared pool"""
+        requests = self._connection_stats["requests"]
+        new_connections = self._connection_stats["new_connections"]
+        return {
+            "requests": requests,
+            "new_connections": new_connections,
+            "reused_connections": max(0, requests - new_connections),
+        }
+    
+    async def __aenter__(self) -> "AsyncZentaoClient":
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
         
-    def _ensure_authenticated(self):
-        """Ensure we have a valid token"""
-        if not self._token:
-            self._authenticate()
+    def _token_age(self) -> float:
+        return time.monotonic() - self._token_acquired_at
     
-    def _authenticate(self):
+    async def _ensure_authenticated(self):
+        """Ensure we have a valid token
+
+        A token past its expected lifetime is replaced before use; one close
+        to expiry keeps serving requests while a refresh runs in the background.
+        """
+        ttl = self.config.token_ttl
+        if not self._token or (ttl > 0 and self._token_age() >= ttl):
+            await self._refresh_token(self._token)
+        elif ttl > 0 and self._token_age() >= ttl - self.config.token_refresh_margin:
+            if self._refresh_task is None or self._refresh_task.done():
+                self._refresh_task = asyncio.ensure_future(self._background_refresh(self._token))
+    
+    async def _refresh_token(self, stale_token: Optional[str]):
+        """Replace stale_token, sharing a single login among all concurrent callers"""
+        async with self._auth_lock:
+            if self._token and self._token != stale_token:
+                return  # Another caller already logged in while we waited
+            if self.token_store is not None and await self._adopt_cached_token(stale_token):
+                return
+            await self._authenticate()
+    
+    async def _adopt_cached_token(self, stale_token: Optional[str]) -> bool:
+        """Reuse a token another process (or a previous run) left in the token cache"""
+        base_url, username = self.config.base_url, self.config.username
+        try:
+            if stale_token:
+                await asyncio.to_thread(self.token_store.discard, base_url, username, stale_token)
+            cached = await asyncio.to_thread(self.token_store.load, base_url, username)
+        except OSError as e:
+            logger.warning(f"Token cache unavailable: {e}")
+            return False
+        if not cached or cached[0] == stale_token:
+            return False
+        token, issued_at = cached
+        age = max(0.0, time.time() - issued_at)
+        ttl = self.config.token_ttl
+        if ttl > 0 and age >= ttl - self.config.token_refresh_margin:
+            return False  # Already due for refresh; log in instead
+        self._token = token
+        self._token_acquired_at = time.monotonic() - age
+        self.auth_stats["cached_tokens"] += 1
+        logger.info("Reusing cached Zentao token")
+        return True
+    
+    async def _background_refresh(self, stale_token: Optional[str]):
+        try:
+            await self._refresh_token(stale_token)
+            self.auth_stats["proactive_refreshes"] += 1
+        except httpx.HTTPError as e:
+            logger.warning(f"Background token refresh failed: {e}")
+    
+    async def _authenticate(self):
         """Authenticate and get token"""
         url = f"{self.config.base_url.rstrip('/')}/api.php/v1/tokens"
         payload = {
@@ -31,303 +210,879 @@ class ZentaoClient:
         }
         
         try:
-            response = self.session.post(url, json=payload)
+            response = await self.http.post(url, json=payload, extensions={"trace": self._trace})
             response.raise_for_status()
-            data = response.json()
+            data = jsonlib.loads(response.content)
             self._token = data.get("token")
+            self._token_acquired_at = time.monotonic()
+            self.auth_stats["logins"] += 1
             logger.info("Successfully authenticated with Zentao")
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Authentication failed: {e}")
             raise
+        
+        if self.token_store is not None and self._token:
+            try:
+                await asyncio.to_thread(
+                    self.token_store.save, self.config.base_url, self.config.username, self._token
+                )
+            except OSError as e:
+                logger.warning(f"Could not write token cache: {e}")
     
-    def _get_headers(self) -> Dict[str, str]:
+    async def _get_headers(self) -> Dict[str, str]:
         """Get request headers with token"""
-        self._ensure_authenticated()
+        await self._ensure_authenticated()
         return {"Token": self._token} if self._token else {}
     
-    def _request(
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict],
+        json_data: Optional[Dict],
+        _retry: bool
+    ) -> httpx.Response:
+        """Send one request, re-authenticating and resending once on 401"""
+        content = jsonlib.dumps_bytes(json_data) if json_data is not None else None
+        headers = await self._get_headers()
+        if content is not None:
+            headers["Content-Type"] = "application/json"
+        response = await self.http.request(
+            method=method,
+            url=url,
+            headers=headers,
+            params=params,
+            content=content,
+            extensions={"trace": self._trace}
+        )
+        # If 401, try to re-authenticate and retry once
+        if response.status_code == 401 and _retry:
+            logger.warning("Token expired, re-authenticating...")
+            self.auth_stats["unauthorized"] += 1
+            await self._refresh_token(headers.get("Token"))
+            headers = await self._get_headers()
+            if content is not None:
+                headers["Content-Type"] = "application/json"
+            response = await self.http.request(
+                method=method,
+                url=url,
+                headers=headers,
+                params=params,
+                content=content,
+                extensions={"trace": self._trace}
+            )
+        return response
+    
+    async def _backoff(self, attempt: int, reason: str):
+        """Sleep before retry number attempt + 1"""
+        delay = backoff_delay(attempt, self.config.retry_backoff, self.config.retry_backoff_max)
+        self.retries += 1
+        logger.warning(f"Zentao request failed ({reason}), retrying in {delay:.2f}s")
+        await asyncio.sleep(delay)
+    
+    async def _request(
         self,
         method: str,
         path: str,
         params: Optional[Dict] = None,
         json_data: Optional[Dict] = None,
-        _retry: bool = True
+        _retry: bool = True,
+        cached: bool = True
     ) -> Any:
-        """Make a request to Zentao API"""
+        """Make a request to Zentao API
+
+        GET responses are served from the response cache when it is enabled
+        (and ``cached`` is set); successful writes evict the paths they may
+        have changed. Identical GETs in flight at the same time share one
+        HTTP call and its parsed result, with or without the cache. Idempotent
+        methods are retried on connection errors and 5xx responses with
+        jittered exponential backoff, and the circuit breaker fails fast
+        while Zentao keeps failing.
+        """
+        cache_key = None
+        if self.cache is not None and method == "GET" and cached:
+            cache_key = self.cache.make_key(method, path, params)
+            hit, value = self.cache.get(cache_key)
+            if hit:
+                return value
+        if method != "GET" or not self.config.coalesce_requests:
+            return await self._perform(method, path, params, json_data, _retry, cache_key)
+
+        # A GET issued after a write never joins a call that started before it
+        flight_key = (ResponseCache.make_key(method, path, params), self.writes)
+        task = self._inflight.get(flight_key)
+        if task is not None:
+            self.coalescing["saved"] += 1
+        else:
+            self.coalescing["calls"] += 1
+            task = asyncio.ensure_future(self._perform(method, path, params, json_data, _retry, cache_key))
+            self._inflight[flight_key] = task
+            task.add_done_callback(lambda done: self._flight_done(flight_key, done))
+        # Shielded so one caller giving up does not cancel the call for the others
+        return await asyncio.shield(task)
+
+    def _flight_done(self, flight_key: tuple, task: asyncio.Task):
+        self._inflight.pop(flight_key, None)
+        if not task.cancelled():
+            # Retrieved here in case every caller was cancelled
+            task.exception()
+
+    async def _perform(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict],
+        json_data: Optional[Dict],
+        _retry: bool,
+        cache_key: Optional[tuple]
+    ) -> Any:
+        """Send a request with retries and apply its result to caches and indexes"""
         url = f"{self.base_path}{path}"
-        headers = self._get_headers()
+        writes = self.writes
+        attempts = self.config.max_retries + 1 if method in IDEMPOTENT_METHODS else 1
+        for attempt in range(attempts):
+            self.breaker.before_request()
+            try:
+                response = await self._send(method, url, params, json_data, _retry)
+                if response.status_code >= 500:
+                    self.breaker.record_failure()
+                    if attempt + 1 < attempts:
+                        await self._backoff(attempt, f"HTTP {response.status_code}")
+                        continue
+                else:
+                    self.breaker.record_success()
+                response.raise_for_status()
+                result = jsonlib.loads(response.content) if response.content else None
+                break
+            except httpx.TransportError as e:
+                self.breaker.record_failure()
+                if attempt + 1 < attempts:
+                    await self._backoff(attempt, repr(e))
+                    continue
+                logger.error(f"API request failed: {e!r}")
+                raise
+            except httpx.HTTPError as e:
+                logger.error(f"API request failed: {e}")
+                raise
         
-        try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                headers=headers,
-                params=params,
-                json=json_data
+        if cache_key is not None:
+            # A write that finished while this read was in flight may have made it stale
+            if self.writes == writes:
+                self.cache.set(cache_key, result)
+        elif self.cache is not None and method != "GET":
+            self.cache.invalidate_write(path, result)
+        if method != "GET":
+            self.writes += 1
+            self.report_cache.invalidate_write(path, result)
+        if self.replica is not None and method != "GET":
+            try:
+                await self.replica.run(self.replica.apply_write, method, path, result)
+            except Exception as e:
+                # Zentao already accepted the write; failing the call would invite a duplicate retry
+                logger.warning(f"Replica update after {method} {path} failed: {e}")
+                self.replica.mark_stale(path)
+        if self.search_index is not None:
+            self.search_index.observe(method, path, result)
+        return result
+    
+    async def _iter_pages(
+        self,
+        path: str,
+        key: str,
+        params: Optional[Dict] = None,
+        page_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        cached: bool = True,
+        on_page: Optional[Callable[[Dict], Any]] = None
+    ) -> AsyncIterator[Dict]:
+        """Yield every record of a paginated list endpoint in order
+
+        The first page tells us ``total``; the remaining pages are fetched
+        concurrently, at most ``concurrency`` ahead of the consumer. Pass
+        ``cached=False`` for one-off full scans that should not fill the
+        response cache. ``on_page`` is called with each page's response
+        before its records are yielded.
+        """
+        page_size = page_size or self.config.page_size
+        concurrency = max(1, concurrency or self.config.page_concurrency)
+        params = dict(params or {})
+        
+        first = await self._request("GET", path, params={**params, "page": 1, "limit": page_size}, cached=cached)
+        if on_page is not None:
+            on_page(first or {})
+        records = (first or {}).get(key) or []
+        for record in records:
+            yield record
+        
+        total = (first or {}).get("total")
+        limit = (first or {}).get("limit") or page_size
+        if total is None or len(records) < limit:
+            return
+        pages = iter(range(2, math.ceil(total / limit) + 1))
+        
+        def fetch(page: int) -> asyncio.Task:
+            return asyncio.ensure_future(
+                self._request("GET", path, params={**params, "page": page, "limit": limit}, cached=cached)
             )
-            # If 401, try to re-authenticate and retry once
-            if response.status_code == 401 and _retry:
-                logger.warning("Token expired, re-authenticating...")
-                self._token = None  # Force re-auth
-                headers = self._get_headers()
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    params=params,
-                    json=json_data
-                )
-            response.raise_for_status()
-            return response.json() if response.text else None
-        except requests.RequestException as e:
-            logger.error(f"API request failed: {e}")
-            raise
+        
+        window = deque(fetch(page) for _, page in zip(range(concurrency), pages))
+        try:
+            while window:
+                data = await window.popleft()
+                page = next(pages, None)
+                if page is not None:
+                    window.append(fetch(page))
+                if on_page is not None:
+                    on_page(data or {})
+                for record in (data or {}).get(key) or []:
+                    yield record
+        finally:
+            for task in window:
+                task.cancel()
+    
+    # ==================== Local replica ====================
+    
+    async def read_replica(
+        self,
+        path: str,
+        page: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[bool, Any]:
+        """Answer a GET of path from the local replica when it is fresh enough
+
+        Returns ``(hit, result)``. On a miss because the kind is stale, an
+        incremental sync of that kind is started in the background.
+        """
+        if self.replica is None:
+            return False, None
+        hit, result = await self.replica.run(self.replica.lookup, path, self.config.replica_max_age, page, limit)
+        kind = path_kind(path)
+        if not hit and self.config.replica_auto_sync and not await self.replica.run(
+            self.replica.is_fresh, kind, self.config.replica_max_age
+        ):
+            self.sync_engine.schedule(kind)
+        return hit, result
+    
+    async def sync_replica(self, kinds: Optional[List[str]] = None, full: bool = False) -> Dict:
+        """Sync the local replica from Zentao (all kinds by default)"""
+        if self.sync_engine is None:
+            raise ValueError("The local replica is disabled; set ZENTAO_REPLICA=true to enable it")
+        return await self.sync_engine.sync(kinds, full=full)
+    
+    # ==================== Full-text search ====================
+    
+    async def search(
+        self,
+        query: str,
+        kinds: Optional[List[str]] = None,
+        product_id: Optional[int] = None,
+        page: int = 1,
+        limit: int = 20
+    ) -> Dict:
+        """Search the local index of bugs, stories, tasks and test cases"""
+        if self.search_index is None:
+            raise ValueError("Full-text search is disabled; set ZENTAO_SEARCH=true to enable it")
+        return await asyncio.wrap_future(self.search_index.submit(
+            self.search_index.search, query, kinds, product_id, page, limit
+        ))
     
     # ==================== Programs ====================
     
-    def list_programs(self, order: Optional[str] = None) -> Dict:
+    async def list_programs(self, order: Optional[str] = None) -> Dict:
         """Get list of programs"""
         params = {}
         if order:
             params["order"] = order
-        return self._request("GET", "/programs", params=params)
+        return await self._request("GET", "/programs", params=params)
     
-    def get_program(self, program_id: int) -> Dict:
+    async def get_program(self, program_id: int) -> Dict:
         """Get program details"""
-        return self._request("GET", f"/programs/{program_id}")
+        return await self._request("GET", f"/programs/{program_id}")
     
-    def create_program(self, data: Dict) -> Dict:
+    async def create_program(self, data: Dict) -> Dict:
         """Create a new program"""
-        return self._request("POST", "/programs", json_data=data)
+        return await self._request("POST", "/programs", json_data=data)
     
-    def update_program(self, program_id: int, data: Dict) -> Dict:
+    async def update_program(self, program_id: int, data: Dict) -> Dict:
         """Update a program"""
-        return self._request("PUT", f"/programs/{program_id}", json_data=data)
+        return await self._request("PUT", f"/programs/{program_id}", json_data=data)
     
-    def delete_program(self, program_id: int) -> Dict:
+    async def delete_program(self, program_id: int) -> Dict:
         """Delete a program"""
-        return self._request("DELETE", f"/programs/{program_id}")
+        return await self._request("DELETE", f"/programs/{program_id}")
     
     # ==================== Products ====================
     
-    def list_products(self) -> Dict:
+    async def list_products(self) -> Dict:
         """Get list of products"""
-        return self._request("GET", "/products")
+        return await self._request("GET", "/products")
     
-    def get_product(self, product_id: int) -> Dict:
+    async def get_product(self, product_id: int) -> Dict:
         """Get product details"""
-        return self._request("GET", f"/products/{product_id}")
+        return await self._request("GET", f"/products/{product_id}")
     
-    def create_product(self, data: Dict) -> Dict:
+    async def create_product(self, data: Dict) -> Dict:
         """Create a new product"""
-        return self._request("POST", "/products", json_data=data)
+        return await self._request("POST", "/products", json_data=data)
     
-    def update_product(self, product_id: int, data: Dict) -> Dict:
+    async def update_product(self, product_id: int, data: Dict) -> Dict:
         """Update a product"""
-        return self._request("PUT", f"/products/{product_id}", json_data=data)
+        return await self._request("PUT", f"/products/{product_id}", json_data=data)
     
-    def delete_product(self, product_id: int) -> Dict:
+    async def delete_product(self, product_id: int) -> Dict:
         """Delete a product"""
-        return self._request("DELETE", f"/products/{product_id}")
+        return await self._request("DELETE", f"/products/{product_id}")
     
-    def get_product_stories(self, product_id: int) -> Dict:
+    async def get_product_stories(self, product_id: int) -> Dict:
         """Get stories for a product"""
-        return self._request("GET", f"/products/{product_id}/stories")
+        return await self._request("GET", f"/products/{product_id}/stories")
     
-    def get_product_bugs(self, product_id: int) -> Dict:
+    async def get_product_bugs(self, product_id: int) -> Dict:
         """Get bugs for a product"""
-        return self._request("GET", f"/products/{product_id}/bugs")
+        return await self._request("GET", f"/products/{product_id}/bugs")
     
     # ==================== Projects ====================
     
-    def list_projects(self, page: int = 1, limit: int = 20) -> Dict:
+    async def list_projects(self, page: int = 1, limit: int = 20) -> Dict:
         """Get list of projects"""
         params = {"page": page, "limit": limit}
-        return self._request("GET", "/projects", params=params)
+        return await self._request("GET", "/projects", params=params)
     
-    def get_project(self, project_id: int) -> Dict:
+    async def get_project(self, project_id: int) -> Dict:
         """Get project details"""
-        return self._request("GET", f"/projects/{project_id}")
+        return await self._request("GET", f"/projects/{project_id}")
     
-    def create_project(self, data: Dict) -> Dict:
+    async def create_project(self, data: Dict) -> Dict:
         """Create a new project"""
-        return self._request("POST", "/projects", json_data=data)
+        return await self._request("POST", "/projects", json_data=data)
     
-    def update_project(self, project_id: int, data: Dict) -> Dict:
+    async def update_project(self, project_id: int, data: Dict) -> Dict:
         """Update a project"""
-        return self._request("PUT", f"/projects/{project_id}", json_data=data)
+        return await self._request("PUT", f"/projects/{project_id}", json_data=data)
     
-    def delete_project(self, project_id: int) -> Dict:
+    async def delete_project(self, project_id: int) -> Dict:
         """Delete a project"""
-        return self._request("DELETE", f"/projects/{project_id}")
+        return await self._request("DELETE", f"/projects/{project_id}")
     
-    def get_project_executions(self, project_id: int) -> Dict:
+    async def get_project_executions(self, project_id: int) -> Dict:
         """Get executions for a project"""
-        return self._request("GET", f"/projects/{project_id}/executions")
+        return await self._request("GET", f"/projects/{project_id}/executions")
     
-    def get_project_stories(self, project_id: int) -> Dict:
+    async def get_project_stories(self, project_id: int) -> Dict:
         """Get stories for a project"""
-        return self._request("GET", f"/projects/{project_id}/stories")
+        return await self._request("GET", f"/projects/{project_id}/stories")
     
     # ==================== Executions ====================
     
-    def list_executions(self) -> Dict:
+    async def list_executions(self) -> Dict:
         """Get list of executions"""
-        return self._request("GET", "/executions")
+        return await self._request("GET", "/executions")
     
-    def get_execution(self, execution_id: int) -> Dict:
+    async def get_execution(self, execution_id: int) -> Dict:
         """Get execution details"""
-        return self._request("GET", f"/executions/{execution_id}")
+        return await self._request("GET", f"/executions/{execution_id}")
     
-    def create_execution(self, project_id: int, data: Dict) -> Dict:
+    async def create_execution(self, project_id: int, data: Dict) -> Dict:
         """Create a new execution in a project"""
-        return self._request("POST", f"/projects/{project_id}/executions", json_data=data)
+        return await self._request("POST", f"/projects/{project_id}/executions", json_data=data)
     
-    def update_execution(self, execution_id: int, data: Dict) -> Dict:
+    async def update_execution(self, execution_id: int, data: Dict) -> Dict:
         """Update an execution"""
-        return self._request("PUT", f"/executions/{execution_id}", json_data=data)
+        return await self._request("PUT", f"/executions/{execution_id}", json_data=data)
     
-    def delete_execution(self, execution_id: int) -> Dict:
+    async def delete_execution(self, execution_id: int) -> Dict:
         """Delete an execution"""
-        return self._request("DELETE", f"/executions/{execution_id}")
+        return await self._request("DELETE", f"/executions/{execution_id}")
     
-    def get_execution_stories(self, execution_id: int) -> Dict:
+    async def get_execution_stories(self, execution_id: int) -> Dict:
         """Get stories for an execution"""
-        return self._request("GET", f"/executions/{execution_id}/stories")
+        return await self._request("GET", f"/executions/{execution_id}/stories")
     
-    def get_execution_tasks(self, execution_id: int) -> Dict:
+    async def get_execution_tasks(self, execution_id: int) -> Dict:
         """Get tasks for an execution"""
-        return self._request("GET", f"/executions/{execution_id}/tasks")
+        return await self._request("GET", f"/executions/{execution_id}/tasks")
     
     # ==================== Stories ====================
     
-    def get_story(self, story_id: int) -> Dict:
+    async def get_story(self, story_id: int) -> Dict:
         """Get story details"""
-        return self._request("GET", f"/stories/{story_id}")
+        return await self._request("GET", f"/stories/{story_id}")
     
-    def create_story(self, data: Dict) -> Dict:
+    async def create_story(self, data: Dict) -> Dict:
         """Create a new story"""
-        return self._request("POST", "/stories", json_data=data)
+        return await self._request("POST", "/stories", json_data=data)
     
-    def update_story(self, story_id: int, data: Dict) -> Dict:
+    async def update_story(self, story_id: int, data: Dict) -> Dict:
         """Update a story"""
-        return self._request("PUT", f"/stories/{story_id}", json_data=data)
+        return await self._request("PUT", f"/stories/{story_id}", json_data=data)
     
-    def delete_story(self, story_id: int) -> Dict:
+    async def delete_story(self, story_id: int) -> Dict:
         """Delete a story"""
-        return self._request("DELETE", f"/stories/{story_id}")
+        return await self._request("DELETE", f"/stories/{story_id}")
     
-    def change_story(self, story_id: int, data: Dict) -> Dict:
+    async def change_story(self, story_id: int, data: Dict) -> Dict:
         """Change a story (create new version)"""
-        return self._request("POST", f"/stories/{story_id}/change", json_data=data)
+        return await self._request("POST", f"/stories/{story_id}/change", json_data=data)
     
     # ==================== Tasks ====================
     
-    def get_task(self, task_id: int) -> Dict:
+    async def get_task(self, task_id: int) -> Dict:
         """Get task details"""
-        return self._request("GET", f"/tasks/{task_id}")
+        return await self._request("GET", f"/tasks/{task_id}")
     
-    def create_task(self, execution_id: int, data: Dict) -> Dict:
+    async def create_task(self, execution_id: int, data: Dict) -> Dict:
         """Create a new task in an execution"""
-        return self._request("POST", f"/executions/{execution_id}/tasks", json_data=data)
+        return await self._request("POST", f"/executions/{execution_id}/tasks", json_data=data)
     
-    def update_task(self, task_id: int, data: Dict) -> Dict:
+    async def update_task(self, task_id: int, data: Dict) -> Dict:
         """Update a task"""
-        return self._request("PUT", f"/tasks/{task_id}", json_data=data)
+        return await self._request("PUT", f"/tasks/{task_id}", json_data=data)
     
-    def delete_task(self, task_id: int) -> Dict:
+    async def delete_task(self, task_id: int) -> Dict:
         """Delete a task"""
-        return self._request("DELETE", f"/tasks/{task_id}")
+        return await self._request("DELETE", f"/tasks/{task_id}")
     
     # ==================== Bugs ====================
     
-    def get_bug(self, bug_id: int) -> Dict:
+    async def get_bug(self, bug_id: int) -> Dict:
         """Get bug details"""
-        return self._request("GET", f"/bugs/{bug_id}")
+        return await self._request("GET", f"/bugs/{bug_id}")
     
-    def create_bug(self, data: Dict) -> Dict:
+    async def create_bug(self, data: Dict) -> Dict:
         """Create a new bug"""
-        return self._request("POST", "/bugs", json_data=data)
+        return await self._request("POST", "/bugs", json_data=data)
     
-    def update_bug(self, bug_id: int, data: Dict) -> Dict:
+    async def update_bug(self, bug_id: int, data: Dict) -> Dict:
         """Update a bug"""
-        return self._request("PUT", f"/bugs/{bug_id}", json_data=data)
+        return await self._request("PUT", f"/bugs/{bug_id}", json_data=data)
     
-    def delete_bug(self, bug_id: int) -> Dict:
+    async def delete_bug(self, bug_id: int) -> Dict:
         """Delete a bug"""
-        return self._request("DELETE", f"/bugs/{bug_id}")
+        return await self._request("DELETE", f"/bugs/{bug_id}")
     
     # ==================== Users ====================
     
-    def list_users(self) -> Dict:
+    async def list_users(self) -> Dict:
         """Get list of users"""
-        return self._request("GET", "/users")
+        return await self._request("GET", "/users")
     
-    def get_user(self, user_id: int) -> Dict:
+    async def get_user(self, user_id: int) -> Dict:
         """Get user details"""
-        return self._request("GET", f"/users/{user_id}")
+        return await self._request("GET", f"/users/{user_id}")
     
-    def get_my_info(self) -> Dict:
+    async def get_my_info(self) -> Dict:
         """Get current user info"""
-        return self._request("GET", "/user")
+        return await self._request("GET", "/user")
     
     # ==================== Test Cases ====================
     
-    def get_product_testcases(self, product_id: int) -> Dict:
+    async def get_product_testcases(self, product_id: int) -> Dict:
         """Get test cases for a product"""
-        return self._request("GET", f"/products/{product_id}/testcases")
+        return await self._request("GET", f"/products/{product_id}/testcases")
     
-    def get_testcase(self, testcase_id: int) -> Dict:
+    async def get_testcase(self, testcase_id: int) -> Dict:
         """Get test case details"""
-        return self._request("GET", f"/testcases/{testcase_id}")
+        return await self._request("GET", f"/testcases/{testcase_id}")
     
-    def create_testcase(self, product_id: int, data: Dict) -> Dict:
+    async def create_testcase(self, product_id: int, data: Dict) -> Dict:
         """Create a new test case in a product"""
-        return self._request("POST", f"/products/{product_id}/testcases", json_data=data)
+        return await self._request("POST", f"/products/{product_id}/testcases", json_data=data)
     
-    def update_testcase(self, testcase_id: int, data: Dict) -> Dict:
+    async def update_testcase(self, testcase_id: int, data: Dict) -> Dict:
         """Update a test case"""
-        return self._request("PUT", f"/testcases/{testcase_id}", json_data=data)
+        return await self._request("PUT", f"/testcases/{testcase_id}", json_data=data)
     
-    def delete_testcase(self, testcase_id: int) -> Dict:
+    async def delete_testcase(self, testcase_id: int) -> Dict:
         """Delete a test case"""
-        return self._request("DELETE", f"/testcases/{testcase_id}")
+        return await self._request("DELETE", f"/testcases/{testcase_id}")
     
     # ==================== Test Tasks ====================
     
-    def list_testtasks(self, page: int = 1, limit: int = 20) -> Dict:
+    async def list_testtasks(self, page: int = 1, limit: int = 20) -> Dict:
         """Get list of test tasks"""
         params = {"page": page, "limit": limit}
-        return self._request("GET", "/testtasks", params=params)
+        return await self._request("GET", "/testtasks", params=params)
     
-    def get_testtask(self, testtask_id: int) -> Dict:
+    async def get_testtask(self, testtask_id: int) -> Dict:
         """Get test task details"""
-        return self._request("GET", f"/testtasks/{testtask_id}")
+        return await self._request("GET", f"/testtasks/{testtask_id}")
     
-    def get_project_testtasks(self, project_id: int) -> Dict:
+    async def get_project_testtasks(self, project_id: int) -> Dict:
         """Get test tasks for a project"""
-        return self._request("GET", f"/projects/{project_id}/testtasks")
+        return await self._request("GET", f"/projects/{project_id}/testtasks")
     
     # ==================== Product Plans ====================
     
-    def get_product_plans(self, product_id: int) -> Dict:
+    async def get_product_plans(self, product_id: int) -> Dict:
         """Get plans for a product"""
-        return self._request("GET", f"/products/{product_id}/plans")
+        return await self._request("GET", f"/products/{product_id}/plans")
     
-    def get_plan(self, plan_id: int) -> Dict:
+    async def get_plan(self, plan_id: int) -> Dict:
         """Get plan details"""
-        return self._request("GET", f"/productplans/{plan_id}")
+        return await self._request("GET", f"/productplans/{plan_id}")
     
     # ==================== Builds ====================
     
-    def get_project_builds(self, project_id: int) -> Dict:
+    async def get_project_builds(self, project_id: int) -> Dict:
         """Get builds for a project"""
-        return self._request("GET", f"/projects/{project_id}/builds")
+        return await self._request("GET", f"/projects/{project_id}/builds")
     
-    def get_execution_builds(self, execution_id: int) -> Dict:
+    async def get_execution_builds(self, execution_id: int) -> Dict:
         """Get builds for an execution"""
-        return self._request("GET", f"/executions/{execution_id}/builds")
+        return await self._request("GET", f"/executions/{execution_id}/builds")
     
-    def get_build(self, build_id: int) -> Dict:
+    async def get_build(self, build_id: int) -> Dict:
         """Get build details"""
-        return self._request("GET", f"/builds/{build_id}")
+        return await self._request("GET", f"/builds/{build_id}")
+    
+    # ==================== Paginated iterators ====================
+    
+    def iter_products(self, **kwargs) -> AsyncIterator[Dict]:
+        """Iterate over all products"""
+        return self._iter_pages("/products", "products", **kwargs)
+    
+    def iter_product_stories(self, product_id: int, **kwargs) -> AsyncIterator[Dict]:
+        """Iterate over all stories of a product"""
+        return self._iter_pages(f"/products/{product_id}/stories", "stories", **kwargs)
+    
+    def iter_product_bugs(self, product_id: int, **kwargs) -> AsyncIterator[Dict]:
+        """Iterate over all bugs of a product"""
+        return self._iter_pages(f"/products/{product_id}/bugs", "bugs", **kwargs)
+    
+    def iter_product_testcases(self, product_id: int, **kwargs) -> AsyncIterator[Dict]:
+        """Iterate over all test cases of a product"""
+        return self._iter_pages(f"/products/{product_id}/testcases", "testcases", **kwargs)
+    
+    def iter_projects(self, **kwargs) -> AsyncIterator[Dict]:
+        """Iterate over all projects"""
+        return self._iter_pages("/projects", "projects", **kwargs)
+    
+    def iter_project_executions(self, project_id: int, **kwargs) -> AsyncIterator[Dict]:
+        """Iterate over all executions of a project"""
+        return self._iter_pages(f"/projects/{project_id}/executions", "executions", **kwargs)
+    
+    def iter_project_stories(self, project_id: int, **kwargs) -> AsyncIterator[Dict]:
+        """Iterate over all stories of a project"""
+        return self._iter_pages(f"/projects/{project_id}/stories", "stories", **kwargs)
+    
+    def iter_executions(self, **kwargs) -> AsyncIterator[Dict]:
+        """Iterate over all executions"""
+        return self._iter_pages("/executions", "executions", **kwargs)
+    
+    def iter_execution_stories(self, execution_id: int, **kwargs) -> AsyncIterator[Dict]:
+        """Iterate over all stories of an execution"""
+        return self._iter_pages(f"/executions/{execution_id}/stories", "stories", **kwargs)
+    
+    def iter_execution_tasks(self, execution_id: int, **kwargs) -> AsyncIterator[Dict]:
+        """Iterate over all tasks of an execution"""
+        return self._iter_pages(f"/executions/{execution_id}/tasks", "tasks", **kwargs)
+    
+    def iter_users(self, **kwargs) -> AsyncIterator[Dict]:
+        """Iterate over all users"""
+        return self._iter_pages("/users", "users", **kwargs)
+    
+    def iter_testtasks(self, **kwargs) -> AsyncIterator[Dict]:
+        """Iterate over all test tasks"""
+        return self._iter_pages("/testtasks", "testtasks", **kwargs)
+    
+    # ==================== Batch reads ====================
+    
+    async def _get_many(
+        self,
+        getter: Callable[[int], Awaitable[Dict]],
+        key: str,
+        ids: List[int],
+        concurrency: Optional[int] = None
+    ) -> Dict:
+        """Fetch many entities by ID with bounded concurrency
+
+        Duplicate IDs are fetched once. Failures are reported per ID instead
+        of failing the whole batch.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        semaphore = asyncio.Semaphore(max(1, concurrency or self.config.batch_concurrency))
+        
+        async def fetch(entity_id: int) -> Any:
+            async with semaphore:
+                return await getter(entity_id)
+        
+        results = await asyncio.gather(*(fetch(i) for i in unique_ids), return_exceptions=True)
+        items, errors = [], []
+        for entity_id, result in zip(unique_ids, results):
+            if isinstance(result, BaseException):
+                errors.append({"id": entity_id, "error": str(result)})
+            else:
+                items.append(result)
+        return {"total": len(unique_ids), "found": len(items), key: items, "errors": errors}
+    
+    async def get_bugs(self, bug_ids: List[int], concurrency: Optional[int] = None) -> Dict:
+        """Get details of many bugs"""
+        return await self._get_many(self.get_bug, "bugs", bug_ids, concurrency)
+    
+    async def get_tasks(self, task_ids: List[int], concurrency: Optional[int] = None) -> Dict:
+        """Get details of many tasks"""
+        return await self._get_many(self.get_task, "tasks", task_ids, concurrency)
+    
+    async def get_stories(self, story_ids: List[int], concurrency: Optional[int] = None) -> Dict:
+        """Get details of many stories"""
+        return await self._get_many(self.get_story, "stories", story_ids, concurrency)
+    
+    async def get_testcases(self, testcase_ids: List[int], concurrency: Optional[int] = None) -> Dict:
+        """Get details of many test cases"""
+        return await self._get_many(self.get_testcase, "testcases", testcase_ids, concurrency)
+    
+    # ==================== Batch writes ====================
+    
+    async def _submit_many(
+        self,
+        submit: Callable[[Dict], Awaitable[Any]],
+        items: List[Dict],
+        concurrency: Optional[int] = None
+    ) -> Dict:
+        """Submit many writes concurrently and report the outcome per item
+
+        ``retry`` lists exactly the input items that failed, so a caller can
+        resend those without repeating the ones that succeeded.
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency or self.config.write_batch_concurrency))
+        
+        async def run(item: Dict) -> Any:
+            async with semaphore:
+                return await submit(item)
+        
+        outcomes = await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
+        results, retry = [], []
+        for index, (item, outcome) in enumerate(zip(items, outcomes)):
+            if isinstance(outcome, BaseException):
+                results.append({"index": index, "id": item.get("id"), "status": "failed", "error": str(outcome)})
+                retry.append(item)
+            else:
+                entity_id = outcome.get("id") if isinstance(outcome, dict) else None
+                results.append({"index": index, "id": entity_id or item.get("id"), "status": "ok"})
+        return {
+            "total": len(items),
+            "succeeded": len(items) - len(retry),
+            "failed": len(retry),
+            "results": results,
+            "retry": retry,
+        }
+    
+    @staticmethod
+    def _split_id(item: Dict) -> tuple:
+        data = dict(item)
+        if "id" not in data:
+            raise ValueError("each item requires an 'id'")
+        return data.pop("id"), data
+    
+    async def batch_create_tasks(self, execution_id: int, items: List[Dict], concurrency: Optional[int] = None) -> Dict:
+        """Create many tasks in an execution"""
+        return await self._submit_many(lambda item: self.create_task(execution_id, item), items, concurrency)
+    
+    async def batch_update_tasks(self, items: List[Dict], concurrency: Optional[int] = None) -> Dict:
+        """Update many tasks; each item carries the task ``id`` plus the fields to change"""
+        return await self._submit_many(lambda item: self.update_task(*self._split_id(item)), items, concurrency)
+    
+    async def batch_update_bugs(self, items: List[Dict], concurrency: Optional[int] = None) -> Dict:
+        """Update many bugs; each item carries the bug ``id`` plus the fields to change"""
+        return await self._submit_many(lambda item: self.update_bug(*self._split_id(item)), items, concurrency)
+    
+    async def batch_create_testcases(self, product_id: int, items: List[Dict], concurrency: Optional[int] = None) -> Dict:
+        """Create many test cases in a product"""
+        return await self._submit_many(lambda item: self.create_testcase(product_id, item), items, concurrency)
+    
+    # ==================== Aggregations ====================
+    
+    async def bug_stats(
+        self,
+        product_id: int,
+        group_by: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Dict:
+        """Count a product's bugs per group, streaming every page once
+
+        Pages bypass the response cache, so memory stays flat and a scan
+        does not evict entries other calls rely on.
+        """
+        result = await aggregate(self.iter_product_bugs(product_id, cached=False), group_by or ["status"], filters)
+        return {"product_id": product_id, **result}
+    
+    async def task_stats(
+        self,
+        execution_id: int,
+        group_by: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Dict:
+        """Count an execution's tasks and sum their hours per group, streaming every page once"""
+        result = await aggregate(
+            self.iter_execution_tasks(execution_id, cached=False), group_by or ["status"], filters, TASK_SUM_FIELDS
+        )
+        return {"execution_id": execution_id, **result}
+    
+    async def execution_report(self, execution_id: int, today: Optional[str] = None) -> Dict:
+        """Progress report of an execution: totals, per-assignee load, overdue tasks and burndown
+
+        Reports are cached per execution and day, and evicted when one of
+        the execution's tasks is changed through this client.
+        """
+        day = date.fromisoformat(today) if today else date.today()
+        key = self.report_cache.make_key("REPORT", f"/executions/{execution_id}/tasks", {"today": day.isoformat()})
+        hit, report = self.report_cache.get(key)
+        if hit:
+            return report
+        writes = self.writes
+        execution, tasks = await asyncio.gather(
+            self.get_execution(execution_id),
+            self._collect(self.iter_execution_tasks(execution_id, cached=False))
+        )
+        report = build_report(execution or {}, tasks, day)
+        # A task written while we were fetching may not be reflected; don't cache that
+        if self.writes == writes:
+            self.report_cache.set(key, report)
+        return report
+    
+    # ==================== Change feeds ====================
+    
+    async def changes_since(self, source: str, entity_id: int, cursor: Optional[str] = None) -> Dict:
+        """Records of a list created, edited or closed since ``cursor``, plus the next cursor
+
+        Without a cursor the list is fingerprinted once and the first cursor
+        is returned with no changes.
+        """
+        if self.change_tracker is None:
+            store = await asyncio.to_thread(
+                ChangeStore,
+                self.config.changes_path or default_changes_path(self.config.base_url, self.config.username)
+            )
+            if self.change_tracker is None:
+                self.change_tracker = ChangeTracker(self, store)
+            else:
+                # Another call opened the store while this one waited
+                await asyncio.to_thread(store.close)
+        return await self.change_tracker.changes_since(source, entity_id, cursor)
+    
+    # ==================== Export ====================
+    
+    async def export(
+        self,
+        source: str,
+        entity_id: Optional[int] = None,
+        format: str = "xlsx",
+        columns: Optional[List[str]] = None,
+        filename: Optional[str] = None,
+        overwrite: bool = False
+    ) -> Dict:
+        """Stream every record of a list endpoint into an XLSX, CSV or JSONL file
+
+        Pages bypass the response cache so memory stays flat however many
+        rows are exported. An existing file is only replaced with
+        ``overwrite``. Returns the file path and a summary.
+        """
+        if source not in EXPORT_SOURCES:
+            raise ValueError(f"Unknown export source: {source!r}")
+        method, scoped, kind = EXPORT_SOURCES[source]
+        if scoped and entity_id is None:
+            raise ValueError(f"Export source {source!r} requires an id")
+        if columns is None and format != "jsonl":
+            columns = list(EXPORT_COLUMNS.get(kind, ())) or None
+        path = output_path(
+            self.config.export_dir or default_export_dir(), source, entity_id if scoped else None, format, filename
+        )
+        iterate = getattr(self, method)
+        records = iterate(entity_id, cached=False) if scoped else iterate(cached=False)
+        summary = await export_records(records, path, format, columns, overwrite)
+        return {"source": source, "id": entity_id if scoped else None, **summary}
+    
+    @staticmethod
+    async def _collect(records: AsyncIterator[Dict]) -> List[Dict]:
+        return [record async for record in records]
+
+
+class ZentaoClient:
+    """Synchronous client for Zentao API
+
+    Thin wrapper around :class:`AsyncZentaoClient`: every endpoint coroutine is
+    exposed as a blocking method that runs on a private event loop thread, and
+    every ``iter_*`` async iterator as a plain generator.
+    """
+    
+    def __init__(
+        self,
+        config: Optional[ZentaoConfig] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        self._async = AsyncZentaoClient(config, transport=transport)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    @property
+    def config(self) -> ZentaoConfig:
+        return self._async.config
+    
+    @property
+    def base_path(self) -> str:
+        return self._async.base_path
+    
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop on first use"""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="zentao-client-loop",
+                    daemon=True
+                )
+                self._thread.start()
+            return self._loop
+    
+    def _run(self, coro) -> Any:
+        """Run a coroutine on the background loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, self._get_loop()).result()
+    
+    def close(self):
+        """Close the connection pool and stop the background loop"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._async.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+    
+    def __enter__(self) -> "ZentaoClient":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def __getattr__(self, name: str) -> Any:
+        if name == "_async":
+            raise AttributeError(name)
+        attr = getattr(self._async, name)
+        if name.startswith("iter_") and callable(attr):
+            def iterate(*args, **kwargs):
+                agen = attr(*args, **kwargs)
+                try:
+                    while True:
+                        try:
+                            yield self._run(agen.__anext__())
+                        except StopAsyncIteration:
+                            return
+                finally:
+                    self._run(agen.aclose())
+            
+            iterate.__name__ = name
+            iterate.__doc__ = attr.__doc__
+            return iterate
+        if not inspect.iscoroutinefunction(attr):
+            return attr
+        
+        def call(*args, **kwargs):
+            return self._run(attr(*args, **kwargs))
+        
+        call.__name__ = name
+        call.__doc__ = attr.__doc__
+        return call
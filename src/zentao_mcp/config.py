@@ -1,11 +1,57 @@
 """Configuration management for Zentao MCP"""
 import os
-from dataclasses import dataclass
-from typing import Optional
-from dotenv import load_dotenv
+from dataclasses import dataclass, field
+from typing import Optional, Dict
 
-# Load .env file when module is imported
-load_dotenv()
+_dotenv_loaded = False
+
+
+def load_env():
+    """Load the .env file into the environment, once per process"""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _dotenv_loaded = True
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer environment variable, falling back to default"""
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def _env_limit(name: str, default: int) -> int:
+    """Read a concurrency limit, which must be at least 1"""
+    value = _env_int(name, default)
+    if value < 1:
+        raise ValueError(f"{name} must be at least 1, got {value}")
+    return value
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float environment variable, falling back to default"""
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+def _env_bool(name: str, default: bool = False) -> bool:
+    """Read a boolean environment variable (1/true/yes/on)"""
+    value = os.getenv(name)
+    if not value:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_float_map(name: str) -> Dict[str, float]:
+    """Read a ``key=value,key=value`` environment variable into a dict"""
+    result = {}
+    for item in os.getenv(name, "").split(","):
+        if "=" in item:
+            key, value = item.split("=", 1)
+            result[key.strip()] = float(value)
+    return result
 
 
 @dataclass
@@ -14,14 +60,114 @@ class ZentaoConfig:
     base_url: str
     username: str
     password: str
+    # Expected token lifetime; refreshed in the background this many seconds early
+    token_ttl: float = 1440.0
+    token_refresh_margin: float = 120.0
+    # On-disk token cache shared across processes (opt-in)
+    token_cache: bool = False
+    token_cache_path: str = ""
+    # HTTP connection pool
+    pool_size: int = 10
+    max_connections_per_host: int = 20
+    keepalive_expiry: float = 30.0
+    compression: bool = True
+    # Timeouts, retries and circuit breaker
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    max_retries: int = 3
+    retry_backoff: float = 0.5
+    retry_backoff_max: float = 8.0
+    breaker_threshold: int = 5
+    breaker_cooldown: float = 30.0
+    # Compact (unindented) JSON tool output
+    compact_output: bool = False
+    # Tool execution limits
+    max_concurrency: int = 16
+    read_concurrency: int = 8
+    write_concurrency: int = 2
+    # GET response cache (opt-in)
+    cache_enabled: bool = False
+    cache_max_entries: int = 1024
+    cache_ttl: float = 60.0
+    cache_ttls: Dict[str, float] = field(default_factory=dict)
+    # Identical GETs in flight at the same time share one HTTP call
+    coalesce_requests: bool = True
+    # Auto-pagination for iter_* methods
+    page_size: int = 100
+    page_concurrency: int = 4
+    # Batch get and bulk write tools
+    batch_concurrency: int = 8
+    write_batch_concurrency: int = 4
+    # Local SQLite replica (opt-in)
+    replica_enabled: bool = False
+    replica_path: str = ""
+    replica_max_age: float = 300.0
+    replica_auto_sync: bool = True
+    # Local full-text search index (opt-in)
+    search_enabled: bool = False
+    search_path: str = ""
+    # Directory export files are written to (default: ~/.cache/zentao_mcp/exports)
+    export_dir: str = ""
+    # Fingerprint store behind changes_since (default: ~/.cache/zentao_mcp/changes-<instance>.sqlite3)
+    changes_path: str = ""
+    # zentao:// resources: snapshot lifetime and change polling interval for subscriptions (seconds)
+    resource_ttl: float = 30.0
+    resource_poll_interval: float = 60.0
+    # Per-account clients for HTTP sessions sending Basic credentials: live maximum and idle lifetime (seconds)
+    pool_max_clients: int = 200
+    pool_idle_timeout: float = 900.0
+    # Let HTTP sessions without credentials act as the account above
+    allow_anonymous: bool = False
     
     @classmethod
     def from_env(cls) -> "ZentaoConfig":
         """Load configuration from environment variables"""
+        load_env()
         return cls(
             base_url=os.getenv("ZENTAO_BASE_URL", ""),
             username=os.getenv("ZENTAO_USERNAME", ""),
             password=os.getenv("ZENTAO_PASSWORD", ""),
+            token_ttl=_env_float("ZENTAO_TOKEN_TTL", 1440.0),
+            token_refresh_margin=_env_float("ZENTAO_TOKEN_REFRESH_MARGIN", 120.0),
+            token_cache=_env_bool("ZENTAO_TOKEN_CACHE"),
+            token_cache_path=os.getenv("ZENTAO_TOKEN_CACHE_PATH", ""),
+            pool_size=_env_int("ZENTAO_POOL_SIZE", 10),
+            max_connections_per_host=_env_int("ZENTAO_MAX_CONNECTIONS_PER_HOST", 20),
+            keepalive_expiry=_env_float("ZENTAO_KEEPALIVE_EXPIRY", 30.0),
+            compression=_env_bool("ZENTAO_COMPRESSION", True),
+            connect_timeout=_env_float("ZENTAO_CONNECT_TIMEOUT", 5.0),
+            read_timeout=_env_float("ZENTAO_READ_TIMEOUT", 30.0),
+            max_retries=_env_int("ZENTAO_MAX_RETRIES", 3),
+            retry_backoff=_env_float("ZENTAO_RETRY_BACKOFF", 0.5),
+            retry_backoff_max=_env_float("ZENTAO_RETRY_BACKOFF_MAX", 8.0),
+            breaker_threshold=_env_int("ZENTAO_BREAKER_THRESHOLD", 5),
+            breaker_cooldown=_env_float("ZENTAO_BREAKER_COOLDOWN", 30.0),
+            compact_output=_env_bool("ZENTAO_COMPACT_OUTPUT"),
+            max_concurrency=_env_limit("ZENTAO_MAX_CONCURRENCY", 16),
+            read_concurrency=_env_limit("ZENTAO_READ_CONCURRENCY", 8),
+            write_concurrency=_env_limit("ZENTAO_WRITE_CONCURRENCY", 2),
+            cache_enabled=_env_bool("ZENTAO_CACHE_ENABLED"),
+            cache_max_entries=_env_int("ZENTAO_CACHE_MAX_ENTRIES", 1024),
+            cache_ttl=_env_float("ZENTAO_CACHE_TTL", 60.0),
+            cache_ttls=_env_float_map("ZENTAO_CACHE_TTLS"),
+            coalesce_requests=_env_bool("ZENTAO_COALESCE_REQUESTS", True),
+            page_size=_env_int("ZENTAO_PAGE_SIZE", 100),
+            page_concurrency=_env_limit("ZENTAO_PAGE_CONCURRENCY", 4),
+            batch_concurrency=_env_limit("ZENTAO_BATCH_CONCURRENCY", 8),
+            write_batch_concurrency=_env_limit("ZENTAO_WRITE_BATCH_CONCURRENCY", 4),
+            replica_enabled=_env_bool("ZENTAO_REPLICA"),
+            replica_path=os.getenv("ZENTAO_REPLICA_PATH", ""),
+            replica_max_age=_env_float("ZENTAO_REPLICA_MAX_AGE", 300.0),
+            replica_auto_sync=_env_bool("ZENTAO_REPLICA_AUTO_SYNC", True),
+            search_enabled=_env_bool("ZENTAO_SEARCH"),
+            search_path=os.getenv("ZENTAO_SEARCH_PATH", ""),
+            export_dir=os.getenv("ZENTAO_EXPORT_DIR", ""),
+            changes_path=os.getenv("ZENTAO_CHANGES_PATH", ""),
+            resource_ttl=_env_float("ZENTAO_RESOURCE_TTL", 30.0),
+            resource_poll_interval=_env_float("ZENTAO_RESOURCE_POLL_INTERVAL", 60.0),
+            pool_max_clients=_env_int("ZENTAO_POOL_MAX_CLIENTS", 200),
+            pool_idle_timeout=_env_float("ZENTAO_POOL_IDLE_TIMEOUT", 900.0),
+            allow_anonymous=_env_bool("ZENTAO_ALLOW_ANONYMOUS"),
         )
     
     def is_valid(self) -> bool:
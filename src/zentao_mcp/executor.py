@@ -0,0 +1,110 @@
+"""Bounded execution of tool calls"""
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Callable, Awaitable
+
+from .config import ZentaoConfig
+
+READ = "read"
+WRITE = "write"
+
+WRITE_PREFIXES = ("create_", "update_", "delete_", "change_", "batch_create_", "batch_update_")
+
+
+def tool_category(name: str) -> str:
+    """Classify a tool as a read or a write (create/update/delete)"""
+    return WRITE if name.startswith(WRITE_PREFIXES) else READ
+
+
+@dataclass
+class CategoryStats:
+    """Counters for one concurrency category"""
+    limit: int
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    queued: int = 0
+    completed: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        started = self.completed + self.in_flight
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "queued": self.queued,
+            "completed": self.completed,
+            "saturation": round(self.in_flight / self.limit, 3),
+            "avg_wait_ms": round(self.total_wait / started * 1000, 3) if started else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 3),
+        }
+
+
+class ToolExecutor:
+    """Run tool calls under a global cap and per-category limits
+
+    Tool calls are coroutines awaited on the event loop; stores that do
+    blocking SQLite work run it on their own worker threads.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        category_limits: Optional[Dict[str, int]] = None
+    ):
+        self.category_limits = category_limits or {READ: 8, WRITE: 2}
+        self._global = asyncio.Semaphore(max_concurrency)
+        self._global_stats = CategoryStats(limit=max_concurrency)
+        self._semaphores = {
+            category: asyncio.Semaphore(limit)
+            for category, limit in self.category_limits.items()
+        }
+        self._stats = {
+            category: CategoryStats(limit=limit)
+            for category, limit in self.category_limits.items()
+        }
+
+    @classmethod
+    def from_config(cls, config: ZentaoConfig) -> "ToolExecutor":
+        return cls(
+            max_concurrency=config.max_concurrency,
+            category_limits={READ: config.read_concurrency, WRITE: config.write_concurrency},
+        )
+
+    async def run(self, category: str, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """Run func once both its category slot and a global slot are free"""
+        stats = self._stats[category]
+        waiting = True
+        stats.queued += 1
+        self._global_stats.queued += 1
+        start = time.perf_counter()
+        try:
+            # Take the category slot first so a backlog of writes never holds global slots
+            async with self._semaphores[category], self._global:
+                wait = time.perf_counter() - start
+                waiting = False
+                for s in (stats, self._global_stats):
+                    s.queued -= 1
+                    s.in_flight += 1
+                    s.peak_in_flight = max(s.peak_in_flight, s.in_flight)
+                    s.total_wait += wait
+                    s.max_wait = max(s.max_wait, wait)
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    for s in (stats, self._global_stats):
+                        s.in_flight -= 1
+                        s.completed += 1
+        finally:
+            if waiting:
+                stats.queued -= 1
+                self._global_stats.queued -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Saturation and queue wait statistics for sizing the limits"""
+        return {
+            "global": self._global_stats.snapshot(),
+            "categories": {category: s.snapshot() for category, s in self._stats.items()},
+        }
@@ -0,0 +1,247 @@
+"""Streaming export of paginated Zentao lists to XLSX, CSV or JSONL files"""
+import asyncio
+import csv
+import os
+import re
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from typing import Optional, Dict, Any, List, AsyncIterator, Tuple
+
+from . import jsonlib
+from .aggregate import field_value
+
+FORMATS = ("xlsx", "csv", "jsonl")
+# Source name -> (client iterator, whether it takes a parent ID, record kind)
+SOURCES: Dict[str, Tuple[str, bool, str]] = {
+    "product_bugs": ("iter_product_bugs", True, "bugs"),
+    "product_testcases": ("iter_product_testcases", True, "testcases"),
+    "product_stories": ("iter_product_stories", True, "stories"),
+    "project_stories": ("iter_project_stories", True, "stories"),
+    "project_executions": ("iter_project_executions", True, "executions"),
+    "execution_tasks": ("iter_execution_tasks", True, "tasks"),
+    "execution_stories": ("iter_execution_stories", True, "stories"),
+    "products": ("iter_products", False, "products"),
+    "projects": ("iter_projects", False, "projects"),
+    "executions": ("iter_executions", False, "executions"),
+    "users": ("iter_users", False, "users"),
+    "testtasks": ("iter_testtasks", False, "testtasks"),
+}
+# Columns written when none are requested
+DEFAULT_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "bugs": ("id", "title", "status", "severity", "pri", "type", "module", "assignedTo", "openedBy",
+             "openedDate", "resolution", "resolvedBy", "resolvedDate"),
+    "testcases": ("id", "title", "module", "type", "pri", "status", "stage", "lastRunResult", "openedBy", "openedDate"),
+    "stories": ("id", "title", "module", "pri", "stage", "status", "estimate", "assignedTo", "openedBy", "openedDate"),
+    "tasks": ("id", "name", "type", "pri", "status", "assignedTo", "estimate", "consumed", "left", "deadline",
+              "finishedBy", "finishedDate"),
+    "executions": ("id", "name", "project", "type", "status", "begin", "end", "PM", "progress"),
+    "projects": ("id", "name", "code", "model", "status", "begin", "end", "PM", "progress"),
+    "products": ("id", "name", "code", "type", "status", "PO", "QD", "RD", "createdDate"),
+    "users": ("id", "account", "realname", "role", "dept", "email"),
+    "testtasks": ("id", "name", "product", "build", "status", "owner", "begin", "end"),
+}
+# Rows handed to the writer thread at a time
+BATCH_SIZE = 500
+# Excel's limit on characters per cell
+MAX_CELL_LENGTH = 32767
+# Leading characters that make spreadsheet apps evaluate a cell as a formula
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+_SAFE_NAME = re.compile(r"^[\w.\-]+$")
+
+
+def default_dir() -> str:
+    return os.path.join(os.path.expanduser("~"), ".cache", "zentao_mcp", "exports")
+
+
+def cell_value(record: Dict[str, Any], column: str) -> Any:
+    """Flat value of a (dotted) column: embedded users become accounts, lists are joined"""
+    *parents, last = column.split(".")
+    for part in parents:
+        record = record.get(part) if isinstance(record, dict) else None
+    if not isinstance(record, dict):
+        return None
+    value = field_value(record, last)
+    if isinstance(value, list):
+        return ", ".join(str(field_value({"v": item}, "v")) for item in value)
+    return value
+
+
+# ==================== Writers ====================
+
+class CsvWriter:
+    """CSV with a BOM so Excel detects UTF-8"""
+
+    def __init__(self, path: str, columns: List[str]):
+        self.columns = columns
+        self._file = open(path, "w", encoding="utf-8-sig", newline="")
+        self._csv = csv.writer(self._file)
+        self._csv.writerow([self._cell(column) for column in columns])
+
+    def write(self, records: List[Dict[str, Any]]):
+        self._csv.writerows([self._cell(cell_value(record, column)) for column in self.columns] for record in records)
+
+    @staticmethod
+    def _cell(value: Any) -> Any:
+        # Zentao text like "=HYPERLINK(...)" must open as text, not as a formula
+        if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+            return "'" + value
+        return value
+
+    def close(self):
+        self._file.close()
+
+
+class JsonlWriter:
+    """One JSON object per line; whole records unless columns were requested"""
+
+    def __init__(self, path: str, columns: Optional[List[str]]):
+        self.columns = columns
+        self._file = open(path, "wb")
+
+    def write(self, records: List[Dict[str, Any]]):
+        if self.columns:
+            records = [{column: cell_value(record, column) for column in self.columns} for record in records]
+        self._file.write(b"".join(jsonlib.dumps_bytes(record) + b"\n" for record in records))
+
+    def close(self):
+        self._file.close()
+
+
+class XlsxWriter:
+    """openpyxl write-only workbook: rows are streamed to disk as they are appended"""
+
+    def __init__(self, path: str, columns: List[str]):
+        # Imported here so openpyxl only loads when an XLSX export runs
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+        self.columns = columns
+        self._text_cell = WriteOnlyCell
+        self._path = path
+        self._illegal = ILLEGAL_CHARACTERS_RE
+        self._workbook = Workbook(write_only=True)
+        self._sheet = self._workbook.create_sheet("export")
+        self._sheet.freeze_panes = "A2"
+        self._sheet.append([self._cell(column) for column in columns])
+
+    def _cell(self, value: Any) -> Any:
+        if isinstance(value, str):
+            value = self._illegal.sub("", value)[:MAX_CELL_LENGTH]
+            if value.startswith(FORMULA_PREFIXES):
+                # openpyxl would store "=..." as a live formula; force a string cell
+                cell = self._text_cell(self._sheet, value=value)
+                cell.data_type = "s"
+                return cell
+            return value
+        if value is None or isinstance(value, (int, float)):
+            return value
+        return str(value)
+
+    def write(self, records: List[Dict[str, Any]]):
+        for record in records:
+            self._sheet.append([self._cell(cell_value(record, column)) for column in self.columns])
+
+    def close(self):
+        self._workbook.save(self._path)
+
+
+# ==================== Export ====================
+
+def output_path(directory: str, source: str, entity_id: Optional[int], fmt: str, filename: Optional[str]) -> str:
+    """File path inside the export directory; caller-chosen names may not leave it"""
+    if filename:
+        if not _SAFE_NAME.match(filename) or filename.startswith("."):
+            raise ValueError(f"Invalid export filename: {filename!r}")
+        name = filename if filename.endswith(f".{fmt}") else f"{filename}.{fmt}"
+    else:
+        scope = f"-{entity_id}" if entity_id is not None else ""
+        # The random suffix keeps concurrent exports of one source apart
+        name = f"{source}{scope}-{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:8]}.{fmt}"
+    return os.path.join(directory, name)
+
+
+async def export_records(
+    records: AsyncIterator[Dict[str, Any]],
+    path: str,
+    fmt: str,
+    columns: Optional[List[str]],
+    overwrite: bool = False
+) -> Dict[str, Any]:
+    """Stream records into a file and return a summary
+
+    Records are handed to the writer in batches of ``BATCH_SIZE`` on a
+    worker thread, so the event loop keeps serving other calls and memory
+    holds one batch plus one page regardless of how many rows there are.
+    The file is written under a unique temporary name and renamed when
+    complete. An existing file at path is only replaced with ``overwrite``;
+    otherwise the name is claimed up front so concurrent exports never
+    write over each other.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format: {fmt!r} (expected one of {', '.join(FORMATS)})")
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    if not overwrite:
+        try:
+            os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+        except FileExistsError:
+            raise ValueError(f"Export file already exists: {os.path.basename(path)} (pass overwrite to replace it)")
+    fd, partial = tempfile.mkstemp(dir=directory, prefix=".export-", suffix=".part")
+    os.close(fd)
+    started = time.monotonic()
+    rows = 0
+    by_status: Dict[Any, int] = {}
+    writer = None
+    done = False
+    try:
+        batch: List[Dict[str, Any]] = []
+        async for record in records:
+            if writer is None:
+                if columns is None and fmt != "jsonl":
+                    # Spreadsheets need a header: default to the first record's fields
+                    columns = list(record)
+                writer = await asyncio.to_thread(_open_writer, fmt, partial, columns)
+            batch.append(record)
+            rows += 1
+            status = record.get("status")
+            if status is not None:
+                by_status[status] = by_status.get(status, 0) + 1
+            if len(batch) >= BATCH_SIZE:
+                await asyncio.to_thread(writer.write, batch)
+                batch = []
+        if writer is None:
+            if columns is None and fmt != "jsonl":
+                columns = ["id"]
+            writer = await asyncio.to_thread(_open_writer, fmt, partial, columns)
+        if batch:
+            await asyncio.to_thread(writer.write, batch)
+        await asyncio.to_thread(writer.close)
+        writer = None
+        os.replace(partial, path)
+        done = True
+    finally:
+        if writer is not None:
+            await asyncio.to_thread(writer.close)
+        if os.path.exists(partial):
+            os.remove(partial)
+        if not done and not overwrite and os.path.exists(path):
+            os.remove(path)  # Release the claimed name
+    return {
+        "path": os.path.abspath(path),
+        "format": fmt,
+        "rows": rows,
+        "columns": columns,
+        "by_status": by_status,
+        "bytes": os.path.getsize(path),
+        "seconds": round(time.monotonic() - started, 3),
+    }
+
+
+def _open_writer(fmt: str, path: str, columns: Optional[List[str]]):
+    if fmt == "csv":
+        return CsvWriter(path, columns)
+    if fmt == "jsonl":
+        return JsonlWriter(path, columns)
+    return XlsxWriter(path, columns)
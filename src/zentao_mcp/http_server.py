@@ -0,0 +1,61 @@
+"""Streamable HTTP and SSE transports: many MCP sessions served by one process
+
+Every session runs on the same :data:`zentao_mcp.server.server` and therefore
+shares its client (connection pool, response cache, token), tool executor and
+resource snapshots. Streamable HTTP is served at ``/mcp``; the older SSE
+transport at ``/sse`` with messages posted to ``/messages/``.
+"""
+import contextlib
+import logging
+from typing import AsyncIterator
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+from mcp.server.sse import SseServerTransport
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+
+from . import server as mcp_server
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+
+
+def create_app(json_response: bool = False) -> FastAPI:
+    """ASGI app serving the MCP server over Streamable HTTP and SSE"""
+    server = mcp_server.server
+    session_manager = StreamableHTTPSessionManager(app=server, json_response=json_response)
+    sse = SseServerTransport("/messages/")
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        async with session_manager.run():
+            logger.info("Zentao MCP HTTP transport ready")
+            try:
+                yield
+            finally:
+                await mcp_server.shutdown()
+
+    app = FastAPI(title="Zentao MCP Server", lifespan=lifespan, docs_url=None, redoc_url=None, openapi_url=None)
+
+    @app.get("/healthz")
+    async def healthz() -> JSONResponse:
+        return JSONResponse({"status": "ok"})
+
+    @app.get("/sse")
+    async def handle_sse(request: Request) -> Response:
+        async with sse.connect_sse(request.scope, request.receive, request._send) as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, server.create_initialization_options())
+        return Response()
+
+    app.mount("/messages/", app=sse.handle_post_message)
+    app.mount("/mcp", app=session_manager.handle_request)
+    return app
+
+
+def main(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, json_response: bool = False):
+    """Serve over HTTP until interrupted"""
+    import uvicorn
+
+    uvicorn.run(create_app(json_response), host=host, port=port, log_level="info")
@@ -0,0 +1,45 @@
+"""JSON encoding and decoding, using orjson when it is installed"""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # stdlib only
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON straight from response bytes, without building a str first"""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects a UTF-8 BOM and non-UTF-8 input that the stdlib still accepts
+            pass
+    return json.loads(data)
+
+
+def dumps(obj: Any, compact: bool = False) -> str:
+    """Encode obj as text, indented by 2 unless compact; non-ASCII is kept as is"""
+    if orjson is not None:
+        try:
+            option = orjson.OPT_NON_STR_KEYS | (0 if compact else orjson.OPT_INDENT_2)
+            return orjson.dumps(obj, option=option).decode("utf-8")
+        except TypeError:
+            # Integers beyond 64 bits and other types orjson does not handle
+            pass
+    if compact:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Encode obj as compact UTF-8 bytes for a request body"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -1,20 +1,33 @@
 """Pydantic models for Zentao API data"""
 from typing import List, Optional, Any, Dict
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, model_validator
 from datetime import datetime
 
 
 # ==================== Common Models ====================
 
-class User(BaseModel):
+class ZentaoModel(BaseModel):
+    """Base model; fields Zentao returns beyond the declared ones are kept as extras"""
+    model_config = ConfigDict(extra="allow")
+
+
+class User(ZentaoModel):
     """User model"""
-    id: int
+    id: Optional[int] = None
     account: str
     avatar: Optional[str] = None
     realname: Optional[str] = None
 
+    @model_validator(mode="before")
+    @classmethod
+    def _from_account(cls, data: Any) -> Any:
+        # Some endpoints embed users as a bare account string
+        if isinstance(data, str):
+            return {"account": data}
+        return data
 
-class PageInfo(BaseModel):
+
+class PageInfo(ZentaoModel):
     """Pagination info"""
     page: int
     total: int
@@ -23,7 +36,7 @@ class PageInfo(BaseModel):
 
 # ==================== Program Models ====================
 
-class Program(BaseModel):
+class Program(ZentaoModel):
     """Program (项目集) model"""
     id: int
     name: str
@@ -39,14 +52,14 @@ class Program(BaseModel):
     progress: Optional[int] = None
 
 
-class ProgramList(BaseModel):
+class ProgramList(ZentaoModel):
     """Program list response"""
     programs: List[Program]
 
 
 # ==================== Product Models ====================
 
-class Product(BaseModel):
+class Product(ZentaoModel):
     """Product model"""
     id: int
     name: str
@@ -64,7 +77,7 @@ class Product(BaseModel):
     createdDate: Optional[str] = None
 
 
-class ProductList(BaseModel):
+class ProductList(ZentaoModel):
     """Product list response"""
     total: int
     products: List[Product]
@@ -72,7 +85,7 @@ class ProductList(BaseModel):
 
 # ==================== Project Models ====================
 
-class Project(BaseModel):
+class Project(ZentaoModel):
     """Project model"""
     id: int
     name: str
@@ -92,7 +105,7 @@ class Project(BaseModel):
     openedDate: Optional[str] = None
 
 
-class ProjectList(BaseModel):
+class ProjectList(ZentaoModel):
     """Project list response"""
     page: int
     total: int
@@ -102,7 +115,7 @@ class ProjectList(BaseModel):
 
 # ==================== Execution Models ====================
 
-class Execution(BaseModel):
+class Execution(ZentaoModel):
     """Execution (迭代/执行) model"""
     id: int
     name: str
@@ -118,7 +131,7 @@ class Execution(BaseModel):
     openedDate: Optional[str] = None
 
 
-class ExecutionList(BaseModel):
+class ExecutionList(ZentaoModel):
     """Execution list response"""
     page: int
     total: int
@@ -128,7 +141,7 @@ class ExecutionList(BaseModel):
 
 # ==================== Story Models ====================
 
-class Story(BaseModel):
+class Story(ZentaoModel):
     """Story (需求) model"""
     id: int
     title: str
@@ -147,7 +160,7 @@ class Story(BaseModel):
     openedDate: Optional[str] = None
 
 
-class StoryList(BaseModel):
+class StoryList(ZentaoModel):
     """Story list response"""
     page: int
     total: int
@@ -157,7 +170,7 @@ class StoryList(BaseModel):
 
 # ==================== Task Models ====================
 
-class Task(BaseModel):
+class Task(ZentaoModel):
     """Task model"""
     id: int
     name: str
@@ -178,7 +191,7 @@ class Task(BaseModel):
     assignedTo: Optional[User] = None
 
 
-class TaskList(BaseModel):
+class TaskList(ZentaoModel):
     """Task list response"""
     page: int
     total: int
@@ -188,7 +201,7 @@ class TaskList(BaseModel):
 
 # ==================== Bug Models ====================
 
-class Bug(BaseModel):
+class Bug(ZentaoModel):
     """Bug model"""
     id: int
     title: str
@@ -197,15 +210,17 @@ class Bug(BaseModel):
     project: Optional[int] = None
     execution: Optional[int] = None
     severity: Optional[int] = None
+    pri: Optional[int] = None
     priority: Optional[int] = None
     status: Optional[str] = None  # active, resolved, closed
     confirmed: Optional[int] = None
     steps: Optional[str] = None
     openedBy: Optional[User] = None
     openedDate: Optional[str] = None
+    assignedTo: Optional[User] = None
 
 
-class BugList(BaseModel):
+class BugList(ZentaoModel):
     """Bug list response"""
     page: int
     total: int
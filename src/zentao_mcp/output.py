@@ -0,0 +1,61 @@
+"""Shaping and serialization of tool results"""
+from typing import Optional, Dict, Any, List
+
+from . import jsonlib
+
+# Keys of result envelopes that hold diagnostics rather than records
+_UNPROJECTED_KEYS = frozenset({"errors"})
+
+
+def _project_record(record: Dict[str, Any], paths: List[List[str]]) -> Dict[str, Any]:
+    """Keep only the given dotted field paths of one record"""
+    projected: Dict[str, Any] = {}
+    for path in paths:
+        value: Any = record
+        for part in path:
+            if not isinstance(value, dict) or part not in value:
+                break
+            value = value[part]
+        else:
+            target = projected
+            for part in path[:-1]:
+                target = target.setdefault(part, {})
+            target[path[-1]] = value
+    return projected
+
+
+def _is_record_list(value: Any) -> bool:
+    return isinstance(value, list) and bool(value) and all(isinstance(item, dict) for item in value)
+
+
+def project(result: Any, fields: Optional[List[str]]) -> Any:
+    """Project a Zentao result onto fields, e.g. ``["id", "assignedTo.account"]``
+
+    A single entity (a dict with an ``id``) is projected directly. For list
+    envelopes such as ``{"page": 1, "total": 42, "bugs": [...]}`` every record
+    list is projected while pagination metadata is kept.
+    """
+    if not fields or result is None:
+        return result
+    paths = [field.split(".") for field in fields]
+    if isinstance(result, list):
+        return [_project_record(item, paths) if isinstance(item, dict) else item for item in result]
+    if not isinstance(result, dict):
+        return result
+    if "id" in result:
+        return _project_record(result, paths)
+    return {
+        key: [_project_record(item, paths) for item in value]
+        if key not in _UNPROJECTED_KEYS and _is_record_list(value) else value
+        for key, value in result.items()
+    }
+
+
+def dumps(result: Any, compact: bool = False) -> str:
+    """Serialize a result; compact output drops indentation and separator spaces"""
+    return jsonlib.dumps(result, compact=compact)
+
+
+def render(result: Any, fields: Optional[List[str]] = None, compact: bool = False) -> str:
+    """Project, then serialize, so dropped fields are never encoded"""
+    return dumps(project(result, fields), compact=compact)
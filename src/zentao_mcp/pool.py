@@ -0,0 +1,178 @@
+"""Per-account client pool for servers shared by many users"""
+import asyncio
+import contextlib
+import dataclasses
+import hashlib
+import hmac
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple, AsyncIterator, TYPE_CHECKING
+
+from .config import ZentaoConfig
+
+if TYPE_CHECKING:
+    import httpx
+
+    from .client import AsyncZentaoClient
+    from .resources import ResourceHub
+
+logger = logging.getLogger(__name__)
+
+
+class PoolFullError(RuntimeError):
+    """Every pooled client is in use and the pool is at its maximum"""
+
+
+class PooledClient:
+    """One account's client plus the bookkeeping the pool needs"""
+
+    __slots__ = ("key", "client", "secret", "last_used", "leases", "retired", "_resources")
+
+    def __init__(self, key: Tuple[str, str], client: "AsyncZentaoClient", secret: bytes):
+        self.key = key
+        self.client = client
+        self.secret = secret
+        self.last_used = time.monotonic()
+        self.leases = 0
+        self.retired = False
+        self._resources: Optional["ResourceHub"] = None
+
+    @property
+    def resources(self) -> "ResourceHub":
+        """This account's zentao:// snapshots, created on first use"""
+        if self._resources is None:
+            from .resources import ResourceHub
+
+            self._resources = ResourceHub.for_client(self.client)
+        return self._resources
+
+    @property
+    def busy(self) -> bool:
+        """Leased by a running call, or feeding resource subscriptions"""
+        return self.leases > 0 or (self._resources is not None and bool(self._resources.subscribed()))
+
+    async def aclose(self):
+        if self._resources is not None:
+            await self._resources.aclose()
+        await self.client.aclose()
+
+
+class ClientPool:
+    """Clients keyed by ``(base_url, account)``, created on first use
+
+    Each client keeps its own token and its own response cache, so one
+    user's cached reads never answer another user's calls. All of them
+    send through one shared connection pool, so the number of open sockets
+    is bounded by ``max_connections_per_host`` however many users there
+    are. Clients unused for ``idle_timeout`` seconds are closed, and once
+    ``max_clients`` are live the least recently used idle one makes room.
+    A call presenting a different password for a pooled account gets a
+    fresh client that logs in again.
+    """
+
+    def __init__(
+        self,
+        config: ZentaoConfig,
+        max_clients: int = 200,
+        idle_timeout: float = 900.0,
+        transport: Optional["httpx.AsyncBaseTransport"] = None
+    ):
+        from .client import make_http_client
+
+        self.config = config
+        self.max_clients = max_clients
+        self.idle_timeout = idle_timeout
+        self.http = make_http_client(config, transport)
+        self._salt = os.urandom(16)
+        self._entries: "OrderedDict[Tuple[str, str], PooledClient]" = OrderedDict()
+        self.counters = {"hits": 0, "created": 0, "evicted_idle": 0, "evicted_lru": 0, "replaced": 0, "rejected": 0}
+
+    def _secret(self, password: str) -> bytes:
+        return hashlib.sha256(self._salt + password.encode("utf-8")).digest()
+
+    def _config_for(self, account: str, password: str) -> ZentaoConfig:
+        # Explicit store paths are per deployment; leave them blank so every
+        # account gets its own replica, search index and change store. The
+        # on-disk token cache is keyed by account alone, so adopting a token
+        # from it would skip checking the presented password: always log in.
+        return dataclasses.replace(
+            self.config, username=account, password=password, token_cache=False,
+            replica_path="", search_path="", changes_path=""
+        )
+
+    @contextlib.asynccontextmanager
+    async def lease(self, account: str, password: str) -> AsyncIterator[PooledClient]:
+        """Hold an account's client for the duration of one call"""
+        entry = await self._acquire(account, password)
+        entry.leases += 1
+        try:
+            yield entry
+        finally:
+            entry.leases -= 1
+            entry.last_used = time.monotonic()
+            if entry.retired and not entry.leases:
+                await entry.aclose()
+
+    async def _acquire(self, account: str, password: str) -> PooledClient:
+        from .client import AsyncZentaoClient
+
+        if not account or not password:
+            raise ValueError("Both a Zentao account and a password are required")
+        key = (self.config.base_url, account)
+        secret = self._secret(password)
+        await self.evict_idle()
+        while True:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if hmac.compare_digest(entry.secret, secret):
+                    self.counters["hits"] += 1
+                    self._entries.move_to_end(key)
+                    return entry
+                self.counters["replaced"] += 1
+                await self._remove(entry)
+                continue
+            if len(self._entries) < self.max_clients:
+                break
+            victim = next((e for e in self._entries.values() if not e.busy), None)
+            if victim is None:
+                self.counters["rejected"] += 1
+                raise PoolFullError(f"All {self.max_clients} pooled Zentao clients are in use; try again shortly")
+            self.counters["evicted_lru"] += 1
+            await self._remove(victim)
+        client = AsyncZentaoClient(self._config_for(account, password), http=self.http)
+        entry = self._entries[key] = PooledClient(key, client, secret)
+        self.counters["created"] += 1
+        logger.info(f"Created pooled Zentao client for {account} ({len(self._entries)} live)")
+        return entry
+
+    async def _remove(self, entry: PooledClient):
+        """Drop an entry; it is closed now, or when its last call finishes"""
+        if self._entries.get(entry.key) is entry:
+            del self._entries[entry.key]
+        entry.retired = True
+        if not entry.leases:
+            await entry.aclose()
+
+    async def evict_idle(self):
+        """Close clients nobody has used for ``idle_timeout`` seconds"""
+        cutoff = time.monotonic() - self.idle_timeout
+        for entry in [e for e in self._entries.values() if not e.busy and e.last_used < cutoff]:
+            self.counters["evicted_idle"] += 1
+            await self._remove(entry)
+
+    async def aclose(self):
+        """Close every pooled client and the shared connection pool"""
+        entries, self._entries = list(self._entries.values()), OrderedDict()
+        await asyncio.gather(*(entry.aclose() for entry in entries), return_exceptions=True)
+        await self.http.aclose()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.counters,
+            "live": len(self._entries),
+            "leased": sum(1 for entry in self._entries.values() if entry.leases),
+            "max_clients": self.max_clients,
+            "idle_timeout": self.idle_timeout,
+        }
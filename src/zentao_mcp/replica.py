@@ -0,0 +1,467 @@
+"""Local SQLite replica of Zentao entities with incremental sync"""
+import asyncio
+import logging
+import time
+from contextlib import aclosing
+from typing import Optional, Dict, Any, List, Tuple, Iterable, TYPE_CHECKING
+
+from . import jsonlib
+from .cache import resource_type, entity_id_of
+from .sqlite_store import SQLiteStore, default_path as _default_path
+
+if TYPE_CHECKING:
+    from .client import AsyncZentaoClient
+
+logger = logging.getLogger(__name__)
+
+# Replicated kinds, in sync order: parents before the collections nested under them
+KINDS = ("users", "programs", "products", "projects", "executions", "stories", "tasks", "bugs")
+
+# Kind -> (parent kind, link field) for kinds that are listed per parent, e.g. /products/{id}/bugs
+NESTED_UNDER: Dict[str, Tuple[str, str]] = {
+    "stories": ("products", "product"),
+    "bugs": ("products", "product"),
+    "tasks": ("executions", "execution"),
+}
+
+# Record fields copied into indexed columns, so per-parent lists are plain index scans
+LINK_FIELDS = ("product", "project", "execution")
+PARENT_LINKS = {"products": "product", "projects": "project", "executions": "execution"}
+
+EDITED_FIELD = "lastEditedDate"
+UPSERT_CHUNK = 500
+# Zentao's page size when a list request sets no limit; replica lists page the same way
+DEFAULT_LIMIT = 20
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entities (
+    kind TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    product INTEGER,
+    project INTEGER,
+    execution INTEGER,
+    scope TEXT,
+    edited TEXT,
+    data TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (kind, id)
+);
+CREATE INDEX IF NOT EXISTS entities_product ON entities (kind, product);
+CREATE INDEX IF NOT EXISTS entities_project ON entities (kind, project);
+CREATE INDEX IF NOT EXISTS entities_execution ON entities (kind, execution);
+CREATE INDEX IF NOT EXISTS entities_scope ON entities (scope, synced_at);
+CREATE TABLE IF NOT EXISTS scopes (
+    scope TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    edited TEXT,
+    max_id INTEGER,
+    synced_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS kinds (
+    kind TEXT PRIMARY KEY,
+    synced_at REAL NOT NULL
+);
+"""
+
+
+def default_path(base_url: str, username: str) -> str:
+    return _default_path("replica", base_url, username)
+
+
+def edited_at(record: Dict[str, Any]) -> Optional[str]:
+    """Last-edited timestamp of a record, or None if it was never edited"""
+    value = record.get(EDITED_FIELD)
+    if not value or not isinstance(value, str) or value.startswith("0000"):
+        return None
+    return value
+
+
+def scope_of(kind: str, record: Dict[str, Any]) -> Optional[str]:
+    """The list endpoint a record of kind is synced from"""
+    if kind not in NESTED_UNDER:
+        return f"/{kind}"
+    parent, field = NESTED_UNDER[kind]
+    parent_id = entity_id_of(record.get(field))
+    return f"/{parent}/{parent_id}/{kind}" if parent_id else None
+
+
+def path_kind(path: str) -> str:
+    """Kind an API path reads, e.g. ``/bugs/5`` and ``/products/1/bugs`` -> ``bugs``"""
+    segments = path.strip("/").split("/")
+    return segments[0] if len(segments) == 2 else segments[-1]
+
+
+def write_kind(path: str) -> Optional[str]:
+    """Replicated kind a write to path changes, if any"""
+    kind = resource_type(path)
+    if kind not in KINDS:
+        kind = path.strip("/").split("/")[0]
+    return kind if kind in KINDS else None
+
+
+def _is_deleted(record: Dict[str, Any]) -> bool:
+    return record.get("deleted") in (True, 1, "1")
+
+
+class Replica(SQLiteStore):
+    """SQLite mirror of Zentao entities, one JSON row per entity
+
+    Freshness is tracked per kind: a kind is fresh for ``max_age`` seconds
+    after a sync of all its scopes completed. Rows are shared between
+    processes through WAL mode.
+    """
+
+    thread_name = "zentao-replica"
+
+    def __init__(self, path: str):
+        super().__init__(path, SCHEMA)
+        # Kind -> time a write to it could not be mirrored; stale until a later sync
+        self._stale: Dict[str, float] = {}
+        self.hits = 0
+        self.misses = 0
+
+    # ==================== Writes ====================
+
+    def upsert(
+        self,
+        kind: str,
+        records: Iterable[Dict[str, Any]],
+        synced_at: Optional[float] = None,
+        scope: Optional[str] = None
+    ) -> Tuple[int, int]:
+        """Store records, dropping ones Zentao reports as deleted; returns ``(upserted, deleted)``
+
+        ``scope`` is the list endpoint the records came from; by default it is
+        derived from each record's parent link.
+        """
+        synced_at = synced_at if synced_at is not None else time.time()
+        rows, gone = [], []
+        for record in records:
+            if _is_deleted(record):
+                gone.append((kind, record["id"]))
+                continue
+            links = [entity_id_of(record.get(field)) for field in LINK_FIELDS]
+            rows.append((
+                kind, int(record["id"]), *links, scope or scope_of(kind, record),
+                edited_at(record), jsonlib.dumps(record, compact=True), synced_at
+            ))
+        with self._transaction():
+            self._db.executemany(
+                "INSERT INTO entities (kind, id, product, project, execution, scope, edited, data, synced_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (kind, id) DO UPDATE SET product = excluded.product, project = excluded.project, "
+                "execution = excluded.execution, scope = excluded.scope, edited = excluded.edited, "
+                "data = excluded.data, synced_at = excluded.synced_at",
+                rows
+            )
+            self._db.executemany("DELETE FROM entities WHERE kind = ? AND id = ?", gone)
+        return len(rows), len(gone)
+
+    def remove(self, kind: str, entity_id: int):
+        with self._lock:
+            self._db.execute("DELETE FROM entities WHERE kind = ? AND id = ?", (kind, entity_id))
+
+    def sweep(self, scope: str, before: float) -> int:
+        """Delete rows of scope that a full sync started at ``before`` did not see"""
+        with self._lock:
+            cursor = self._db.execute("DELETE FROM entities WHERE scope = ? AND synced_at < ?", (scope, before))
+        return cursor.rowcount
+
+    def apply_write(self, method: str, path: str, result: Any):
+        """Mirror a successful write so reads of the replica see it immediately
+
+        Entities returned by the write are stored; otherwise the entity the
+        path points at is dropped, so reads fall through to Zentao until the
+        next sync.
+        """
+        segments = path.strip("/").split("/")
+        kind = write_kind(path)
+        if kind is None:
+            return
+        if method != "DELETE" and isinstance(result, dict) and "id" in result:
+            self.upsert(kind, [result])
+        elif len(segments) > 1 and segments[1].isdigit():
+            self.remove(segments[0], int(segments[1]))
+
+    def save_scope(self, scope: str, kind: str, edited: Optional[str], max_id: Optional[int], synced_at: float):
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO scopes (scope, kind, edited, max_id, synced_at) VALUES (?, ?, ?, ?, ?)",
+                (scope, kind, edited, max_id, synced_at)
+            )
+
+    def mark_synced(self, kind: str, synced_at: float):
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO kinds (kind, synced_at) VALUES (?, ?)", (kind, synced_at))
+        if self._stale.get(kind, synced_at) < synced_at:
+            del self._stale[kind]
+
+    def mark_stale(self, path: str):
+        """Serve the kind a write to path changed from Zentao until it is synced again
+
+        Only touches memory, so it works when the database itself is failing.
+        """
+        kind = write_kind(path)
+        if kind is not None:
+            self._stale[kind] = time.time()
+
+    # ==================== Reads ====================
+
+    def scope_state(self, scope: str) -> Optional[Tuple[Optional[str], Optional[int]]]:
+        """``(edited watermark, max id)`` of the last sync of scope, if any"""
+        with self._lock:
+            row = self._db.execute("SELECT edited, max_id FROM scopes WHERE scope = ?", (scope,)).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def synced_at(self, kind: str) -> Optional[float]:
+        with self._lock:
+            row = self._db.execute("SELECT synced_at FROM kinds WHERE kind = ?", (kind,)).fetchone()
+        return row[0] if row else None
+
+    def is_fresh(self, kind: str, max_age: float) -> bool:
+        if kind in self._stale:
+            return False
+        synced_at = self.synced_at(kind)
+        return synced_at is not None and time.time() - synced_at <= max_age
+
+    def ids(self, kind: str) -> List[int]:
+        with self._lock:
+            return [row[0] for row in self._db.execute("SELECT id FROM entities WHERE kind = ? ORDER BY id", (kind,))]
+
+    def lookup(
+        self,
+        path: str,
+        max_age: float,
+        page: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[bool, Any]:
+        """Answer a GET of path from the replica if its kind is fresh enough
+
+        Supports ``/{kind}``, ``/{kind}/{id}`` and ``/{parent}/{id}/{kind}``.
+        Lists come back in Zentao's envelope, paged like the API: without
+        ``limit`` a page holds ``DEFAULT_LIMIT`` records.
+        """
+        segments = path.strip("/").split("/")
+        kind = path_kind(path)
+        where, args = "kind = ?", [kind]
+        if len(segments) == 2 and segments[1].isdigit():
+            where, args = "kind = ? AND id = ?", [kind, int(segments[1])]
+        elif len(segments) == 3 and segments[1].isdigit() and segments[0] in PARENT_LINKS:
+            where, args = f"kind = ? AND {PARENT_LINKS[segments[0]]} = ?", [kind, int(segments[1])]
+        elif len(segments) != 1:
+            return False, None
+        if kind not in KINDS or not self.is_fresh(kind, max_age):
+            self.misses += 1
+            return False, None
+
+        if len(segments) == 2:
+            with self._lock:
+                row = self._db.execute(f"SELECT data FROM entities WHERE {where}", args).fetchone()
+            if row is None:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+            return True, jsonlib.loads(row[0])
+
+        with self._lock:
+            total = self._db.execute(f"SELECT COUNT(*) FROM entities WHERE {where}", args).fetchone()[0]
+            page = max(1, page or 1)
+            limit = limit or DEFAULT_LIMIT
+            rows = self._db.execute(
+                f"SELECT data FROM entities WHERE {where} ORDER BY id LIMIT ? OFFSET ?",
+                [*args, limit, (page - 1) * limit]
+            ).fetchall()
+        self.hits += 1
+        return True, {"page": page, "total": total, "limit": limit, kind: [jsonlib.loads(row[0]) for row in rows]}
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = dict(self._db.execute("SELECT kind, COUNT(*) FROM entities GROUP BY kind").fetchall())
+            synced = dict(self._db.execute("SELECT kind, synced_at FROM kinds").fetchall())
+        now = time.time()
+        return {
+            "path": self.path,
+            "hits": self.hits,
+            "misses": self.misses,
+            "kinds": {
+                kind: {
+                    "rows": counts.get(kind, 0),
+                    "age": round(now - synced[kind], 1) if kind in synced else None,
+                }
+                for kind in KINDS
+            },
+        }
+
+
+class SyncEngine:
+    """Mirror Zentao into a Replica through the client's paginator
+
+    An incremental sync of a scope reads two streams, each stopped early:
+    records ordered by last-edited date down to the previous watermark
+    (edits), and records ordered by ID down to the previous highest ID
+    (creations that were never edited). If Zentao ignores the requested
+    order the stream is read to the end instead. Deletions that do not
+    touch the last-edited date are only picked up by a full sync, which
+    re-reads every scope and sweeps rows it did not see.
+    """
+
+    def __init__(self, client: "AsyncZentaoClient", replica: Replica):
+        self.client = client
+        self.replica = replica
+        self._running: Dict[str, asyncio.Task] = {}
+        self._background: set = set()
+
+    async def sync(self, kinds: Optional[List[str]] = None, full: bool = False) -> Dict[str, Any]:
+        """Sync kinds (all by default) in dependency order and report per-kind counts"""
+        wanted = set(kinds or KINDS)
+        unknown = wanted - set(KINDS)
+        if unknown:
+            raise ValueError(f"Unknown kinds: {', '.join(sorted(unknown))}")
+        # Nested kinds need their parents' IDs; sync parents that were never synced
+        for kind in list(wanted):
+            if kind in NESTED_UNDER and await self.replica.run(self.replica.synced_at, NESTED_UNDER[kind][0]) is None:
+                wanted.add(NESTED_UNDER[kind][0])
+
+        started = time.monotonic()
+        report = {}
+        for kind in KINDS:
+            if kind in wanted:
+                report[kind] = await self.sync_kind(kind, full)
+        return {"kinds": report, "elapsed": round(time.monotonic() - started, 3)}
+
+    async def sync_kind(self, kind: str, full: bool = False) -> Dict[str, Any]:
+        """Sync one kind; concurrent calls for the same kind share one run"""
+        task = self._running.get(kind)
+        if task is None:
+            task = asyncio.ensure_future(self._sync_kind(kind, full))
+            self._running[kind] = task
+            task.add_done_callback(lambda _: self._running.pop(kind, None))
+        return await asyncio.shield(task)
+
+    def schedule(self, kind: str):
+        """Start a background incremental sync of kind unless one is already running"""
+        if kind not in KINDS or kind in self._running:
+            return
+        task = asyncio.ensure_future(self.sync_kind(kind))
+        self._background.add(task)
+        task.add_done_callback(self._background_done)
+
+    def _background_done(self, task: asyncio.Task):
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Background replica sync failed: {task.exception()}")
+
+    async def aclose(self):
+        tasks = [*self._background, *self._running.values()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _scopes(self, kind: str) -> List[str]:
+        if kind not in NESTED_UNDER:
+            return [f"/{kind}"]
+        parent = NESTED_UNDER[kind][0]
+        return [f"/{parent}/{parent_id}/{kind}" for parent_id in await self.replica.run(self.replica.ids, parent)]
+
+    async def _sync_kind(self, kind: str, full: bool) -> Dict[str, Any]:
+        started = time.time()
+        totals = {"scopes": 0, "fetched": 0, "upserted": 0, "deleted": 0, "errors": []}
+        semaphore = asyncio.Semaphore(max(1, self.client.config.batch_concurrency))
+
+        async def run(scope: str):
+            async with semaphore:
+                try:
+                    counts = await self._sync_scope(kind, scope, full)
+                except Exception as e:
+                    logger.warning(f"Replica sync of {scope} failed: {e}")
+                    totals["errors"].append({"scope": scope, "error": str(e)})
+                    return
+            totals["scopes"] += 1
+            for key, value in counts.items():
+                totals[key] += value
+
+        await asyncio.gather(*(run(scope) for scope in await self._scopes(kind)))
+        if not totals["errors"]:
+            await self.replica.run(self.replica.mark_synced, kind, started)
+        logger.info(f"Replica sync of {kind}: {totals['upserted']} upserted, {totals['deleted']} deleted")
+        return totals
+
+    async def _sync_scope(self, kind: str, scope: str, full: bool) -> Dict[str, int]:
+        started = time.time()
+        state = None if full else await self.replica.run(self.replica.scope_state, scope)
+        counts = {"fetched": 0, "upserted": 0, "deleted": 0}
+        watermark, max_id = state if state else (None, None)
+
+        async def consume(order: Optional[str], stop) -> Tuple[Optional[str], Optional[int]]:
+            """Upsert one stream; returns the newest edit and highest ID seen"""
+            newest, highest, previous, ordered = None, None, None, order is not None
+            seen, stop_at = 0, None
+            chunk: List[Dict[str, Any]] = []
+            params = {"order": order} if order else None
+            async with aclosing(self.client._iter_pages(scope, kind, params=params, cached=False)) as records:
+                async for record in records:
+                    key = stop.key(record) if stop else None
+                    if ordered and previous is not None and key is not None and key > previous:
+                        ordered = False  # Zentao ignored the order; read everything
+                    if ordered and stop_at is None and stop and stop.reached(key, previous):
+                        # Confirm the order over one more page before trusting the watermark
+                        stop_at = seen + self.client.config.page_size
+                    if ordered and stop_at is not None and seen >= stop_at:
+                        break
+                    seen += 1
+                    previous = key if key is not None else previous
+                    chunk.append(record)
+                    edited = edited_at(record)
+                    if edited and (newest is None or edited > newest):
+                        newest = edited
+                    highest = max(highest or 0, int(record["id"]))
+                    if len(chunk) >= UPSERT_CHUNK:
+                        await self._store(kind, scope, chunk, started, counts)
+                        chunk = []
+            await self._store(kind, scope, chunk, started, counts)
+            return newest, highest
+
+        if state is None:
+            newest, highest = await consume(None, None)
+            counts["deleted"] += await self.replica.run(self.replica.sweep, scope, started)
+        else:
+            newest, _ = await consume(f"{EDITED_FIELD}_desc", _StopAt("edited", watermark))
+            _, highest = await consume("id_desc", _StopAt("id", max_id))
+        await self.replica.run(
+            self.replica.save_scope,
+            scope, kind,
+            max(filter(None, (watermark, newest)), default=None),
+            max(filter(None, (max_id, highest)), default=None),
+            started
+        )
+        return counts
+
+    async def _store(
+        self, kind: str, scope: str, chunk: List[Dict[str, Any]], synced_at: float, counts: Dict[str, int]
+    ):
+        if not chunk:
+            return
+        upserted, deleted = await self.replica.run(self.replica.upsert, kind, chunk, synced_at, scope)
+        counts["fetched"] += len(chunk)
+        counts["upserted"] += upserted
+        counts["deleted"] += deleted
+
+
+class _StopAt:
+    """Stop condition for a descending stream: the first record at or below the watermark"""
+
+    def __init__(self, field: str, watermark: Any):
+        self.field = field
+        self.watermark = watermark
+
+    def key(self, record: Dict[str, Any]) -> Any:
+        return edited_at(record) if self.field == "edited" else int(record["id"])
+
+    def reached(self, key: Any, previous: Any) -> bool:
+        if key is None:
+            # Never-edited records sort last under lastEditedDate_desc and the ID stream
+            # covers them; only trust that once the stream has shown it is ordered
+            return previous is not None
+        return self.watermark is not None and (
+            key < self.watermark if self.field == "edited" else key <= self.watermark
+        )
@@ -0,0 +1,85 @@
+"""Retry backoff and circuit breaker for Zentao requests"""
+import random
+import time
+from typing import Dict, Any
+
+# Methods that are safe to resend (RFC 9110 idempotent methods)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling Zentao while the circuit breaker is open"""
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Exponential backoff with full jitter for the given 0-based retry attempt"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """Fail fast after repeated failures until a cool-down period has passed
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    every request is rejected for ``reset_timeout`` seconds. Then a single
+    trial request is let through (half-open): success closes the circuit,
+    failure opens it for another cool-down.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.rejected = 0
+        self.times_opened = 0
+        self._trial_in_flight = False
+        self._trial_started = 0.0
+
+    def before_request(self):
+        """Raise CircuitOpenError unless a request may be sent now"""
+        if self.failure_threshold <= 0 or self.state == self.CLOSED:
+            return
+        remaining = self.opened_at + self.reset_timeout - time.monotonic()
+        if self.state == self.OPEN and remaining <= 0:
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN and (
+            # A trial that never reported back (e.g. it was cancelled) must not wedge the circuit
+            not self._trial_in_flight or time.monotonic() - self._trial_started > self.reset_timeout
+        ):
+            self._trial_in_flight = True
+            self._trial_started = time.monotonic()
+            return
+        self.rejected += 1
+        raise CircuitOpenError(
+            f"Zentao is unavailable ({self.consecutive_failures} consecutive failures); "
+            f"retry in {max(remaining, 0):.0f}s"
+        )
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        self._trial_in_flight = False
+        if self.failure_threshold > 0 and (
+            self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold
+        ):
+            if self.state != self.OPEN:
+                self.times_opened += 1
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,247 @@
+"""zentao:// resources: snapshot-cached reads, subscriptions and change polling"""
+import asyncio
+import hashlib
+import logging
+import re
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, Tuple, TYPE_CHECKING
+
+from .output import render
+
+if TYPE_CHECKING:
+    from .client import AsyncZentaoClient
+
+logger = logging.getLogger(__name__)
+
+SCHEME = "zentao://"
+
+
+@dataclass(frozen=True)
+class ResourceSpec:
+    """A zentao:// URI (template) and the API path it reads"""
+    uri: str
+    name: str
+    description: str
+    # Record key of list endpoints, read across all pages; None for single entities
+    key: Optional[str] = None
+    pattern: re.Pattern = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        path = re.escape(self.uri[len(SCHEME) - 1:]).replace(re.escape("{id}"), r"(\d+)")
+        object.__setattr__(self, "pattern", re.compile(f"^{path}$"))
+
+    @property
+    def is_template(self) -> bool:
+        return "{id}" in self.uri
+
+
+RESOURCES: Tuple[ResourceSpec, ...] = (
+    ResourceSpec("zentao://products", "Products", "List of all products in Zentao", "products"),
+    ResourceSpec("zentao://projects", "Projects", "List of all projects in Zentao", "projects"),
+    ResourceSpec("zentao://users", "Users", "List of all users in Zentao", "users"),
+    ResourceSpec("zentao://products/{id}", "Product", "One product"),
+    ResourceSpec("zentao://products/{id}/bugs", "Product bugs", "All bugs of a product", "bugs"),
+    ResourceSpec("zentao://products/{id}/stories", "Product stories", "All stories of a product", "stories"),
+    ResourceSpec("zentao://products/{id}/testcases", "Product test cases", "All test cases of a product", "testcases"),
+    ResourceSpec("zentao://projects/{id}", "Project", "One project"),
+    ResourceSpec("zentao://projects/{id}/executions", "Project executions", "All executions of a project", "executions"),
+    ResourceSpec("zentao://projects/{id}/stories", "Project stories", "All stories of a project", "stories"),
+    ResourceSpec("zentao://executions/{id}", "Execution", "One execution"),
+    ResourceSpec("zentao://executions/{id}/tasks", "Execution tasks", "All tasks of an execution", "tasks"),
+    ResourceSpec("zentao://executions/{id}/stories", "Execution stories", "All stories of an execution", "stories"),
+    ResourceSpec("zentao://bugs/{id}", "Bug", "One bug"),
+    ResourceSpec("zentao://stories/{id}", "Story", "One story"),
+    ResourceSpec("zentao://tasks/{id}", "Task", "One task"),
+    ResourceSpec("zentao://users/{id}", "User", "One user"),
+)
+
+
+def resolve(uri: str) -> Tuple[ResourceSpec, str]:
+    """Resource spec and API path of a zentao:// URI"""
+    uri = str(uri).rstrip("/")
+    if uri.startswith(SCHEME):
+        path = "/" + uri[len(SCHEME):]
+        for spec in RESOURCES:
+            if spec.pattern.match(path):
+                return spec, path
+    raise ValueError(f"Unknown resource: {uri}")
+
+
+@dataclass
+class Snapshot:
+    """Last rendered content of a resource"""
+    text: str
+    digest: str
+    fetched_at: float
+
+
+class ResourceHub:
+    """Shared snapshots of zentao:// resources plus subscriptions
+
+    Reads are answered from a snapshot younger than ``ttl`` seconds, so any
+    number of sessions reading the same URI cost one Zentao fetch; concurrent
+    refreshes of one URI share a single fetch. While any URI has subscribers
+    a background poller re-fetches subscribed URIs every ``poll_interval``
+    seconds and notifies their sessions only when the content hash changed.
+    Fetches bypass the response cache so polls see fresh data.
+    """
+
+    def __init__(
+        self,
+        client: "AsyncZentaoClient",
+        ttl: float = 30.0,
+        poll_interval: float = 60.0,
+        max_entries: int = 256,
+        compact: bool = False
+    ):
+        self.client = client
+        self.ttl = ttl
+        self.poll_interval = poll_interval
+        self.max_entries = max_entries
+        self.compact = compact
+        self._snapshots: "OrderedDict[str, Snapshot]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._subscribers: Dict[str, "weakref.WeakSet"] = {}
+        self._poller: Optional[asyncio.Task] = None
+        self._background: set = set()
+        self.counters = {"reads": 0, "hits": 0, "fetches": 0, "polls": 0, "changes": 0, "notifications": 0}
+
+    @classmethod
+    def for_client(cls, client: "AsyncZentaoClient") -> "ResourceHub":
+        """Hub configured from the client's settings"""
+        return cls(
+            client,
+            ttl=client.config.resource_ttl,
+            poll_interval=client.config.resource_poll_interval,
+            compact=client.config.compact_output
+        )
+
+    # ==================== Reads ====================
+
+    async def read(self, uri: str) -> str:
+        """Content of a resource, from a fresh snapshot when there is one"""
+        uri = str(uri).rstrip("/")
+        resolve(uri)
+        self.counters["reads"] += 1
+        snapshot = self._snapshots.get(uri)
+        if snapshot is not None and time.monotonic() - snapshot.fetched_at < self.ttl:
+            self.counters["hits"] += 1
+            self._snapshots.move_to_end(uri)
+            return snapshot.text
+        return (await self.refresh(uri)).text
+
+    async def refresh(self, uri: str) -> Snapshot:
+        """Re-fetch a resource; concurrent refreshes of one URI share one fetch"""
+        task = self._inflight.get(uri)
+        if task is None:
+            task = asyncio.ensure_future(self._refresh(uri))
+            self._inflight[uri] = task
+            task.add_done_callback(lambda _: self._inflight.pop(uri, None))
+        return await asyncio.shield(task)
+
+    async def _refresh(self, uri: str) -> Snapshot:
+        spec, path = resolve(uri)
+        self.counters["fetches"] += 1
+        if spec.key is not None:
+            records = [record async for record in self.client._iter_pages(path, spec.key, cached=False)]
+            result = {"total": len(records), spec.key: records}
+        else:
+            result = await self.client._request("GET", path, cached=False)
+        text = render(result, compact=self.compact)
+        snapshot = Snapshot(text, hashlib.sha256(text.encode("utf-8")).hexdigest(), time.monotonic())
+        previous = self._snapshots.get(uri)
+        self._store(uri, snapshot)
+        if previous is not None and previous.digest != snapshot.digest:
+            self.counters["changes"] += 1
+            await self._notify(uri)
+        return snapshot
+
+    def _store(self, uri: str, snapshot: Snapshot):
+        self._snapshots[uri] = snapshot
+        self._snapshots.move_to_end(uri)
+        # Evict the least recently used snapshots nobody is subscribed to
+        for old in list(self._snapshots):
+            if len(self._snapshots) <= self.max_entries:
+                break
+            if not self._subscribers.get(old):
+                del self._snapshots[old]
+
+    # ==================== Subscriptions ====================
+
+    def subscribe(self, uri: str, session: Any):
+        """Notify ``session`` when the resource changes"""
+        uri = str(uri).rstrip("/")
+        resolve(uri)
+        self._subscribers.setdefault(uri, weakref.WeakSet()).add(session)
+        if uri not in self._snapshots:
+            # Baseline now, so a change before the first poll is not missed
+            task = asyncio.ensure_future(self._baseline(uri))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+        if self._poller is None or self._poller.done():
+            self._poller = asyncio.ensure_future(self._poll_loop())
+
+    def unsubscribe(self, uri: str, session: Any):
+        uri = str(uri).rstrip("/")
+        sessions = self._subscribers.get(uri)
+        if sessions is not None:
+            sessions.discard(session)
+            if not sessions:
+                del self._subscribers[uri]
+
+    def subscribed(self) -> List[str]:
+        return [uri for uri, sessions in self._subscribers.items() if sessions]
+
+    async def _notify(self, uri: str):
+        from pydantic import AnyUrl
+
+        for session in list(self._subscribers.get(uri, ())):
+            try:
+                await session.send_resource_updated(AnyUrl(uri))
+                self.counters["notifications"] += 1
+            except Exception as e:
+                # The session went away; forget it
+                logger.info(f"Dropping subscriber of {uri}: {e!r}")
+                self._subscribers.get(uri, set()).discard(session)
+
+    async def poll_once(self):
+        """Refresh every subscribed resource once, notifying on changes"""
+        self.counters["polls"] += 1
+        for uri in self.subscribed():
+            try:
+                await self.refresh(uri)
+            except Exception as e:
+                logger.warning(f"Polling {uri} failed: {e!r}")
+
+    async def _baseline(self, uri: str):
+        try:
+            await self.refresh(uri)
+        except Exception as e:
+            logger.warning(f"Reading {uri} failed: {e!r}")
+
+    async def _poll_loop(self):
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            if not self.subscribed():
+                return
+            await self.poll_once()
+
+    async def aclose(self):
+        """Stop the poller and pending baseline reads"""
+        tasks = [*self._background, *([self._poller] if self._poller is not None else [])]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._poller = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.counters,
+            "snapshots": len(self._snapshots),
+            "subscriptions": sum(len(sessions) for sessions in self._subscribers.values()),
+            "ttl": self.ttl,
+            "poll_interval": self.poll_interval,
+        }
@@ -0,0 +1,227 @@
+"""Local full-text index over bugs, stories, tasks and test cases"""
+import html
+import logging
+import re
+from typing import Optional, Dict, Any, List, Iterable, Tuple
+
+from .cache import resource_type, entity_id_of
+from .sqlite_store import SQLiteStore, default_path as _default_path
+
+logger = logging.getLogger(__name__)
+
+# Kind -> (title field, body fields) indexed for it
+SEARCH_FIELDS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "bugs": ("title", ("steps",)),
+    "stories": ("title", ("spec", "verify")),
+    "tasks": ("name", ("desc",)),
+    "testcases": ("title", ("precondition", "steps")),
+}
+SEARCH_KINDS = tuple(SEARCH_FIELDS)
+
+# Title matches weigh more than body matches in bm25 ranking
+TITLE_WEIGHT = 10.0
+BODY_WEIGHT = 1.0
+SNIPPET_CHARS = 80
+
+_CJK = "\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff"
+# Group 1: a run of CJK characters; group 2: any other word
+_TOKEN_RE = re.compile(f"([{_CJK}]+)|([^\\W{_CJK}]+)")
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    rowid INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    product INTEGER,
+    status TEXT,
+    title TEXT,
+    body TEXT,
+    UNIQUE (kind, id)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS docs_fts USING fts5(title, body, tokenize = 'unicode61 remove_diacritics 2');
+"""
+
+
+def default_path(base_url: str, username: str) -> str:
+    return _default_path("search", base_url, username)
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into index terms
+
+    Latin words are lowercased whole words. Chinese has no word breaks, so
+    each run of CJK characters becomes overlapping bigrams plus its last
+    character: any substring of two or more characters is then a phrase of
+    bigrams, and a single character is a prefix of some term.
+    """
+    tokens: List[str] = []
+    for cjk, word in _TOKEN_RE.findall(text or ""):
+        if cjk:
+            tokens.extend(cjk[i:i + 2] for i in range(len(cjk) - 1))
+            tokens.append(cjk[-1])
+        else:
+            tokens.append(word.lower())
+    return tokens
+
+
+def plain_text(value: Any) -> str:
+    """Text of a field value: HTML is stripped, test case step lists are flattened"""
+    if isinstance(value, list):
+        return " ".join(plain_text(item) for item in value)
+    if isinstance(value, dict):
+        return " ".join(plain_text(value.get(key)) for key in ("desc", "expect") if value.get(key))
+    if not isinstance(value, str):
+        return ""
+    return _SPACE_RE.sub(" ", html.unescape(_TAG_RE.sub(" ", value))).strip()
+
+
+def match_expression(query: str) -> Optional[str]:
+    """FTS5 query requiring every term; single CJK characters and Latin words match as prefixes"""
+    terms = []
+    for cjk, word in _TOKEN_RE.findall(query or ""):
+        if len(cjk) == 1:
+            terms.append(f'"{cjk}"*')
+        elif cjk:
+            terms.append('"' + " ".join(cjk[i:i + 2] for i in range(len(cjk) - 1)) + '"')
+        else:
+            terms.append(f'"{word.lower()}"*')
+    return " AND ".join(terms) if terms else None
+
+
+def _snippet(text: str, query: str) -> str:
+    """A window of text around the first query term it contains"""
+    lowered = text.lower()
+    positions = [lowered.find(m.group().lower()) for m in _TOKEN_RE.finditer(query or "")]
+    start = min((p for p in positions if p >= 0), default=0)
+    start = max(0, start - SNIPPET_CHARS // 4)
+    window = text[start:start + SNIPPET_CHARS]
+    return ("…" if start else "") + window + ("…" if start + SNIPPET_CHARS < len(text) else "")
+
+
+class SearchIndex(SQLiteStore):
+    """FTS5 index fed from entities the client fetches or writes
+
+    All index work runs in order on one worker thread, so feeding the index
+    never delays a tool call, and a search queued after a fetch sees it.
+    """
+
+    thread_name = "zentao-search"
+
+    def __init__(self, path: str):
+        super().__init__(path, SCHEMA)
+        self.indexed = 0
+        self.searches = 0
+
+    def observe(self, method: str, path: str, result: Any):
+        """Queue indexing of whatever a successful request returned or changed"""
+        segments = path.strip("/").split("/")
+        kind = resource_type(path)
+        if kind not in SEARCH_FIELDS:
+            kind = segments[0]
+        if kind not in SEARCH_FIELDS:
+            return
+        if method == "DELETE" and len(segments) == 2 and segments[1].isdigit():
+            self._worker.submit(self._guard, self.remove, kind, int(segments[1]))
+        elif isinstance(result, dict) and "id" in result:
+            self._worker.submit(self._guard, self.index, kind, [result])
+        elif isinstance(result, dict) and isinstance(result.get(kind), list):
+            self._worker.submit(self._guard, self.index, kind, result[kind])
+
+    @staticmethod
+    def _guard(func, *args):
+        try:
+            func(*args)
+        except Exception as e:
+            logger.warning(f"Search index update failed: {e}")
+
+    # ==================== Worker thread ====================
+
+    def index(self, kind: str, records: Iterable[Dict[str, Any]]):
+        """Insert or refresh records; fields absent from a (list) record keep their indexed text"""
+        title_field, body_fields = SEARCH_FIELDS[kind]
+        with self._transaction():
+            for record in records:
+                if not isinstance(record, dict) or "id" not in record:
+                    continue
+                if record.get("deleted") in (True, 1, "1"):
+                    self.remove(kind, int(record["id"]))
+                    continue
+                present = [plain_text(record[f]) for f in body_fields if f in record]
+                body = " ".join(filter(None, present)) if present else None
+                entity_id = int(record["id"])
+                self._db.execute(
+                    "INSERT INTO docs (kind, id, product, status, title, body) VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (kind, id) DO UPDATE SET product = COALESCE(excluded.product, product), "
+                    "status = COALESCE(excluded.status, status), title = COALESCE(excluded.title, title), "
+                    "body = COALESCE(excluded.body, body)",
+                    (kind, entity_id, entity_id_of(record.get("product")), record.get("status"),
+                     plain_text(record.get(title_field)) if title_field in record else None, body)
+                )
+                rowid, title, body = self._db.execute(
+                    "SELECT rowid, title, body FROM docs WHERE kind = ? AND id = ?", (kind, entity_id)
+                ).fetchone()
+                self._db.execute("DELETE FROM docs_fts WHERE rowid = ?", (rowid,))
+                self._db.execute(
+                    "INSERT INTO docs_fts (rowid, title, body) VALUES (?, ?, ?)",
+                    (rowid, " ".join(tokenize(title or "")), " ".join(tokenize(body or "")))
+                )
+                self.indexed += 1
+
+    def remove(self, kind: str, entity_id: int):
+        row = self._db.execute("SELECT rowid FROM docs WHERE kind = ? AND id = ?", (kind, entity_id)).fetchone()
+        if row is not None:
+            self._db.execute("DELETE FROM docs_fts WHERE rowid = ?", row)
+            self._db.execute("DELETE FROM docs WHERE rowid = ?", row)
+
+    def search(
+        self,
+        query: str,
+        kinds: Optional[List[str]] = None,
+        product_id: Optional[int] = None,
+        page: int = 1,
+        limit: int = 20
+    ) -> Dict[str, Any]:
+        """Ranked, paginated matches of query, best first"""
+        self.searches += 1
+        page, limit = max(1, page), max(1, limit)
+        expression = match_expression(query)
+        if expression is None:
+            return {"query": query, "page": page, "limit": limit, "total": 0, "results": []}
+        where, args = ["docs_fts MATCH ?"], [expression]
+        if kinds:
+            where.append(f"d.kind IN ({', '.join('?' * len(kinds))})")
+            args.extend(kinds)
+        if product_id is not None:
+            where.append("d.product = ?")
+            args.append(product_id)
+        condition = " AND ".join(where)
+        total = self._db.execute(
+            f"SELECT COUNT(*) FROM docs_fts JOIN docs d ON d.rowid = docs_fts.rowid WHERE {condition}", args
+        ).fetchone()[0]
+        rows = self._db.execute(
+            f"SELECT d.kind, d.id, d.product, d.status, d.title, d.body, "
+            f"bm25(docs_fts, {TITLE_WEIGHT}, {BODY_WEIGHT}) AS score "
+            f"FROM docs_fts JOIN docs d ON d.rowid = docs_fts.rowid WHERE {condition} "
+            f"ORDER BY score LIMIT ? OFFSET ?",
+            [*args, limit, (page - 1) * limit]
+        ).fetchall()
+        return {
+            "query": query,
+            "page": page,
+            "limit": limit,
+            "total": total,
+            "results": [
+                {
+                    "kind": kind, "id": entity_id, "title": title, "status": status, "product": product,
+                    "score": round(-score, 3), "snippet": _snippet(body or "", query),
+                }
+                for kind, entity_id, product, status, title, body, score in rows
+            ],
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Index statistics; like every query, call it through ``submit``"""
+        counts = dict(self._db.execute("SELECT kind, COUNT(*) FROM docs GROUP BY kind").fetchall())
+        return {"path": self.path, "documents": counts, "indexed": self.indexed, "searches": self.searches}
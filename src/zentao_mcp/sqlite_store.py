@@ -0,0 +1,72 @@
+"""Owner-only SQLite databases worked on by one thread, shared by the local stores"""
+import asyncio
+import os
+import sqlite3
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any
+
+from .token_store import CACHE_DIR, TokenStore, private_dir
+
+
+def default_path(prefix: str, base_url: str, username: str) -> str:
+    """One database per Zentao instance and account, since visibility depends on the account"""
+    return os.path.join(CACHE_DIR, f"{prefix}-{TokenStore.make_key(base_url, username)[:16]}.sqlite3")
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """Open path in WAL mode with the database and its side files owner-only"""
+    if path == ":memory:":
+        return sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    private_dir(os.path.dirname(path))
+    # SQLite creates the -wal and -shm files with the database file's mode
+    os.close(os.open(path, os.O_RDWR | os.O_CREAT, 0o600))
+    for name in (path, f"{path}-wal", f"{path}-shm"):
+        if os.path.exists(name):
+            os.chmod(name, 0o600)
+    db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    return db
+
+
+class SQLiteStore:
+    """One connection guarded by a lock, plus one worker thread for async callers
+
+    Async callers go through :meth:`run` (or :meth:`submit`), which queues
+    the call on the worker thread so SQLite never blocks the event loop and
+    calls run in the order they were queued.
+    """
+
+    thread_name = "zentao-sqlite"
+
+    def __init__(self, path: str, schema: str):
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+        self._db = connect(self.path)
+        self._db.executescript(schema)
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix=self.thread_name)
+
+    def close(self):
+        self._worker.shutdown(wait=True)
+        with self._lock:
+            self._db.close()
+
+    def submit(self, func, *args) -> Future:
+        return self._worker.submit(func, *args)
+
+    async def run(self, func, *args) -> Any:
+        """Run a store method on the worker thread"""
+        return await asyncio.wrap_future(self._worker.submit(func, *args))
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                yield
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
@@ -0,0 +1,106 @@
+"""Persistent token cache shared by Zentao MCP processes"""
+import hashlib
+import json
+import os
+import stat
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: rely on atomic replace only
+    fcntl = None
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "zentao_mcp")
+DEFAULT_PATH = os.path.join(CACHE_DIR, "tokens.json")
+
+
+def private_dir(directory: str):
+    """Create directory owner-only, and tighten it if it already exists
+
+    makedirs leaves an existing directory's mode alone. Shared directories
+    such as /tmp (sticky) and the home directory are never changed.
+    """
+    if not directory:
+        return
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    if os.name != "posix":
+        return
+    info = os.stat(directory)
+    shared = info.st_mode & stat.S_ISVTX or os.path.samefile(directory, os.path.expanduser("~"))
+    if info.st_uid == os.getuid() and info.st_mode & 0o077 and not shared:
+        os.chmod(directory, 0o700)
+
+
+class TokenStore:
+    """JSON file of tokens keyed by ``base_url`` and ``username``
+
+    The file and its directory are kept owner-only. Writes happen under an
+    exclusive lock file and land through an atomic rename, so processes that
+    refresh at the same time never see a torn file.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = os.path.expanduser(path) if path else DEFAULT_PATH
+        self._lock_path = self.path + ".lock"
+
+    @staticmethod
+    def make_key(base_url: str, username: str) -> str:
+        return hashlib.sha256(f"{base_url.rstrip('/')}\n{username}".encode("utf-8")).hexdigest()
+
+    @contextmanager
+    def _locked(self):
+        private_dir(os.path.dirname(self.path))
+        fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, data: Dict[str, Any]):
+        directory = os.path.dirname(self.path)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tokens-")
+        try:
+            os.chmod(tmp_path, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def load(self, base_url: str, username: str) -> Optional[Tuple[str, float]]:
+        """Return the cached token and its ``time.time()`` issue time, if any"""
+        entry = self._read().get(self.make_key(base_url, username))
+        if not isinstance(entry, dict) or not entry.get("token"):
+            return None
+        return entry["token"], float(entry.get("issued_at", 0.0))
+
+    def save(self, base_url: str, username: str, token: str):
+        with self._locked():
+            data = self._read()
+            data[self.make_key(base_url, username)] = {"token": token, "issued_at": time.time()}
+            self._write(data)
+
+    def discard(self, base_url: str, username: str, token: str):
+        """Forget token, unless another process has already replaced it"""
+        key = self.make_key(base_url, username)
+        with self._locked():
+            data = self._read()
+            entry = data.get(key)
+            if isinstance(entry, dict) and entry.get("token") == token:
+                del data[key]
+                self._write(data)
@@ -0,0 +1,1059 @@
+"""Declarative registry of the MCP tools exposed by the server"""
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, Tuple, Union, Callable, Awaitable, List
+
+from mcp.types import Tool
+
+from . import jsonlib
+from .aggregate import BUG_GROUP_FIELDS, TASK_GROUP_FIELDS
+from .changes import SOURCES as CHANGE_SOURCES
+from .executor import tool_category
+from .export import FORMATS as EXPORT_FORMATS, SOURCES as EXPORT_SOURCES
+from .replica import KINDS as REPLICA_KINDS
+from .search import SEARCH_KINDS
+
+# body value meaning "every argument not consumed elsewhere goes into the payload"
+REST = "*"
+
+# Arguments besides path placeholders that a replica read can still honour
+REPLICA_ARGUMENTS = frozenset({"fields", "page", "limit"})
+
+# Optional projection argument accepted by every get_*/list_* tool
+FIELDS_PROPERTY = {
+    "type": "array",
+    "items": {"type": "string"},
+    "description": "Only return these fields of each record; dotted paths select nested fields, e.g. [\"id\", \"title\", \"status\", \"assignedTo.account\"]"
+}
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """One MCP tool: its schema, how arguments map onto a call, and what it calls
+
+    By default the tool calls the client method of the same name with
+    ``args`` passed positionally, then a payload dict built from ``body``
+    (if any), then ``options`` as keyword arguments with their defaults.
+    Tools that are not a single client call provide ``handler`` instead.
+    ``replica`` is the API path template, e.g. ``/products/{product_id}/bugs``,
+    under which the local replica can answer the call.
+    """
+    name: str
+    description: str
+    properties: Dict[str, Any] = field(default_factory=dict)
+    required: Tuple[str, ...] = ()
+    extra_properties: bool = False
+    method: Optional[str] = None
+    args: Tuple[str, ...] = ()
+    options: Dict[str, Any] = field(default_factory=dict)
+    body: Union[Tuple[str, ...], str] = ()
+    handler: Optional[Callable[[Any, dict], Awaitable[Any]]] = None
+    replica: Optional[str] = None
+    bounded: bool = True
+    projectable: bool = True
+
+    @property
+    def category(self) -> str:
+        return tool_category(self.name)
+
+    def input_schema(self) -> Dict[str, Any]:
+        properties = dict(self.properties)
+        if self.projectable and self.name.startswith(("get_", "list_")):
+            properties["fields"] = FIELDS_PROPERTY
+        schema: Dict[str, Any] = {"type": "object", "properties": properties}
+        if self.required:
+            schema["required"] = list(self.required)
+        if self.extra_properties:
+            schema["additionalProperties"] = True
+        return schema
+
+    def to_tool(self) -> Tool:
+        return Tool(name=self.name, description=self.description, inputSchema=self.input_schema())
+
+    def replica_path(self, arguments: dict) -> Optional[str]:
+        """The replica path for this call, unless it uses arguments the replica cannot honour"""
+        if self.replica is None:
+            return None
+        placeholders = {name for name in self.args if "{" + name + "}" in self.replica}
+        if set(arguments) - placeholders - REPLICA_ARGUMENTS:
+            return None
+        return self.replica.format(**arguments)
+
+    async def invoke(self, client: Any, arguments: dict) -> Any:
+        """Run the tool against client and return its raw result"""
+        if self.handler is not None:
+            return await self.handler(client, arguments)
+        path = self.replica_path(arguments)
+        if path is not None and getattr(client, "replica", None) is not None:
+            hit, result = await client.read_replica(
+                path,
+                arguments.get("page", self.options.get("page")),
+                arguments.get("limit", self.options.get("limit"))
+            )
+            if hit:
+                return result
+        call_args = [arguments[name] for name in self.args]
+        if self.body == REST:
+            consumed = set(self.args) | set(self.options) | {"fields"}
+            call_args.append({k: v for k, v in arguments.items() if k not in consumed})
+        elif self.body:
+            call_args.append({k: arguments[k] for k in self.body if k in arguments})
+        kwargs = {name: arguments.get(name, default) for name, default in self.options.items()}
+        return await getattr(client, self.method or self.name)(*call_args, **kwargs)
+
+
+class ToolRegistry:
+    """Name-indexed tool specs with a prebuilt, cached ``Tool`` list"""
+
+    def __init__(self, specs: Tuple[ToolSpec, ...] = ()):
+        self._specs: Dict[str, ToolSpec] = {}
+        self._tools: Optional[List[Tool]] = None
+        for spec in specs:
+            self.register(spec)
+
+    def register(self, spec: ToolSpec):
+        if spec.name in self._specs:
+            raise ValueError(f"Duplicate tool: {spec.name}")
+        self._specs[spec.name] = spec
+        self._tools = None
+
+    def get(self, name: str) -> Optional[ToolSpec]:
+        return self._specs.get(name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._specs
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def tools(self) -> List[Tool]:
+        if self._tools is None:
+            self._tools = [spec.to_tool() for spec in self._specs.values()]
+        return self._tools
+
+
+async def _server_stats(client: Any, arguments: dict) -> Dict[str, Any]:
+    # The server module owns the executor, resource hub and client pool
+    from .server import process_stats
+
+    shared = process_stats()
+    search = await client.search_index.run(client.search_index.stats) if client.search_index is not None else None
+    replica = await client.replica.run(client.replica.stats) if client.replica is not None else None
+    return {
+        "executor": shared["executor"],
+        "auth": client.auth_stats,
+        "connections": client.connection_stats(),
+        "retries": client.retries,
+        "circuit_breaker": client.breaker.stats(),
+        "cache": client.cache.stats() if client.cache is not None else None,
+        "coalescing": client.coalescing,
+        "replica": replica,
+        "search": search,
+        "resources": shared["resources"],
+        "client_pool": shared["client_pool"],
+        "json_backend": jsonlib.BACKEND,
+    }
+
+
+TOOLS: Tuple[ToolSpec, ...] = (
+    # ==================== Programs ====================
+    ToolSpec(
+        name="list_programs",
+        description="Get list of all programs (项目集)",
+        replica="/programs",
+        options={"order": None},
+        properties={
+            "order": {"type": "string", "description": "Sort order, e.g., 'order_asc' or 'order_desc'"},
+        },
+    ),
+    ToolSpec(
+        name="get_program",
+        description="Get details of a specific program",
+        replica="/programs/{program_id}",
+        args=("program_id",),
+        properties={
+            "program_id": {"type": "integer", "description": "Program ID"},
+        },
+        required=("program_id",),
+    ),
+    ToolSpec(
+        name="create_program",
+        description="Create a new program (创建项目集)",
+        body=("name", "parent", "PM", "budget", "begin", "end", "desc"),
+        properties={
+            "name": {"type": "string", "description": "Program name"},
+            "parent": {"type": "integer", "description": "Parent program ID (0 for top level)"},
+            "PM": {"type": "string", "description": "Program manager account"},
+            "budget": {"type": "number", "description": "Budget"},
+            "begin": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
+            "end": {"type": "string", "description": "End date (YYYY-MM-DD)"},
+            "desc": {"type": "string", "description": "Program description"},
+        },
+        required=("name", "begin", "end"),
+    ),
+    ToolSpec(
+        name="update_program",
+        description="Update a program (修改项目集). Pass the program ID plus the fields to change, e.g. name, PM, budget, end",
+        args=("program_id",),
+        body=REST,
+        properties={
+            "program_id": {"type": "integer", "description": "Program ID"},
+        },
+        required=("program_id",),
+        extra_properties=True,
+    ),
+    ToolSpec(
+        name="delete_program",
+        description="Delete a program (删除项目集)",
+        args=("program_id",),
+        properties={
+            "program_id": {"type": "integer", "description": "Program ID"},
+        },
+        required=("program_id",),
+    ),
+
+    # ==================== Products ====================
+    ToolSpec(
+        name="list_products",
+        description="Get list of all products (产品)",
+        replica="/products",
+    ),
+    ToolSpec(
+        name="get_product",
+        description="Get details of a specific product",
+        replica="/products/{product_id}",
+        args=("product_id",),
+        properties={
+            "product_id": {"type": "integer", "description": "Product ID"},
+        },
+        required=("product_id",),
+    ),
+    ToolSpec(
+        name="create_product",
+        description="Create a new product",
+        body=("name", "code", "program", "PO", "desc"),
+        properties={
+            "name": {"type": "string", "description": "Product name"},
+            "code": {"type": "string", "description": "Product code"},
+            "program": {"type": "integer", "description": "Program ID"},
+            "PO": {"type": "string", "description": "Product owner account"},
+            "desc": {"type": "string", "description": "Product description"},
+        },
+        required=("name", "code"),
+    ),
+    ToolSpec(
+        name="update_product",
+        description="Update a product (修改产品). Pass the product ID plus the fields to change, e.g. name, PO, desc",
+        args=("product_id",),
+        body=REST,
+        properties={
+            "product_id": {"type": "integer", "description": "Product ID"},
+        },
+        required=("product_id",),
+        extra_properties=True,
+    ),
+    ToolSpec(
+        name="delete_product",
+        description="Delete a product (删除产品)",
+        args=("product_id",),
+        properties={
+            "product_id": {"type": "integer", "description": "Product ID"},
+        },
+        required=("product_id",),
+    ),
+    ToolSpec(
+        name="get_product_stories",
+        description="Get stories for a product (获取产品需求列表)",
+        replica="/products/{product_id}/stories",
+        args=("product_id",),
+        properties={
+            "product_id": {"type": "integer", "description": "Product ID"},
+        },
+        required=("product_id",),
+    ),
+    ToolSpec(
+        name="get_product_bugs",
+        description="Get bugs for a product (获取产品 Bug 列表)",
+        replica="/products/{product_id}/bugs",
+        args=("product_id",),
+        properties={
+            "product_id": {"type": "integer", "description": "Product ID"},
+        },
+        required=("product_id",),
+    ),
+
+    # ==================== Projects ====================
+    ToolSpec(
+        name="list_projects",
+        description="Get list of all projects (项目)",
+        replica="/projects",
+        options={"page": 1, "limit": 20},
+        properties={
+            "page": {"type": "integer", "description": "Page number (default: 1)"},
+            "limit": {"type": "integer", "description": "Items per page (default: 20)"},
+        },
+    ),
+    ToolSpec(
+        name="get_project",
+        description="Get details of a specific project",
+        replica="/projects/{project_id}",
+        args=("project_id",),
+        properties={
+            "project_id": {"type": "integer", "description": "Project ID"},
+        },
+        required=("project_id",),
+    ),
+    ToolSpec(
+        name="create_project",
+        description="Create a new project",
+        body=("name", "code", "begin", "end", "products"),
+        properties={
+            "name": {"type": "string", "description": "Project name"},
+            "code": {"type": "string", "description": "Project code"},
+            "begin": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
+            "end": {"type": "string", "description": "End date (YYYY-MM-DD)"},
+            "products": {"type": "array", "items": {"type": "integer"}, "description": "Associated product IDs"},
+        },
+        required=("name", "code", "begin", "end", "products"),
+    ),
+    ToolSpec(
+        name="get_project_executions",
+        description="Get executions (sprints) for a project",
+        replica="/projects/{project_id}/executions",
+        args=("project_id",),
+        properties={
+            "project_id": {"type": "integer", "description": "Project ID"},
+        },
+        required=("project_id",),
+    ),
+    ToolSpec(
+        name="update_project",
+        description="Update a project (修改项目). Pass the project ID plus the fields to change, e.g. name, PM, end, status",
+        args=("project_id",),
+        body=REST,
+        properties={
+            "project_id": {"type": "integer", "description": "Project ID"},
+        },
+        required=("project_id",),
+        extra_properties=True,
+    ),
+    ToolSpec(
+        name="delete_project",
+        description="Delete a project (删除项目)",
+        args=("project_id",),
+        properties={
+            "project_id": {"type": "integer", "description": "Project ID"},
+        },
+        required=("project_id",),
+    ),
+    ToolSpec(
+        name="get_project_stories",
+        description="Get stories for a project (获取项目需求列表)",
+        args=("project_id",),
+        properties={
+            "project_id": {"type": "integer", "description": "Project ID"},
+        },
+        required=("project_id",),
+    ),
+
+    # ==================== Executions ====================
+    ToolSpec(
+        name="list_executions",
+        description="Get list of all executions (iterations/sprints)",
+        replica="/executions",
+    ),
+    ToolSpec(
+        name="get_execution",
+        description="Get details of a specific execution",
+        replica="/executions/{execution_id}",
+        args=("execution_id",),
+        properties={
+            "execution_id": {"type": "integer", "description": "Execution ID"},
+        },
+        required=("execution_id",),
+    ),
+    ToolSpec(
+        name="get_execution_tasks",
+        description="Get tasks for an execution",
+        replica="/executions/{execution_id}/tasks",
+        args=("execution_id",),
+        properties={
+            "execution_id": {"type": "integer", "description": "Execution ID"},
+        },
+        required=("execution_id",),
+    ),
+    ToolSpec(
+        name="create_execution",
+        description="Create a new execution (sprint) in a project (创建迭代)",
+        args=("project_id",),
+        body=("name", "code", "begin", "end", "days", "PM"),
+        properties={
+            "project_id": {"type": "integer", "description": "Project ID"},
+            "name": {"type": "string", "description": "Execution name"},
+            "code": {"type": "string", "description": "Execution code"},
+            "begin": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
+            "end": {"type": "string", "description": "End date (YYYY-MM-DD)"},
+            "days": {"type": "integer", "description": "Available working days"},
+            "PM": {"type": "string", "description": "Execution manager account"},
+        },
+        required=("project_id", "name", "code", "begin", "end"),
+    ),
+    ToolSpec(
+        name="update_execution",
+        description="Update an execution (修改迭代). Pass the execution ID plus the fields to change, e.g. name, end, status",
+        args=("execution_id",),
+        body=REST,
+        properties={
+            "execution_id": {"type": "integer", "description": "Execution ID"},
+        },
+        required=("execution_id",),
+        extra_properties=True,
+    ),
+    ToolSpec(
+        name="delete_execution",
+        description="Delete an execution (删除迭代)",
+        args=("execution_id",),
+        properties={
+            "execution_id": {"type": "integer", "description": "Execution ID"},
+        },
+        required=("execution_id",),
+    ),
+    ToolSpec(
+        name="get_execution_stories",
+        description="Get stories for an execution (获取迭代需求列表)",
+        args=("execution_id",),
+        properties={
+            "execution_id": {"type": "integer", "description": "Execution ID"},
+        },
+        required=("execution_id",),
+    ),
+
+    # ==================== Stories ====================
+    ToolSpec(
+        name="get_story",
+        description="Get details of a specific story (需求)",
+        replica="/stories/{story_id}",
+        args=("story_id",),
+        properties={
+            "story_id": {"type": "integer", "description": "Story ID"},
+        },
+        required=("story_id",),
+    ),
+    ToolSpec(
+        name="create_story",
+        description="Create a new story",
+        body=("title", "product", "pri", "category", "spec", "verify"),
+        properties={
+            "title": {"type": "string", "description": "Story title"},
+            "product": {"type": "integer", "description": "Product ID"},
+            "pri": {"type": "integer", "description": "Priority (1-4)"},
+            "category": {
+                "type": "string",
+                "description": "Category: feature, interface, performance, safe, experience, improve, other"
+            },
+            "spec": {"type": "string", "description": "Story specification/description"},
+            "verify": {"type": "string", "description": "Acceptance criteria"},
+        },
+        required=("title", "product", "pri", "category"),
+    ),
+    ToolSpec(
+        name="update_story",
+        description="Update a story (修改需求). Pass the story ID plus the fields to change, e.g. title, pri, assignedTo",
+        args=("story_id",),
+        body=REST,
+        properties={
+            "story_id": {"type": "integer", "description": "Story ID"},
+        },
+        required=("story_id",),
+        extra_properties=True,
+    ),
+    ToolSpec(
+        name="delete_story",
+        description="Delete a story (删除需求)",
+        args=("story_id",),
+        properties={
+            "story_id": {"type": "integer", "description": "Story ID"},
+        },
+        required=("story_id",),
+    ),
+    ToolSpec(
+        name="change_story",
+        description="Change a story, creating a new version (变更需求)",
+        args=("story_id",),
+        body=("title", "spec", "verify"),
+        properties={
+            "story_id": {"type": "integer", "description": "Story ID"},
+            "title": {"type": "string", "description": "Story title"},
+            "spec": {"type": "string", "description": "Story specification"},
+            "verify": {"type": "string", "description": "Acceptance criteria"},
+        },
+        required=("story_id",),
+    ),
+
+    # ==================== Tasks ====================
+    ToolSpec(
+        name="get_task",
+        description="Get details of a specific task",
+        replica="/tasks/{task_id}",
+        args=("task_id",),
+        properties={
+            "task_id": {"type": "integer", "description": "Task ID"},
+        },
+        required=("task_id",),
+    ),
+    ToolSpec(
+        name="create_task",
+        description="Create a new task in an execution",
+        args=("execution_id",),
+        body=("name", "type", "assignedTo", "estStarted", "deadline", "pri", "estimate"),
+        properties={
+            "execution_id": {"type": "integer", "description": "Execution ID (sprint/iteration)"},
+            "name": {"type": "string", "description": "Task name"},
+            "type": {
+                "type": "string",
+                "description": "Task type: design, devel, request, test, study, discuss, ui, affair, misc"
+            },
+            "assignedTo": {"type": "string", "description": "Assigned user account"},
+            "estStarted": {"type": "string", "description": "Estimated start date (YYYY-MM-DD)"},
+            "deadline": {"type": "string", "description": "Deadline (YYYY-MM-DD)"},
+            "pri": {"type": "integer", "description": "Priority (1-4)"},
+            "estimate": {"type": "number", "description": "Estimated hours"},
+        },
+        required=("execution_id", "name", "type", "assignedTo", "estStarted", "deadline"),
+    ),
+    ToolSpec(
+        name="update_task",
+        description="Update a task (修改任务). Pass the task ID plus the fields to change, e.g. left, consumed, status, assignedTo",
+        args=("task_id",),
+        body=REST,
+        properties={
+            "task_id": {"type": "integer", "description": "Task ID"},
+        },
+        required=("task_id",),
+        extra_properties=True,
+    ),
+    ToolSpec(
+        name="delete_task",
+        description="Delete a task (删除任务)",
+        args=("task_id",),
+        properties={
+            "task_id": {"type": "integer", "description": "Task ID"},
+        },
+        required=("task_id",),
+    ),
+
+    # ==================== Bugs ====================
+    ToolSpec(
+        name="get_bug",
+        description="Get details of a specific bug",
+        replica="/bugs/{bug_id}",
+        args=("bug_id",),
+        properties={
+            "bug_id": {"type": "integer", "description": "Bug ID"},
+        },
+        required=("bug_id",),
+    ),
+    ToolSpec(
+        name="create_bug",
+        description="Create a new bug (创建Bug)",
+        body=("product", "title", "severity", "pri", "type", "steps", "execution", "assignedTo"),
+        properties={
+            "product": {"type": "integer", "description": "Product ID"},
+            "title": {"type": "string", "description": "Bug title"},
+            "severity": {"type": "integer", "description": "Severity (1-4)"},
+            "pri": {"type": "integer", "description": "Priority (1-4)"},
+            "type": {
+                "type": "string",
+                "description": "Bug type: codeerror, config, install, security, performance, standard, automation, designdefect, others"
+            },
+            "steps": {"type": "string", "description": "Steps to reproduce"},
+            "execution": {"type": "integer", "description": "Execution ID"},
+            "assignedTo": {"type": "string", "description": "Assigned user account"},
+        },
+        required=("product", "title", "severity", "pri", "type"),
+    ),
+    ToolSpec(
+        name="update_bug",
+        description="Update a bug (修改Bug). Pass the bug ID plus the fields to change, e.g. status, assignedTo, pri",
+        args=("bug_id",),
+        body=REST,
+        properties={
+            "bug_id": {"type": "integer", "description": "Bug ID"},
+        },
+        required=("bug_id",),
+        extra_properties=True,
+    ),
+    ToolSpec(
+        name="delete_bug",
+        description="Delete a bug (删除Bug)",
+        args=("bug_id",),
+        properties={
+            "bug_id": {"type": "integer", "description": "Bug ID"},
+        },
+        required=("bug_id",),
+    ),
+
+    # ==================== Users ====================
+    ToolSpec(
+        name="list_users",
+        description="Get list of all users",
+        replica="/users",
+    ),
+    ToolSpec(
+        name="get_user",
+        description="Get details of a specific user (获取用户详情)",
+        replica="/users/{user_id}",
+        args=("user_id",),
+        properties={
+            "user_id": {"type": "integer", "description": "User ID"},
+        },
+        required=("user_id",),
+    ),
+    ToolSpec(
+        name="get_my_info",
+        description="Get current user information",
+    ),
+
+    # ==================== Test Cases ====================
+    ToolSpec(
+        name="get_product_testcases",
+        description="Get test cases for a product (获取产品测试用例列表)",
+        args=("product_id",),
+        properties={
+            "product_id": {"type": "integer", "description": "Product ID"},
+        },
+        required=("product_id",),
+    ),
+    ToolSpec(
+        name="get_testcase",
+        description="Get test case details (获取测试用例详情，包含步骤和预期结果)",
+        args=("testcase_id",),
+        properties={
+            "testcase_id": {"type": "integer", "description": "Test case ID"},
+        },
+        required=("testcase_id",),
+    ),
+    ToolSpec(
+        name="create_testcase",
+        description="Create a new test case (创建测试用例)",
+        args=("product_id",),
+        body=("title", "type", "pri", "precondition", "steps", "keywords"),
+        properties={
+            "product_id": {"type": "integer", "description": "Product ID"},
+            "title": {"type": "string", "description": "Test case title"},
+            "type": {
+                "type": "string",
+                "description": "Test case type: feature, performance, config, install, security, interface, unit, other"
+            },
+            "pri": {"type": "integer", "description": "Priority (1-4)"},
+            "precondition": {"type": "string", "description": "Precondition for the test"},
+            "steps": {
+                "type": "array",
+                "description": "Test steps",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "desc": {"type": "string", "description": "Step description"},
+                        "expect": {"type": "string", "description": "Expected result"}
+                    }
+                }
+            },
+            "keywords": {"type": "string", "description": "Keywords"},
+        },
+        required=("product_id", "title", "type"),
+    ),
+    ToolSpec(
+        name="update_testcase",
+        description="Update a test case (修改测试用例). Pass the test case ID plus the fields to change, e.g. title, pri, steps",
+        args=("testcase_id",),
+        body=REST,
+        properties={
+            "testcase_id": {"type": "integer", "description": "Test case ID"},
+        },
+        required=("testcase_id",),
+        extra_properties=True,
+    ),
+    ToolSpec(
+        name="delete_testcase",
+        description="Delete a test case (删除测试用例)",
+        args=("testcase_id",),
+        properties={
+            "testcase_id": {"type": "integer", "description": "Test case ID"},
+        },
+        required=("testcase_id",),
+    ),
+
+    # ==================== Test Tasks ====================
+    ToolSpec(
+        name="list_testtasks",
+        description="Get list of test tasks (获取测试单列表)",
+        options={"page": 1, "limit": 20},
+        properties={
+            "page": {"type": "integer", "description": "Page number (default: 1)"},
+            "limit": {"type": "integer", "description": "Items per page (default: 20)"},
+        },
+    ),
+    ToolSpec(
+        name="get_testtask",
+        description="Get test task details (获取测试单详情)",
+        args=("testtask_id",),
+        properties={
+            "testtask_id": {"type": "integer", "description": "Test task ID"},
+        },
+        required=("testtask_id",),
+    ),
+    ToolSpec(
+        name="get_project_testtasks",
+        description="Get test tasks for a project (获取项目的测试单列表)",
+        args=("project_id",),
+        properties={
+            "project_id": {"type": "integer", "description": "Project ID"},
+        },
+        required=("project_id",),
+    ),
+
+    # ==================== Product Plans ====================
+    ToolSpec(
+        name="get_product_plans",
+        description="Get plans for a product (获取产品计划列表)",
+        args=("product_id",),
+        properties={
+            "product_id": {"type": "integer", "description": "Product ID"},
+        },
+        required=("product_id",),
+    ),
+    ToolSpec(
+        name="get_plan",
+        description="Get plan details (获取计划详情，包含关联的需求和Bug)",
+        args=("plan_id",),
+        properties={
+            "plan_id": {"type": "integer", "description": "Plan ID"},
+        },
+        required=("plan_id",),
+    ),
+
+    # ==================== Builds ====================
+    ToolSpec(
+        name="get_project_builds",
+        description="Get builds for a project (获取项目版本列表)",
+        args=("project_id",),
+        properties={
+            "project_id": {"type": "integer", "description": "Project ID"},
+        },
+        required=("project_id",),
+    ),
+    ToolSpec(
+        name="get_execution_builds",
+        description="Get builds for an execution (获取迭代版本列表)",
+        args=("execution_id",),
+        properties={
+            "execution_id": {"type": "integer", "description": "Execution ID"},
+        },
+        required=("execution_id",),
+    ),
+    ToolSpec(
+        name="get_build",
+        description="Get build details (获取版本详情)",
+        args=("build_id",),
+        properties={
+            "build_id": {"type": "integer", "description": "Build ID"},
+        },
+        required=("build_id",),
+    ),
+
+    # ==================== Batch reads ====================
+    ToolSpec(
+        name="get_bugs",
+        description="Get details of many bugs by ID in one call (批量获取Bug)",
+        args=("bug_ids",),
+        properties={
+            "bug_ids": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "Bug IDs; duplicates are fetched once"
+            },
+        },
+        required=("bug_ids",),
+    ),
+    ToolSpec(
+        name="get_tasks",
+        description="Get details of many tasks by ID in one call (批量获取任务)",
+        args=("task_ids",),
+        properties={
+            "task_ids": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "Task IDs; duplicates are fetched once"
+            },
+        },
+        required=("task_ids",),
+    ),
+    ToolSpec(
+        name="get_stories",
+        description="Get details of many stories by ID in one call (批量获取需求)",
+        args=("story_ids",),
+        properties={
+            "story_ids": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "Story IDs; duplicates are fetched once"
+            },
+        },
+        required=("story_ids",),
+    ),
+    ToolSpec(
+        name="get_testcases",
+        description="Get details of many test cases by ID in one call (批量获取测试用例)",
+        args=("testcase_ids",),
+        properties={
+            "testcase_ids": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "Test case IDs; duplicates are fetched once"
+            },
+        },
+        required=("testcase_ids",),
+    ),
+
+    # ==================== Batch writes ====================
+    ToolSpec(
+        name="batch_create_tasks",
+        description="Create many tasks in an execution in one call (批量创建任务). Returns a per-item result table; failed items are listed under 'retry'",
+        args=("execution_id", "tasks"),
+        properties={
+            "execution_id": {"type": "integer", "description": "Execution ID (sprint/iteration)"},
+            "tasks": {
+                "type": "array",
+                "description": "Tasks to create, same fields as create_task",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string", "description": "Task name"},
+                        "type": {
+                            "type": "string",
+                            "description": "Task type: design, devel, request, test, study, discuss, ui, affair, misc"
+                        },
+                        "assignedTo": {"type": "string", "description": "Assigned user account"},
+                        "estStarted": {"type": "string", "description": "Estimated start date (YYYY-MM-DD)"},
+                        "deadline": {"type": "string", "description": "Deadline (YYYY-MM-DD)"},
+                        "pri": {"type": "integer", "description": "Priority (1-4)"},
+                        "estimate": {"type": "number", "description": "Estimated hours"}
+                    },
+                    "required": ["name", "type", "assignedTo", "estStarted", "deadline"]
+                }
+            },
+        },
+        required=("execution_id", "tasks"),
+    ),
+    ToolSpec(
+        name="batch_update_tasks",
+        description="Update many tasks in one call (批量修改任务). Each item has the task 'id' plus the fields to change",
+        args=("tasks",),
+        properties={
+            "tasks": {
+                "type": "array",
+                "description": "Task updates, e.g. {\"id\": 5, \"left\": 2, \"assignedTo\": \"zhangsan\"}",
+                "items": {
+                    "type": "object",
+                    "properties": {"id": {"type": "integer", "description": "Task ID"}},
+                    "required": ["id"]
+                }
+            },
+        },
+        required=("tasks",),
+    ),
+    ToolSpec(
+        name="batch_update_bugs",
+        description="Update many bugs in one call (批量修改Bug). Each item has the bug 'id' plus the fields to change",
+        args=("bugs",),
+        properties={
+            "bugs": {
+                "type": "array",
+                "description": "Bug updates, e.g. {\"id\": 12, \"assignedTo\": \"lisi\", \"pri\": 2}",
+                "items": {
+                    "type": "object",
+                    "properties": {"id": {"type": "integer", "description": "Bug ID"}},
+                    "required": ["id"]
+                }
+            },
+        },
+        required=("bugs",),
+    ),
+    ToolSpec(
+        name="batch_create_testcases",
+        description="Create many test cases in a product in one call (批量创建测试用例). Returns a per-item result table; failed items are listed under 'retry'",
+        args=("product_id", "testcases"),
+        properties={
+            "product_id": {"type": "integer", "description": "Product ID"},
+            "testcases": {
+                "type": "array",
+                "description": "Test cases to create, same fields as create_testcase",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "title": {"type": "string", "description": "Test case title"},
+                        "type": {
+                            "type": "string",
+                            "description": "Test case type: feature, performance, config, install, security, interface, unit, other"
+                        },
+                        "pri": {"type": "integer", "description": "Priority (1-4)"},
+                        "precondition": {"type": "string", "description": "Precondition for the test"},
+                        "steps": {
+                            "type": "array",
+                            "description": "Test steps",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "desc": {"type": "string", "description": "Step description"},
+                                    "expect": {"type": "string", "description": "Expected result"}
+                                }
+                            }
+                        },
+                        "keywords": {"type": "string", "description": "Keywords"}
+                    },
+                    "required": ["title", "type"]
+                }
+            },
+        },
+        required=("product_id", "testcases"),
+    ),
+
+    # ==================== Aggregations ====================
+    ToolSpec(
+        name="bug_stats",
+        description="Count a product's bugs grouped by chosen fields (Bug 统计), e.g. open severity-1 bugs per module. Reads every page on the server side and returns only the aggregate table",
+        args=("product_id",),
+        options={"group_by": None, "filters": None},
+        properties={
+            "product_id": {"type": "integer", "description": "Product ID"},
+            "group_by": {
+                "type": "array",
+                "items": {"type": "string", "enum": list(BUG_GROUP_FIELDS)},
+                "description": "Fields to group by (default: [\"status\"])"
+            },
+            "filters": {
+                "type": "object",
+                "description": "Only count bugs whose field is one of the given values, e.g. {\"status\": [\"active\"], \"severity\": [1]}",
+                "additionalProperties": {"type": "array"}
+            },
+        },
+        required=("product_id",),
+    ),
+    ToolSpec(
+        name="task_stats",
+        description="Count an execution's tasks and sum estimate/consumed/left hours grouped by chosen fields (任务统计), e.g. per assignee and status. Returns only the aggregate table",
+        args=("execution_id",),
+        options={"group_by": None, "filters": None},
+        properties={
+            "execution_id": {"type": "integer", "description": "Execution ID"},
+            "group_by": {
+                "type": "array",
+                "items": {"type": "string", "enum": list(TASK_GROUP_FIELDS)},
+                "description": "Fields to group by (default: [\"status\"])"
+            },
+            "filters": {
+                "type": "object",
+                "description": "Only count tasks whose field is one of the given values, e.g. {\"status\": [\"wait\", \"doing\"]}",
+                "additionalProperties": {"type": "array"}
+            },
+        },
+        required=("execution_id",),
+    ),
+
+    ToolSpec(
+        name="execution_report",
+        description="Progress report of an execution (迭代进度报告): estimate/consumed/left totals, per-assignee open load, overdue tasks and a daily burndown series",
+        args=("execution_id",),
+        options={"today": None},
+        properties={
+            "execution_id": {"type": "integer", "description": "Execution ID"},
+            "today": {"type": "string", "description": "Report date (YYYY-MM-DD) for overdue and burndown (default: today)"},
+        },
+        required=("execution_id",),
+    ),
+
+    # ==================== Local replica ====================
+    ToolSpec(
+        name="sync_replica",
+        description="Sync the local replica of Zentao (同步本地副本). Incremental by last-edited date unless full is set; read tools answer from the replica while it is fresh",
+        options={"kinds": None, "full": False},
+        properties={
+            "kinds": {
+                "type": "array",
+                "items": {"type": "string", "enum": list(REPLICA_KINDS)},
+                "description": "Kinds to sync (default: all)"
+            },
+            "full": {"type": "boolean", "description": "Re-read everything and drop entities deleted in Zentao (default: false)"},
+        },
+    ),
+
+    # ==================== Search ====================
+    ToolSpec(
+        name="search",
+        description="Full-text search over bugs, stories, tasks and test cases (全文搜索), ranked best first. Matches titles, steps, desc, spec and verify; Chinese and English. Covers entities this server has fetched or synced",
+        args=("query",),
+        options={"kinds": None, "product_id": None, "page": 1, "limit": 20},
+        properties={
+            "query": {"type": "string", "description": "Search text, e.g. '登录超时' or 'login timeout'"},
+            "kinds": {
+                "type": "array",
+                "items": {"type": "string", "enum": list(SEARCH_KINDS)},
+                "description": "Only these kinds (default: all)"
+            },
+            "product_id": {"type": "integer", "description": "Only entities of this product"},
+            "page": {"type": "integer", "description": "Page number (default: 1)"},
+            "limit": {"type": "integer", "description": "Results per page (default: 20)"},
+        },
+        required=("query",),
+    ),
+
+    # ==================== Change feeds ====================
+    ToolSpec(
+        name="changes_since",
+        description="Records of a list created, edited or closed since a cursor (增量变更), e.g. bugs of a product or tasks of an execution. Call without cursor to get the first one, then pass the returned cursor on each poll; a poll with no changes is one small request",
+        args=("source", "entity_id"),
+        options={"cursor": None},
+        properties={
+            "source": {"type": "string", "enum": list(CHANGE_SOURCES), "description": "Which list to watch"},
+            "entity_id": {"type": "integer", "description": "Product, project or execution ID the list belongs to"},
+            "cursor": {"type": "string", "description": "Cursor returned by the previous call (omit to start)"},
+            "fields": FIELDS_PROPERTY,
+        },
+        required=("source", "entity_id"),
+    ),
+
+    # ==================== Export ====================
+    ToolSpec(
+        name="export",
+        description="Export every record of a list (导出), e.g. all bugs or test cases of a product, to an XLSX, CSV or JSONL file on the server. Streams page by page and returns the file path with a row count and status summary instead of the records",
+        args=("source",),
+        options={"entity_id": None, "format": "xlsx", "columns": None, "filename": None, "overwrite": False},
+        properties={
+            "source": {
+                "type": "string",
+                "enum": list(EXPORT_SOURCES),
+                "description": "What to export; product_*/project_*/execution_* sources need entity_id"
+            },
+            "entity_id": {"type": "integer", "description": "Product, project or execution ID for scoped sources"},
+            "format": {"type": "string", "enum": list(EXPORT_FORMATS), "description": "File format (default: xlsx)"},
+            "columns": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Columns to write, dotted paths allowed, e.g. [\"id\", \"title\", \"assignedTo.realname\"] (default: common fields of the kind; JSONL writes whole records)"
+            },
+            "filename": {"type": "string", "description": "File name inside the export directory (default: source, ID, timestamp and a random suffix)"},
+            "overwrite": {"type": "boolean", "description": "Replace an existing file of the same name (default: false)"},
+        },
+        required=("source",),
+    ),
+
+    # ==================== Server ====================
+    ToolSpec(
+        name="get_server_stats",
+        description="Get MCP server statistics (tool concurrency, queue wait times, connection reuse, retries, circuit breaker, cache hit rate, coalesced requests)",
+        handler=_server_stats,
+        bounded=False,
+        projectable=False,
+    ),
+)
+
+registry = ToolRegistry(TOOLS)
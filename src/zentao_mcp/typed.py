@@ -0,0 +1,236 @@
+"""Typed client mode: responses validated into the models in :mod:`zentao_mcp.models`"""
+import inspect
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple, Type, Annotated, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+
+from .models import (
+    Bug, BugList, Execution, ExecutionList, Product, ProductList, Program, ProgramList,
+    Project, ProjectList, Story, StoryList, Task, TaskList, User,
+)
+
+# Client method -> model its response is validated into
+METHOD_MODELS: Dict[str, Type[BaseModel]] = {
+    "list_programs": ProgramList,
+    "get_program": Program,
+    "list_products": ProductList,
+    "get_product": Product,
+    "get_product_stories": StoryList,
+    "get_product_bugs": BugList,
+    "list_projects": ProjectList,
+    "get_project": Project,
+    "get_project_executions": ExecutionList,
+    "get_project_stories": StoryList,
+    "list_executions": ExecutionList,
+    "get_execution": Execution,
+    "get_execution_stories": StoryList,
+    "get_execution_tasks": TaskList,
+    "get_story": Story,
+    "get_task": Task,
+    "get_bug": Bug,
+    "get_user": User,
+    "get_my_info": User,
+    "iter_products": Product,
+    "iter_product_stories": Story,
+    "iter_product_bugs": Bug,
+    "iter_projects": Project,
+    "iter_project_executions": Execution,
+    "iter_project_stories": Story,
+    "iter_executions": Execution,
+    "iter_execution_stories": Story,
+    "iter_execution_tasks": Task,
+}
+
+
+# ==================== Adapters ====================
+
+@lru_cache(maxsize=None)
+def list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """Reusable adapter validating a whole ``List[model]`` in one call"""
+    return TypeAdapter(List[model])
+
+
+@lru_cache(maxsize=None)
+def field_adapter(model: Type[BaseModel], name: str) -> TypeAdapter:
+    """Adapter for a single field of ``model``, including its validators"""
+    field = model.model_fields[name]
+    annotation = field.annotation
+    if field.metadata:
+        annotation = Annotated[(annotation, *field.metadata)]
+    return TypeAdapter(annotation)
+
+
+@lru_cache(maxsize=None)
+def list_field(list_model: Type[BaseModel]) -> Optional[Tuple[str, Type[BaseModel]]]:
+    """Name and item model of the ``List[...]`` field of a list response model"""
+    for name, field in list_model.model_fields.items():
+        if get_origin(field.annotation) in (list, List):
+            (item_model,) = get_args(field.annotation)
+            return name, item_model
+    return None
+
+
+# ==================== Lazy views ====================
+
+class LazyRecord:
+    """Read-only view of a raw record that validates each field the first time it is read
+
+    Declared fields come back typed exactly as on the model; undeclared
+    fields are returned raw. :meth:`validate` builds the full model.
+    """
+    __slots__ = ("_model", "_raw", "_values")
+
+    def __init__(self, model: Type[BaseModel], raw: Dict[str, Any]):
+        self._model = model
+        self._raw = raw
+        self._values: Dict[str, Any] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        field = self._model.model_fields.get(name)
+        if field is None:
+            if name in self._raw:
+                return self._raw[name]
+            raise AttributeError(f"{self._model.__name__} has no field {name!r}")
+        if name in self._raw:
+            value = field_adapter(self._model, name).validate_python(self._raw[name])
+        elif field.is_required():
+            # Raises the same ValidationError the eager mode would
+            self.validate()
+        else:
+            value = field.get_default(call_default_factory=True)
+        self._values[name] = value
+        return value
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        return self._raw
+
+    def validate(self) -> BaseModel:
+        """Validate the whole record into its model"""
+        return self._model.model_validate(self._raw)
+
+    def __repr__(self) -> str:
+        return f"LazyRecord[{self._model.__name__}](id={self._raw.get('id')!r})"
+
+
+class LazyList(Sequence):
+    """Sequence of :class:`LazyRecord` views created on indexing, not up front"""
+
+    def __init__(self, model: Type[BaseModel], records: List[Dict[str, Any]]):
+        self._model = model
+        self._records = records
+        self._views: List[Optional[LazyRecord]] = [None] * len(records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._records)))]
+        view = self._views[index]
+        if view is None:
+            view = self._views[index] = LazyRecord(self._model, self._records[index])
+        return view
+
+    @property
+    def raw(self) -> List[Dict[str, Any]]:
+        return self._records
+
+    def validate(self) -> List[BaseModel]:
+        """Validate every record in one bulk call"""
+        return list_adapter(self._model).validate_python(self._records)
+
+    def __repr__(self) -> str:
+        return f"LazyList[{self._model.__name__}](len={len(self._records)})"
+
+
+# ==================== Conversion ====================
+
+def to_model(model: Type[BaseModel], result: Any, lazy: bool = False) -> Any:
+    """Validate a decoded response into ``model``
+
+    List responses are validated in a single call through the model's
+    compiled validator. With ``lazy`` the envelope is built without
+    validation and the list becomes a :class:`LazyList`, so only the
+    records and fields actually read are ever validated.
+    """
+    if not isinstance(result, dict):
+        return result
+    if not lazy:
+        return model.model_validate(result)
+    spec = list_field(model)
+    if spec is None:
+        return LazyRecord(model, result)
+    name, item_model = spec
+    values = {key: value for key, value in result.items() if key != name}
+    values[name] = LazyList(item_model, result.get(name) or [])
+    return model.model_construct(**values)
+
+
+def to_item(model: Type[BaseModel], record: Any, lazy: bool = False) -> Any:
+    """Validate one streamed record into ``model``"""
+    if not isinstance(record, dict):
+        return record
+    return LazyRecord(model, record) if lazy else model.model_validate(record)
+
+
+class TypedZentaoClient:
+    """Wrap a client so its read methods return models instead of dicts
+
+    Works over both :class:`AsyncZentaoClient` and :class:`ZentaoClient`:
+    methods listed in ``METHOD_MODELS`` return validated models (or lazy
+    views with ``lazy=True``); everything else passes through unchanged.
+    """
+
+    def __init__(self, client: Any, lazy: bool = False):
+        self._client = client
+        self.lazy = lazy
+
+    @property
+    def client(self) -> Any:
+        return self._client
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "_client":
+            raise AttributeError(name)
+        attr = getattr(self._client, name)
+        model = METHOD_MODELS.get(name)
+        if model is None or not callable(attr):
+            return attr
+        lazy = self.lazy
+
+        if name.startswith("iter_"):
+            def iterate(*args, **kwargs):
+                records = attr(*args, **kwargs)
+                if hasattr(records, "__aiter__"):
+                    return _typed_async_iter(records, model, lazy)
+                return (to_item(model, record, lazy) for record in records)
+
+            iterate.__name__ = name
+            iterate.__doc__ = attr.__doc__
+            return iterate
+
+        def call(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            if inspect.isawaitable(result):
+                return _typed_result(result, model, lazy)
+            return to_model(model, result, lazy)
+
+        call.__name__ = name
+        call.__doc__ = attr.__doc__
+        return call
+
+
+async def _typed_result(awaitable, model: Type[BaseModel], lazy: bool) -> Any:
+    return to_model(model, await awaitable, lazy)
+
+
+async def _typed_async_iter(records, model: Type[BaseModel], lazy: bool):
+    async for record in records:
+        yield to_item(model, record, lazy)
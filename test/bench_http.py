@@ -0,0 +1,125 @@
+"""Load test: many concurrent MCP sessions against one HTTP server process
+
+Run with ``python test/bench_http.py [sessions] [calls_per_session]``. The
+server talks to an in-process fake Zentao that adds 20 ms per request.
+"""
+import asyncio
+import contextlib
+import logging
+import os
+import statistics
+import sys
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import uvicorn
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+from mcp.client.streamable_http import streamable_http_client
+
+from fake_zentao import FakeZentao, make_async_client, make_config
+from zentao_mcp import server
+from zentao_mcp.http_server import create_app
+from zentao_mcp.pool import ClientPool
+
+# Tool calls cycled through by every session
+CALLS = (
+    ("get_product", {"product_id": 1}),
+    ("list_users", {}),
+    ("get_bug", {"bug_id": 1}),
+    ("get_product_bugs", {"product_id": 1}),
+)
+
+
+def make_fake(delay: float = 0.02) -> FakeZentao:
+    fake = FakeZentao(delay=delay)
+    for i in range(1, 51):
+        fake.add("bugs", {"id": i, "product": 1, "title": f"bug {i}", "status": "active"})
+    return fake
+
+
+@contextlib.asynccontextmanager
+async def running_server(fake: FakeZentao, allow_anonymous: bool = True, **config_overrides):
+    """Serve the MCP app on a free local port, backed by ``fake``; yields the base URL
+
+    Sessions without credentials share the configured account unless
+    ``allow_anonymous`` is off.
+    """
+    server._client = make_async_client(fake, **config_overrides)
+    server._pool = ClientPool(
+        make_config(allow_anonymous=allow_anonymous, **config_overrides), transport=fake.transport()
+    )
+    config = uvicorn.Config(create_app(), host="127.0.0.1", port=0, log_level="warning", lifespan="on")
+    http = uvicorn.Server(config)
+    task = asyncio.create_task(http.serve())
+    while not http.started:
+        if task.done():
+            task.result()
+        await asyncio.sleep(0.01)
+    port = http.servers[0].sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        http.should_exit = True
+        await task
+
+
+async def run_session(base_url: str, calls: int, latencies: list, transport: str = "http") -> int:
+    """Open one MCP session, make ``calls`` tool calls, return how many succeeded"""
+    connect = streamable_http_client(f"{base_url}/mcp/") if transport == "http" else sse_client(f"{base_url}/sse")
+    ok = 0
+    async with connect as streams:
+        async with ClientSession(streams[0], streams[1]) as session:
+            await session.initialize()
+            for i in range(calls):
+                name, arguments = CALLS[i % len(CALLS)]
+                start = time.perf_counter()
+                result = await session.call_tool(name, arguments)
+                latencies.append(time.perf_counter() - start)
+                ok += not result.content[0].text.startswith("Error")
+    return ok
+
+
+async def load(sessions: int, calls: int, **config_overrides) -> dict:
+    fake = make_fake()
+    latencies: list = []
+    async with running_server(fake, **config_overrides) as base_url:
+        start = time.perf_counter()
+        succeeded = await asyncio.gather(*(run_session(base_url, calls, latencies) for _ in range(sessions)))
+        elapsed = time.perf_counter() - start
+        client = server._client
+        stats = {
+            "cache": client.cache.stats() if client.cache is not None else None,
+            "connections": client.connection_stats(),
+        }
+    latencies.sort()
+    return {
+        "sessions": sessions,
+        "calls": len(latencies),
+        "succeeded": sum(succeeded),
+        "elapsed": elapsed,
+        "calls_per_second": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "zentao_requests": len(fake.calls),
+        "logins": fake.token_requests,
+        **stats,
+    }
+
+
+def main(sessions: int = 50, calls: int = 20):
+    logging.disable(logging.INFO)
+    for label, overrides in (("cache on", {"cache_enabled": True}), ("cache off", {"cache_enabled": False})):
+        result = asyncio.run(load(sessions, calls, **overrides))
+        print(
+            f"{label}: {result['sessions']} sessions, {result['calls']} calls ({result['succeeded']} ok) "
+            f"in {result['elapsed']:.2f} s = {result['calls_per_second']:.0f} calls/s, "
+            f"p50 {result['p50_ms']:.1f} ms, p95 {result['p95_ms']:.1f} ms, "
+            f"{result['zentao_requests']} Zentao requests, {result['logins']} login(s)"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
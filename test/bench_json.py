@@ -0,0 +1,42 @@
+"""Benchmark: stdlib JSON vs the fast backend on a Zentao bug list
+
+Run with ``python test/bench_json.py [bug_count]``.
+"""
+import json
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import httpx
+
+from bench_output import make_bug, measure
+from zentao_mcp import jsonlib
+
+
+def main(count: int = 5000):
+    payload = {"page": 1, "total": count, "limit": count, "bugs": [make_bug(i) for i in range(1, count + 1)]}
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+    def parse_via_text():
+        # Previous path: decode the body to str, then parse the str
+        return json.loads(httpx.Response(200, content=body).text)
+
+    cases = [
+        ("parse: stdlib via text", parse_via_text),
+        (f"parse: {jsonlib.BACKEND} from bytes", lambda: jsonlib.loads(httpx.Response(200, content=body).content)),
+        ("dump: stdlib indent=2", lambda: json.dumps(payload, indent=2, ensure_ascii=False)),
+        (f"dump: {jsonlib.BACKEND} indent=2", lambda: jsonlib.dumps(payload)),
+        ("dump: stdlib compact", lambda: json.dumps(payload, ensure_ascii=False, separators=(",", ":"))),
+        (f"dump: {jsonlib.BACKEND} compact", lambda: jsonlib.dumps(payload, compact=True)),
+    ]
+
+    print(f"{count} bugs, {len(body) / 1e6:.2f} MB response body, backend: {jsonlib.BACKEND}")
+    print(f"{'case':<28}{'ms':>10}")
+    for label, func in cases:
+        print(f"{label:<28}{measure(func) * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,71 @@
+"""Benchmark: tool output size and serialization time, full vs compact vs projected
+
+Run with ``python test/bench_output.py [bug_count]``.
+"""
+import os
+import sys
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from zentao_mcp.output import render
+
+
+def make_user(account: str) -> dict:
+    return {"id": 17, "account": account, "avatar": "/data/upload/1/avatar.png", "realname": "张三"}
+
+
+def make_bug(bug_id: int) -> dict:
+    """A bug record shaped like Zentao's /products/{id}/bugs response"""
+    return {
+        "id": bug_id, "project": 12, "product": 3, "injection": 0, "identify": 0, "branch": 0,
+        "module": 41, "execution": 57, "plan": 0, "story": 880, "storyVersion": 1, "task": 0,
+        "toTask": 0, "toStory": 0, "title": f"登录页面在网络较慢时超时无提示 #{bug_id}",
+        "keywords": "login,timeout", "severity": 2, "pri": 2, "type": "codeerror",
+        "os": "all", "browser": "chrome", "hardware": "", "found": "", "status": "active",
+        "subStatus": "", "color": "", "confirmed": 1, "activatedCount": 0,
+        "activatedDate": None, "feedbackBy": "", "notifyEmail": "", "mailto": [],
+        "openedBy": make_user("lisi"), "openedDate": "2024-03-01T09:12:45Z", "openedBuild": "trunk",
+        "assignedTo": make_user("zhangsan"), "assignedDate": "2024-03-02T10:00:00Z",
+        "deadline": None, "resolvedBy": None, "resolution": "", "resolvedBuild": "",
+        "resolvedDate": None, "closedBy": None, "closedDate": None, "duplicateBug": 0,
+        "linkBug": "", "case": 0, "caseVersion": 1, "result": 0, "repo": 0, "entry": "",
+        "lines": "", "v1": "", "v2": "", "repoType": "", "testtask": 0,
+        "lastEditedBy": make_user("lisi"), "lastEditedDate": "2024-03-05T16:20:00Z",
+        "deleted": False, "steps": "<p>[步骤] 打开登录页，输入账号密码，限速到 2G</p><p>[结果] 无任何提示</p>",
+        "statusName": "激活", "productName": "禅道 MCP", "projectName": "效能平台",
+    }
+
+
+def measure(func, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(count: int = 2000):
+    payload = {"page": 1, "total": count, "limit": count, "bugs": [make_bug(i) for i in range(1, count + 1)]}
+    fields = ["id", "title", "status", "severity", "pri", "assignedTo.account"]
+    cases = [
+        ("indent=2, all fields", lambda: render(payload)),
+        ("compact, all fields", lambda: render(payload, compact=True)),
+        ("compact, 6 fields", lambda: render(payload, fields=fields, compact=True)),
+    ]
+
+    print(f"{count} bugs")
+    print(f"{'mode':<24}{'bytes':>12}{'ms':>10}{'size':>8}{'time':>8}")
+    base_bytes = base_time = None
+    for label, func in cases:
+        size = len(func().encode("utf-8"))
+        elapsed = measure(func)
+        base_bytes = base_bytes or size
+        base_time = base_time or elapsed
+        print(f"{label:<24}{size:>12,}{elapsed * 1000:>10.1f}{size / base_bytes:>8.0%}{elapsed / base_time:>8.0%}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,51 @@
+"""Benchmark: raw dicts vs eager vs lazy model validation on a Zentao bug list
+
+Run with ``python test/bench_typed.py [bug_count]``.
+"""
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bench_output import make_bug, measure
+from zentao_mcp.models import Bug, BugList
+from zentao_mcp.typed import to_model
+
+
+def per_item(payload: dict) -> list:
+    # Naive approach: construct every model separately
+    return [Bug(**record) for record in payload["bugs"]]
+
+
+def main(count: int = 10000):
+    payload = {"page": 1, "total": count, "limit": count, "bugs": [make_bug(i) for i in range(1, count + 1)]}
+
+    def first_page(bugs) -> list:
+        return [(bug["id"], bug["title"]) if isinstance(bug, dict) else (bug.id, bug.title) for bug in bugs[:20]]
+
+    def severities(bugs) -> int:
+        return sum(bug["severity"] if isinstance(bug, dict) else bug.severity for bug in bugs)
+
+    cases = [
+        ("raw: build", lambda: payload["bugs"]),
+        ("raw: build + first 20", lambda: first_page(payload["bugs"])),
+        ("raw: build + scan field", lambda: severities(payload["bugs"])),
+        ("per-item: build", lambda: per_item(payload)),
+        ("eager: build", lambda: to_model(BugList, payload).bugs),
+        ("eager: build + first 20", lambda: first_page(to_model(BugList, payload).bugs)),
+        ("eager: build + scan field", lambda: severities(to_model(BugList, payload).bugs)),
+        ("lazy: build", lambda: to_model(BugList, payload, lazy=True).bugs),
+        ("lazy: build + first 20", lambda: first_page(to_model(BugList, payload, lazy=True).bugs)),
+        ("lazy: build + scan field", lambda: severities(to_model(BugList, payload, lazy=True).bugs)),
+        ("lazy: build + validate all", lambda: to_model(BugList, payload, lazy=True).bugs.validate()),
+    ]
+
+    print(f"{count} bugs")
+    print(f"{'case':<30}{'ms':>10}")
+    for label, func in cases:
+        print(f"{label:<30}{measure(func) * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
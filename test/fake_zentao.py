@@ -0,0 +1,133 @@
+"""In-process fake of the Zentao REST API for offline tests"""
+import asyncio
+import sys
+import os
+from typing import Optional
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import httpx
+
+from zentao_mcp.client import AsyncZentaoClient
+from zentao_mcp.config import ZentaoConfig
+
+# Collection name -> field on each record that links it to a parent collection
+PARENT_FIELDS = {
+    "bugs": {"products": "product", "projects": "project", "executions": "execution"},
+    "stories": {"products": "product", "projects": "project", "executions": "execution"},
+    "tasks": {"executions": "execution", "projects": "project"},
+    "testcases": {"products": "product"},
+    "executions": {"projects": "project"},
+}
+
+
+def make_config(**overrides) -> ZentaoConfig:
+    return ZentaoConfig(
+        base_url="http://zentao.test",
+        username="tester",
+        password="secret",
+        **overrides
+    )
+
+
+class FakeZentao:
+    """Minimal Zentao API used as an httpx mock transport"""
+
+    def __init__(self, delay: float = 0.0, honor_order: bool = True, max_limit: Optional[int] = None):
+        self.delay = delay
+        self.honor_order = honor_order
+        # Like instances that cap the page size below what was asked for
+        self.max_limit = max_limit
+        self.calls = []
+        self.token_requests = 0
+        self.logins = []
+        # Account -> password; accounts not listed log in with any password
+        self.passwords = {}
+        self.valid_token = "token-1"
+        self.data = {
+            "products": {1: {"id": 1, "name": "P"}},
+            "projects": {},
+            "executions": {},
+            "users": {1: {"id": 1, "account": "admin"}},
+            "bugs": {},
+            "stories": {},
+            "tasks": {},
+            "testcases": {},
+        }
+
+    def add(self, kind: str, record: dict):
+        self.data[kind][record["id"]] = record
+
+    def count(self, method: str, path: str) -> int:
+        return self.calls.count((method, path))
+
+    def _page(self, kind: str, records: list, params) -> httpx.Response:
+        page = int(params.get("page", 1))
+        limit = int(params.get("limit", 20))
+        if self.max_limit is not None:
+            limit = min(limit, self.max_limit)
+        order = params.get("order")
+        if order and self.honor_order:
+            field, _, direction = order.rpartition("_")
+            # Like MySQL, missing values sort lowest
+            records = sorted(records, key=lambda r: (r.get(field) is not None, r.get(field) or 0),
+                             reverse=direction == "desc")
+        start = (page - 1) * limit
+        return httpx.Response(200, json={
+            "page": page,
+            "total": len(records),
+            "limit": limit,
+            kind: records[start:start + limit],
+        })
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.replace("/api.php/v1", "")
+        self.calls.append((request.method, path))
+        if path == "/tokens":
+            self.token_requests += 1
+            credentials = httpx.Response(200, content=request.content).json()
+            self.logins.append(credentials.get("account"))
+            expected = self.passwords.get(credentials.get("account"))
+            if expected is not None and credentials.get("password") != expected:
+                return httpx.Response(401, json={"error": "Invalid credentials"})
+            return httpx.Response(201, json={"token": self.valid_token})
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if request.headers.get("Token") != self.valid_token:
+            return httpx.Response(401, json={"error": "Unauthorized"})
+
+        parts = path.strip("/").split("/")
+        params = request.url.params
+        if len(parts) == 1 and parts[0] in self.data:
+            return self._page(parts[0], list(self.data[parts[0]].values()), params)
+        if len(parts) == 2 and parts[0] in self.data:
+            kind, record_id = parts[0], int(parts[1])
+            record = self.data[kind].get(record_id)
+            if record is None:
+                return httpx.Response(404, json={"error": "Not found"})
+            if request.method == "PUT":
+                record.update(httpx.Response(200, content=request.content).json())
+            elif request.method == "DELETE":
+                del self.data[kind][record_id]
+                return httpx.Response(200, json={"message": "success"})
+            return httpx.Response(200, json=record)
+        if len(parts) == 3 and parts[2] in PARENT_FIELDS and parts[0] in PARENT_FIELDS[parts[2]]:
+            parent, parent_id, kind = parts[0], int(parts[1]), parts[2]
+            field = PARENT_FIELDS[kind][parent]
+            if request.method == "POST":
+                record = httpx.Response(200, content=request.content).json()
+                record["id"] = max(self.data[kind], default=0) + 1
+                record[field] = parent_id
+                self.add(kind, record)
+                return httpx.Response(201, json=record)
+            records = [r for r in self.data[kind].values() if r.get(field) == parent_id]
+            return self._page(kind, records, params)
+        return httpx.Response(404, json={"error": "Not found"})
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handler)
+
+
+def make_async_client(fake: FakeZentao, **overrides) -> AsyncZentaoClient:
+    return AsyncZentaoClient(make_config(**overrides), transport=fake.transport())
@@ -0,0 +1,92 @@
+"""Tests for streamed bug and task statistics"""
+import asyncio
+import tracemalloc
+from collections import Counter
+
+from fake_zentao import FakeZentao, make_async_client
+from zentao_mcp.aggregate import aggregate
+
+RECORDS = 50_000
+USERS = ["zhangsan", "lisi", "wangwu", ""]
+
+
+def make_bug(i: int) -> dict:
+    return {
+        "id": i, "product": 1, "title": f"bug {i}", "module": i % 7, "severity": i % 4 + 1, "pri": i % 3 + 1,
+        "status": ("active", "resolved", "closed")[i % 3],
+        "assignedTo": {"id": i % 4, "account": USERS[i % 4]},
+    }
+
+
+async def stream(count: int):
+    for i in range(1, count + 1):
+        yield make_bug(i)
+
+
+def expected(count: int, group_by, keep=lambda bug: True) -> Counter:
+    counts = Counter()
+    for i in range(1, count + 1):
+        bug = make_bug(i)
+        if keep(bug):
+            counts[tuple(bug[f]["account"] or None if f == "assignedTo" else bug[f] for f in group_by)] += 1
+    return counts
+
+
+def test_aggregate_50k_records_matches_naive_count():
+    result = asyncio.run(aggregate(
+        stream(RECORDS), ["module", "assignedTo"], {"status": ["active"], "severity": [1, "2"]}
+    ))
+    counts = expected(RECORDS, ["module", "assignedTo"],
+                      lambda bug: bug["status"] == "active" and bug["severity"] in (1, 2))
+    assert result["scanned"] == RECORDS
+    assert result["total"] == sum(counts.values())
+    assert {(row["module"], row["assignedTo"]): row["count"] for row in result["groups"]} == counts
+    assert [row["count"] for row in result["groups"]] == sorted(counts.values(), reverse=True)
+
+
+def test_aggregate_memory_does_not_grow_with_record_count():
+    def peak(count: int) -> int:
+        tracemalloc.start()
+        asyncio.run(aggregate(stream(count), ["status", "severity"]))
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak_bytes
+
+    assert peak(RECORDS) < 2 * peak(RECORDS // 10) + 64 * 1024
+
+
+def test_bug_stats_streams_all_pages():
+    fake = FakeZentao()
+    for i in range(1, RECORDS + 1):
+        fake.add("bugs", make_bug(i))
+
+    async def run():
+        async with make_async_client(fake, page_size=1000, cache_enabled=True) as client:
+            result = await client.bug_stats(1, ["status"], {"severity": [1]})
+            # Scanned pages never fill the response cache
+            assert client.cache.stats()["size"] == 0
+            return result
+
+    result = asyncio.run(run())
+    assert result["scanned"] == RECORDS
+    assert fake.count("GET", "/products/1/bugs") == RECORDS // 1000
+    assert {row["status"]: row["count"] for row in result["groups"]} == {
+        status: count for (status,), count in expected(RECORDS, ["status"], lambda b: b["severity"] == 1).items()
+    }
+
+
+def test_task_stats_sums_hours():
+    fake = FakeZentao()
+    for i, (user, status) in enumerate([("lisi", "doing"), ("lisi", "doing"), ("zhangsan", "wait")], 1):
+        fake.add("tasks", {"id": i, "execution": 5, "assignedTo": user, "status": status,
+                           "estimate": 4, "consumed": "1.5", "left": 2.5})
+
+    async def run():
+        async with make_async_client(fake) as client:
+            return await client.task_stats(5, ["assignedTo", "status"])
+
+    result = asyncio.run(run())
+    assert result["groups"] == [
+        {"assignedTo": "lisi", "status": "doing", "count": 2, "estimate": 8.0, "consumed": 3.0, "left": 5.0},
+        {"assignedTo": "zhangsan", "status": "wait", "count": 1, "estimate": 4.0, "consumed": 1.5, "left": 2.5},
+    ]
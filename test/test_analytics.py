@@ -0,0 +1,80 @@
+"""Tests for execution progress reports"""
+import asyncio
+import time
+from datetime import date
+
+from fake_zentao import FakeZentao, make_async_client
+from zentao_mcp.analytics import build_report
+
+EXECUTION = {"id": 5, "name": "Sprint 1", "status": "doing", "begin": "2024-03-01", "end": "2024-03-05"}
+
+
+def task(task_id: int, status: str, assignee: str, estimate=4, consumed=0, left=4, **extra) -> dict:
+    return {"id": task_id, "execution": 5, "name": f"task {task_id}", "status": status, "assignedTo": assignee,
+            "estimate": estimate, "consumed": consumed, "left": left, **extra}
+
+
+TASKS = [
+    task(1, "done", "closed", consumed=5, left=0, finishedDate="2024-03-02 18:00:00"),
+    task(2, "doing", "lisi", consumed=2, left=3, deadline="2024-03-02"),
+    task(3, "wait", "lisi", deadline="2024-03-10"),
+    task(4, "wait", "zhangsan", left=6, deadline="2024-03-01"),
+    task(5, "cancel", "wangwu"),
+    # Parent task: only its children count
+    {"id": 6, "status": "doing", "estimate": 99, "children": [
+        task(7, "done", "closed", estimate=2, consumed=2, left=0, finishedDate="2024-03-03"),
+    ]},
+]
+
+
+def test_build_report_totals_load_overdue_and_burndown():
+    report = build_report(EXECUTION, TASKS, date(2024, 3, 4))
+    assert report["totals"] == {"tasks": 6, "estimate": 22.0, "consumed": 9.0, "left": 17.0, "progress": 34.6}
+    assert report["by_status"] == {"done": 2, "doing": 1, "wait": 2, "cancel": 1}
+    assert [(e["assignedTo"], e["tasks"], e["left"]) for e in report["by_assignee"]] == [
+        ("lisi", 2, 7.0), ("zhangsan", 1, 6.0)
+    ]
+    assert [(t["id"], t["days_overdue"]) for t in report["overdue"]] == [(4, 3), (2, 2)]
+    assert report["burndown"] == [
+        {"date": "2024-03-01", "remaining": 18.0, "ideal": 18.0},
+        {"date": "2024-03-02", "remaining": 14.0, "ideal": 13.5},
+        {"date": "2024-03-03", "remaining": 12.0, "ideal": 9.0},
+        {"date": "2024-03-04", "remaining": 12.0, "ideal": 4.5},
+        {"date": "2024-03-05", "remaining": None, "ideal": 0.0},
+    ]
+
+
+def test_build_report_2000_tasks_is_fast():
+    tasks = [
+        task(i, ("wait", "doing", "done")[i % 3], f"user{i % 25}", estimate=i % 8, left=i % 5,
+             deadline=f"2024-03-{i % 28 + 1:02d}", finishedDate=f"2024-03-{i % 28 + 1:02d}")
+        for i in range(1, 2001)
+    ]
+    execution = {**EXECUTION, "end": "2024-03-28"}
+    start = time.perf_counter()
+    report = build_report(execution, tasks, date(2024, 3, 15))
+    assert time.perf_counter() - start < 0.1
+    assert report["totals"]["tasks"] == 2000 and len(report["burndown"]) == 28
+
+
+def test_report_is_cached_until_a_task_changes():
+    fake = FakeZentao()
+    fake.add("executions", {**EXECUTION, "project": 1})
+    for record in TASKS[:5]:
+        fake.add("tasks", record)
+
+    async def run():
+        async with make_async_client(fake, cache_enabled=True) as client:
+            first = await client.execution_report(5, today="2024-03-04")
+            await client.execution_report(5, today="2024-03-04")
+            cached_fetches = fake.count("GET", "/executions/5/tasks")
+            # Only the execution is cached; task pages stay out of the response cache
+            assert client.cache.stats()["size"] == 1
+            await client.update_task(3, {"status": "done", "finishedDate": "2024-03-04"})
+            second = await client.execution_report(5, today="2024-03-04")
+            return first, cached_fetches, second
+
+    first, cached_fetches, second = asyncio.run(run())
+    assert cached_fetches == 1
+    assert fake.count("GET", "/executions/5/tasks") == 2
+    assert first["by_status"]["wait"] == 2 and second["by_status"]["wait"] == 1
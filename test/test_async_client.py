@@ -0,0 +1,236 @@
+"""Offline tests for the Zentao clients using a mocked HTTP transport"""
+import asyncio
+
+import httpx
+
+from fake_zentao import FakeZentao, make_async_client, make_config
+from zentao_mcp.client import AsyncZentaoClient, ZentaoClient
+
+
+def make_fake(**kwargs) -> FakeZentao:
+    fake = FakeZentao(**kwargs)
+    for bug_id in range(10):
+        fake.add("bugs", {"id": bug_id, "title": f"Bug {bug_id}", "product": 1})
+    return fake
+
+
+def test_async_client_authenticates_once():
+    fake = make_fake()
+
+    async def run():
+        async with make_async_client(fake) as client:
+            assert (await client.get_bug(3))["title"] == "Bug 3"
+            assert (await client.list_products())["total"] == 1
+
+    asyncio.run(run())
+    assert fake.token_requests == 1
+
+
+def test_async_client_reauthenticates_on_401():
+    fake = make_fake()
+
+    async def run():
+        async with make_async_client(fake) as client:
+            await client.get_bug(1)
+            fake.valid_token = "token-2"
+            assert (await client.get_bug(2))["id"] == 2
+
+    asyncio.run(run())
+    assert fake.token_requests == 2
+
+
+def test_async_client_runs_requests_concurrently():
+    fake = make_fake(delay=0.2)
+
+    async def run():
+        async with make_async_client(fake) as client:
+            await client.get_bug(1)
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            bugs = await asyncio.gather(*(client.get_bug(i) for i in range(10)))
+            return bugs, loop.time() - start
+
+    bugs, elapsed = asyncio.run(run())
+    assert [bug["id"] for bug in bugs] == list(range(10))
+    assert elapsed < 1.0
+
+
+def test_sync_client_wraps_async_client():
+    fake = make_fake()
+    client = ZentaoClient(make_config(), transport=fake.transport())
+    try:
+        assert client.get_bug(7) == {"id": 7, "title": "Bug 7", "product": 1}
+        assert client.get_bug.__doc__ == "Get bug details"
+        assert client.config.username == "tester"
+    finally:
+        client.close()
+
+
+def test_iterators_fetch_all_pages_in_order():
+    fake = FakeZentao(delay=0.05)
+    for bug_id in range(1, 251):
+        fake.add("bugs", {"id": bug_id, "title": f"Bug {bug_id}", "product": 1})
+
+    async def run():
+        async with make_async_client(fake, page_size=20, page_concurrency=4) as client:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            bugs = [bug async for bug in client.iter_product_bugs(1)]
+            return bugs, loop.time() - start
+
+    bugs, elapsed = asyncio.run(run())
+    assert [bug["id"] for bug in bugs] == list(range(1, 251))
+    assert fake.count("GET", "/products/1/bugs") == 13
+    # 13 pages at 50 ms each would take 650 ms serially
+    assert elapsed < 0.45
+
+
+def test_sync_iterators():
+    fake = make_fake()
+    with ZentaoClient(make_config(page_size=3), transport=fake.transport()) as client:
+        assert [bug["id"] for bug in client.iter_product_bugs(1)] == list(range(10))
+        first_two = client.iter_product_bugs(1)
+        assert next(first_two)["id"] == 0
+        first_two.close()
+
+
+def test_batch_get_dedupes_and_reports_errors():
+    fake = make_fake(delay=0.05)
+
+    async def run():
+        async with make_async_client(fake) as client:
+            return await client.get_bugs([3, 1, 3, 404, 2])
+
+    result = asyncio.run(run())
+    assert [bug["id"] for bug in result["bugs"]] == [3, 1, 2]
+    assert result["total"] == 4 and result["found"] == 3
+    assert [error["id"] for error in result["errors"]] == [404]
+    assert fake.count("GET", "/bugs/3") == 1
+
+
+def test_batch_writes_report_partial_failures():
+    fake = make_fake()
+    fake.add("tasks", {"id": 5, "name": "Task 5", "execution": 2})
+
+    async def run():
+        async with make_async_client(fake) as client:
+            created = await client.batch_create_tasks(2, [{"name": "A"}, {"name": "B"}])
+            updated = await client.batch_update_tasks([{"id": 5, "left": 1}, {"id": 404, "left": 0}, {"left": 2}])
+            return created, updated
+
+    created, updated = asyncio.run(run())
+    assert created["succeeded"] == 2
+    assert [row["id"] for row in created["results"]] == [6, 7]
+    assert updated["succeeded"] == 1 and updated["failed"] == 2
+    assert updated["retry"] == [{"id": 404, "left": 0}, {"left": 2}]
+    assert updated["results"][2]["error"] == "each item requires an 'id'"
+    assert fake.data["tasks"][5]["left"] == 1
+
+
+def test_concurrent_401s_share_one_login():
+    fake = make_fake(delay=0.02)
+
+    async def run():
+        async with make_async_client(fake) as client:
+            await client.get_bug(1)
+            fake.valid_token = "token-2"
+            await asyncio.gather(*(client.get_bug(i) for i in range(10)))
+            return client.auth_stats
+
+    stats = asyncio.run(run())
+    assert fake.token_requests == 2
+    assert stats["unauthorized"] == 10
+
+
+def test_concurrent_first_calls_share_one_login():
+    fake = make_fake()
+
+    async def run():
+        async with make_async_client(fake) as client:
+            await asyncio.gather(*(client.get_bug(i) for i in range(10)))
+
+    asyncio.run(run())
+    assert fake.token_requests == 1
+
+
+def test_token_is_refreshed_before_expiry():
+    fake = make_fake()
+
+    async def run():
+        async with make_async_client(fake, token_ttl=0.3, token_refresh_margin=0.2) as client:
+            await client.get_bug(1)
+            await asyncio.sleep(0.15)
+            fake.valid_token = "token-2"
+            fake.token_requests = 0
+            # Still served with the old token while the refresh runs in the background
+            await client._get_headers()
+            await client._refresh_task
+            assert client._token == "token-2"
+            await client.get_bug(2)
+            return client.auth_stats
+
+    stats = asyncio.run(run())
+    assert fake.token_requests == 1
+    assert stats["proactive_refreshes"] == 1
+    assert stats["unauthorized"] == 0
+
+
+def test_identical_concurrent_gets_share_one_call():
+    fake = make_fake(delay=0.05)
+
+    async def run():
+        async with make_async_client(fake) as client:
+            await client.get_bug(1)
+            results = await asyncio.gather(
+                *(client.get_product(1) for _ in range(10)),
+                *(client.list_projects(page=page) for page in (1, 2, 1)),
+            )
+            return results, client.coalescing
+
+    results, coalescing = asyncio.run(run())
+    assert all(result is results[0] for result in results[:10])
+    assert fake.count("GET", "/products/1") == 1
+    assert fake.count("GET", "/projects") == 2
+    assert coalescing["saved"] == 10
+
+
+def test_a_cancelled_caller_does_not_cancel_the_shared_call():
+    fake = make_fake(delay=0.05)
+
+    async def run():
+        async with make_async_client(fake) as client:
+            first = asyncio.ensure_future(client.get_bug(3))
+            second = asyncio.ensure_future(client.get_bug(3))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            return await second
+
+    assert asyncio.run(run())["id"] == 3
+    assert fake.count("GET", "/bugs/3") == 1
+
+
+def test_coalescing_can_be_turned_off():
+    fake = make_fake(delay=0.02)
+
+    async def run():
+        async with make_async_client(fake, coalesce_requests=False) as client:
+            await asyncio.gather(*(client.get_product(1) for _ in range(5)))
+
+    asyncio.run(run())
+    assert fake.count("GET", "/products/1") == 5
+
+
+def test_redirects_to_https_are_followed():
+    fake = make_fake()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.scheme == "http":
+            return httpx.Response(308, headers={"Location": str(request.url.copy_with(scheme="https"))})
+        return await fake.handler(request)
+
+    async def run():
+        async with AsyncZentaoClient(make_config(), transport=httpx.MockTransport(handler)) as client:
+            return await client.get_bug(3)
+
+    assert asyncio.run(run())["title"] == "Bug 3"
+    assert fake.token_requests == 1
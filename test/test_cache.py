@@ -0,0 +1,98 @@
+"""Tests for the GET response cache"""
+import asyncio
+import time
+
+from fake_zentao import FakeZentao, make_async_client, make_config
+from zentao_mcp.cache import ResponseCache, resource_type
+from zentao_mcp.client import AsyncZentaoClient
+
+
+def test_resource_type():
+    assert resource_type("/executions/3/tasks") == "tasks"
+    assert resource_type("/tasks/5") == "tasks"
+    assert resource_type("/stories/5/change") == "change"
+
+
+def test_lru_bound_and_ttl():
+    cache = ResponseCache(max_entries=2, default_ttl=60.0, ttls={"bugs": 0.05})
+    for path in ("/products/1", "/products/2", "/products/3"):
+        cache.set(cache.make_key("GET", path), path)
+    assert cache.get(cache.make_key("GET", "/products/1")) == (False, None)
+    assert cache.get(cache.make_key("GET", "/products/3")) == (True, "/products/3")
+    assert cache.evictions == 1
+
+    cache.set(cache.make_key("GET", "/bugs/1"), {"id": 1})
+    time.sleep(0.06)
+    assert cache.get(cache.make_key("GET", "/bugs/1")) == (False, None)
+
+
+def test_params_are_part_of_the_key():
+    cache = ResponseCache()
+    cache.set(cache.make_key("GET", "/projects", {"page": 1, "limit": 20}), "page 1")
+    assert cache.get(cache.make_key("GET", "/projects", {"limit": 20, "page": 1}))[0]
+    assert not cache.get(cache.make_key("GET", "/projects", {"page": 2, "limit": 20}))[0]
+
+
+def test_client_caches_gets_and_invalidates_on_write():
+    fake = FakeZentao()
+    fake.add("executions", {"id": 2, "name": "Sprint", "project": 9})
+    fake.add("tasks", {"id": 5, "name": "Task", "execution": 2, "project": 9})
+
+    async def run():
+        async with make_async_client(fake, cache_enabled=True) as client:
+            await client.get_task(5)
+            await client.get_task(5)
+            await client.get_execution_tasks(2)
+            await client.get_execution(2)
+            assert fake.count("GET", "/tasks/5") == 1
+
+            await client.update_task(5, {"name": "Renamed"})
+            assert (await client.get_task(5))["name"] == "Renamed"
+            assert (await client.get_execution_tasks(2))["tasks"][0]["name"] == "Renamed"
+            await client.get_execution(2)
+            return client.cache.stats()
+
+    stats = asyncio.run(run())
+    assert fake.count("GET", "/tasks/5") == 2
+    assert fake.count("GET", "/executions/2/tasks") == 2
+    assert fake.count("GET", "/executions/2") == 1
+    assert stats["hits"] == 2
+
+
+def test_a_read_overlapping_a_write_is_not_cached():
+    import httpx
+
+    fake = FakeZentao()
+    fake.add("tasks", {"id": 5, "name": "old", "execution": 2})
+
+    async def slow_reads(request):
+        response = await fake.handler(request)
+        if request.method == "GET" and request.url.path.endswith("/tasks/5"):
+            # Read before the write lands, answer after it finished
+            await asyncio.sleep(0.1)
+        return response
+
+    async def run():
+        config = make_config(cache_enabled=True)
+        async with AsyncZentaoClient(config, transport=httpx.MockTransport(slow_reads)) as client:
+            await client.get_product(1)
+            read = asyncio.ensure_future(client.get_task(5))
+            await asyncio.sleep(0.02)
+            await client.update_task(5, {"name": "new"})
+            assert (await read)["name"] == "old"
+            return await client.get_task(5)
+
+    assert asyncio.run(run())["name"] == "new"
+
+
+def test_cache_is_opt_in():
+    fake = FakeZentao()
+
+    async def run():
+        async with make_async_client(fake) as client:
+            assert client.cache is None
+            await client.get_product(1)
+            await client.get_product(1)
+
+    asyncio.run(run())
+    assert fake.count("GET", "/products/1") == 2
@@ -0,0 +1,128 @@
+"""Tests for cursor-based change feeds"""
+import asyncio
+
+import pytest
+
+from fake_zentao import FakeZentao, make_async_client
+from zentao_mcp.changes import CursorError
+
+BUGS = 500
+
+
+def make_fake(honor_order: bool = True, **kwargs) -> FakeZentao:
+    fake = FakeZentao(honor_order=honor_order, **kwargs)
+    for i in range(1, BUGS + 1):
+        fake.add("bugs", {"id": i, "product": 1, "title": f"bug {i}", "status": "active",
+                          "lastEditedDate": f"2024-03-01 10:{i // 60 % 60:02d}:{i % 60:02d}"})
+    return fake
+
+
+def run_polls(fake: FakeZentao, tmp_path, steps):
+    """Run ``steps(client, poll)`` where ``poll(cursor)`` returns a changes_since result"""
+    async def run():
+        async with make_async_client(fake, changes_path=str(tmp_path / "changes.sqlite3")) as client:
+            async def poll(cursor=None, source="product_bugs", entity_id=1):
+                return await client.changes_since(source, entity_id, cursor)
+            return await steps(fake, poll)
+
+    return asyncio.run(run())
+
+
+def edit(fake: FakeZentao, bug_id: int, stamp: str, **changes):
+    fake.data["bugs"][bug_id].update(changes, lastEditedDate=stamp)
+
+
+@pytest.mark.parametrize("honor_order", [True, False])
+def test_changes_since_reports_created_edited_and_closed(tmp_path, honor_order):
+    async def steps(fake, poll):
+        first = await poll()
+        calls = fake.count("GET", "/products/1/bugs")
+        quiet = await poll(first["cursor"])
+        quiet_calls = fake.count("GET", "/products/1/bugs") - calls
+
+        edit(fake, 10, "2024-03-02 09:00:00", status="closed")
+        edit(fake, 20, "2024-03-02 09:00:01", title="renamed")
+        fake.add("bugs", {"id": BUGS + 1, "product": 1, "title": "new", "status": "active", "lastEditedDate": None})
+        changed = await poll(quiet["cursor"])
+        after = await poll(changed["cursor"])
+        # An old cursor still sees everything that changed after it
+        replay = await poll(first["cursor"])
+        return first, quiet, quiet_calls, changed, after, replay
+
+    first, quiet, quiet_calls, changed, after, replay = run_polls(make_fake(honor_order), tmp_path, steps)
+    assert first["baseline"] == BUGS and first["changes"] == []
+    assert quiet["count"] == 0
+    changes = [(c["change"], c["id"]) for c in changed["changes"]]
+    assert changes == [("closed", 10), ("edited", 20), ("created", BUGS + 1)]
+    assert changed["changes"][1]["title"] == "renamed"
+    assert after["count"] == 0
+    assert [(c["change"], c["id"]) for c in replay["changes"]] == changes
+    if honor_order:
+        # A quiet poll is one page of 20 records
+        assert quiet_calls == 1 and quiet["requests"] == 1
+        assert changed["requests"] == 2
+
+
+def test_records_tied_with_the_watermark_are_not_repeated(tmp_path):
+    async def steps(fake, poll):
+        first = await poll()
+        edit(fake, 7, "2024-03-02 09:00:00", status="resolved")
+        edit(fake, 8, "2024-03-02 09:00:00")
+        second = await poll(first["cursor"])
+        # Same second as the new watermark, different content
+        edit(fake, 9, "2024-03-02 09:00:00", title="same second")
+        return second, await poll(second["cursor"])
+
+    second, third = run_polls(make_fake(), tmp_path, steps)
+    assert [(c["change"], c["id"]) for c in second["changes"]] == [("closed", 7), ("edited", 8)]
+    assert [(c["change"], c["id"]) for c in third["changes"]] == [("edited", 9)]
+
+
+def test_baseline_reads_every_page_when_zentao_caps_the_page_size(tmp_path):
+    async def steps(fake, poll):
+        first = await poll()
+        edit(fake, 3, "2024-03-02 09:00:00", title="renamed")
+        return first, await poll(first["cursor"])
+
+    first, second = run_polls(make_fake(honor_order=False, max_limit=50), tmp_path, steps)
+    assert first["baseline"] == BUGS
+    assert [(c["change"], c["id"]) for c in second["changes"]] == [("edited", 3)]
+
+
+def test_bad_cursors_are_rejected(tmp_path):
+    async def steps(fake, poll):
+        first = await poll()
+        with pytest.raises(CursorError):
+            await poll("not-a-cursor")
+        with pytest.raises(CursorError):
+            await poll(first["cursor"], entity_id=2)
+        with pytest.raises(ValueError):
+            await poll(source="nope")
+
+    run_polls(make_fake(), tmp_path, steps)
+
+
+def test_fingerprinting_runs_off_the_event_loop(tmp_path):
+    import threading
+
+    fake = make_fake()
+    threads = set()
+
+    async def run():
+        async with make_async_client(fake, changes_path=str(tmp_path / "changes.sqlite3")) as client:
+            first = await client.changes_since("product_bugs", 1)
+            store = client.change_tracker.store
+            for name in ("cursor", "new_cursor", "record"):
+                method = getattr(store, name)
+
+                def traced(*args, _method=method):
+                    threads.add(threading.current_thread().name)
+                    return _method(*args)
+
+                setattr(store, name, traced)
+            edit(fake, 4, "2024-03-02 09:00:00", title="renamed")
+            return await client.changes_since("product_bugs", 1, first["cursor"])
+
+    changed = asyncio.run(run())
+    assert [c["id"] for c in changed["changes"]] == [4]
+    assert threads and all(name.startswith("zentao-changes") for name in threads)
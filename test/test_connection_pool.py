@@ -0,0 +1,59 @@
+"""Connection reuse and compression against a real local HTTP server"""
+import asyncio
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from fake_zentao import make_config
+from zentao_mcp.client import AsyncZentaoClient
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    encodings = []
+
+    def _send_json(self, payload):
+        body = json.dumps(payload).encode("utf-8")
+        accept = self.headers.get("Accept-Encoding", "")
+        KeepAliveHandler.encodings.append(accept)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if "gzip" in accept:
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._send_json({"token": "t"})
+
+    def do_GET(self):
+        self._send_json({"total": 1, "products": [{"id": 1, "name": "产品" * 100}]})
+
+    def log_message(self, *args):
+        pass
+
+
+def test_pool_reuses_connections_and_negotiates_gzip():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    config = make_config(pool_size=2)
+    config.base_url = f"http://127.0.0.1:{httpd.server_address[1]}"
+
+    async def run():
+        async with AsyncZentaoClient(config) as client:
+            for _ in range(5):
+                products = await client.list_products()
+                assert products["products"][0]["name"].startswith("产品")
+            return client.connection_stats()
+
+    try:
+        stats = asyncio.run(run())
+    finally:
+        httpd.shutdown()
+    assert stats == {"requests": 6, "new_connections": 1, "reused_connections": 5}
+    assert all("gzip" in encoding for encoding in KeepAliveHandler.encodings)
@@ -0,0 +1,49 @@
+"""Tests for bounded tool execution"""
+import asyncio
+import sys
+import os
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from zentao_mcp.config import ZentaoConfig
+from zentao_mcp.executor import ToolExecutor, tool_category, READ, WRITE
+
+
+def test_tool_category():
+    assert tool_category("get_bug") == READ
+    assert tool_category("list_projects") == READ
+    assert tool_category("update_task") == WRITE
+    assert tool_category("change_story") == WRITE
+
+
+def test_category_limit_caps_concurrency():
+    executor = ToolExecutor(max_concurrency=10, category_limits={READ: 3, WRITE: 1})
+    running = 0
+    peak = 0
+
+    async def work():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+
+    async def run():
+        await asyncio.gather(*(executor.run(READ, work) for _ in range(9)))
+
+    asyncio.run(run())
+    stats = executor.stats()
+    assert peak == 3
+    assert stats["categories"][READ]["completed"] == 9
+    assert stats["categories"][READ]["peak_in_flight"] == 3
+    assert stats["categories"][READ]["max_wait_ms"] > 0
+    assert stats["global"]["queued"] == 0
+
+
+def test_concurrency_limits_below_one_are_rejected(monkeypatch):
+    monkeypatch.setenv("ZENTAO_READ_CONCURRENCY", "0")
+    with pytest.raises(ValueError, match="ZENTAO_READ_CONCURRENCY must be at least 1"):
+        ZentaoConfig.from_env()
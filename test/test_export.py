@@ -0,0 +1,131 @@
+"""Tests for streaming exports"""
+import asyncio
+import csv
+import json
+import tracemalloc
+
+import pytest
+from openpyxl import load_workbook
+
+from fake_zentao import FakeZentao, make_async_client
+
+
+def make_fake(count: int) -> FakeZentao:
+    fake = FakeZentao()
+    for i in range(1, count + 1):
+        fake.add("bugs", {"id": i, "product": 1, "title": f"登录超时 {i}\x07", "severity": i % 4 + 1, "pri": 2,
+                          "status": ("active", "resolved")[i % 2], "mailto": ["lisi", "wangwu"],
+                          "assignedTo": {"id": 2, "account": "zhangsan", "realname": "张三"}})
+    return fake
+
+
+def export(fake: FakeZentao, tmp_path, **kwargs) -> dict:
+    async def run():
+        async with make_async_client(fake, page_size=50, export_dir=str(tmp_path), cache_enabled=True) as client:
+            summary = await client.export("product_bugs", 1, **kwargs)
+            # Export pages never fill the response cache
+            assert client.cache.stats()["size"] == 0
+            return summary
+
+    return asyncio.run(run())
+
+
+def test_export_formats(tmp_path):
+    fake = make_fake(120)
+    columns = ["id", "title", "assignedTo", "assignedTo.realname", "mailto"]
+
+    xlsx = export(fake, tmp_path, columns=columns, filename="bugs")
+    assert xlsx["path"] == str(tmp_path / "bugs.xlsx")
+    assert xlsx["rows"] == 120 and xlsx["by_status"] == {"active": 60, "resolved": 60}
+    rows = list(load_workbook(xlsx["path"], read_only=True).active.values)
+    assert rows[0] == tuple(columns)
+    assert rows[1] == (1, "登录超时 1", "zhangsan", "张三", "lisi, wangwu")
+    assert len(rows) == 121
+
+    with open(export(fake, tmp_path, format="csv")["path"], encoding="utf-8-sig", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 120 and rows[0]["assignedTo"] == "zhangsan" and rows[0]["severity"] == "2"
+
+    with open(export(fake, tmp_path, format="jsonl")["path"], encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert records[0] == fake.data["bugs"][1] and len(records) == 120
+    assert list(tmp_path.glob("*.part")) == []
+
+
+def formula_fake() -> FakeZentao:
+    fake = FakeZentao()
+    titles = ['=HYPERLINK("http://evil.test","click")', "+1", "-2+3", "@SUM(A1)", "\tx", "plain - text"]
+    for i, title in enumerate(titles, 1):
+        fake.add("bugs", {"id": i, "product": 1, "title": title, "status": "active"})
+    return fake
+
+
+def test_xlsx_export_writes_formula_like_text_as_strings(tmp_path):
+    summary = export(formula_fake(), tmp_path, columns=["id", "title"])
+    cells = [row[1] for row in load_workbook(summary["path"]).active.iter_rows(min_row=2)]
+    assert [cell.data_type for cell in cells] == ["s"] * 6
+    assert cells[0].value == '=HYPERLINK("http://evil.test","click")'
+
+
+def test_csv_export_escapes_formula_like_text(tmp_path):
+    summary = export(formula_fake(), tmp_path, format="csv", columns=["id", "title"])
+    with open(summary["path"], encoding="utf-8-sig", newline="") as f:
+        titles = [row["title"] for row in csv.DictReader(f)]
+    assert titles == ["'=HYPERLINK(\"http://evil.test\",\"click\")", "'+1", "'-2+3", "'@SUM(A1)", "'\tx", "plain - text"]
+
+
+def test_formula_like_column_names_are_escaped_in_the_header(tmp_path):
+    columns = ["id", '=HYPERLINK("http://evil.test","click")']
+    xlsx = export(formula_fake(), tmp_path, columns=columns)
+    header = next(load_workbook(xlsx["path"]).active.iter_rows(max_row=1))
+    assert header[1].data_type == "s" and header[1].value == columns[1]
+    with open(export(formula_fake(), tmp_path, format="csv", columns=columns)["path"], encoding="utf-8-sig") as f:
+        assert next(csv.reader(f)) == ["id", "'" + columns[1]]
+
+
+def test_concurrent_exports_get_their_own_files(tmp_path):
+    fake = make_fake(200)
+
+    async def run():
+        async with make_async_client(fake, page_size=50, export_dir=str(tmp_path)) as client:
+            return await asyncio.gather(*(client.export("product_bugs", 1, format="csv") for _ in range(4)))
+
+    paths = {summary["path"] for summary in asyncio.run(run())}
+    assert len(paths) == 4
+    assert list(tmp_path.glob("*.part")) == []
+
+
+def test_named_export_does_not_overwrite_unless_asked(tmp_path):
+    fake = make_fake(3)
+    first = export(fake, tmp_path, format="csv", filename="bugs")
+    with pytest.raises(ValueError, match="already exists"):
+        export(fake, tmp_path, format="csv", filename="bugs")
+    again = export(fake, tmp_path, format="csv", filename="bugs", overwrite=True)
+    assert first["path"] == again["path"] and again["rows"] == 3
+
+
+def test_export_rejects_bad_arguments(tmp_path):
+    fake = make_fake(1)
+    with pytest.raises(ValueError):
+        export(fake, tmp_path, filename="../outside")
+
+    async def run():
+        async with make_async_client(fake, export_dir=str(tmp_path)) as client:
+            await client.export("execution_tasks")
+
+    with pytest.raises(ValueError):
+        asyncio.run(run())
+
+
+@pytest.mark.parametrize("fmt", ["csv", "xlsx"])
+def test_export_memory_is_flat(tmp_path, fmt):
+    def peak(count: int) -> int:
+        fake = make_fake(count)
+        tracemalloc.start()
+        export(fake, tmp_path, format=fmt)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak_bytes
+
+    small, large = peak(1000), peak(5000)
+    assert large < 1.5 * small
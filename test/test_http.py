@@ -0,0 +1,78 @@
+"""Tests for the Streamable HTTP and SSE transports"""
+import asyncio
+import json
+
+import httpx
+from mcp import ClientSession
+from mcp.client.streamable_http import streamable_http_client
+from mcp.shared._httpx_utils import create_mcp_http_client
+
+from bench_http import make_fake, run_session, running_server
+from zentao_mcp import server
+
+
+def test_concurrent_sessions_share_one_client():
+    fake = make_fake(delay=0.005)
+
+    async def run():
+        latencies = []
+        async with running_server(fake, cache_enabled=True) as base_url:
+            async with httpx.AsyncClient() as http:
+                health = (await http.get(f"{base_url}/healthz")).json()
+            sessions = [run_session(base_url, 4, latencies) for _ in range(8)]
+            sessions.append(run_session(base_url, 4, latencies, transport="sse"))
+            succeeded = await asyncio.gather(*sessions)
+        return health, succeeded, latencies
+
+    health, succeeded, latencies = asyncio.run(run())
+    assert health == {"status": "ok"}
+    assert succeeded == [4] * 9 and len(latencies) == 36
+    # One login and one client for every session; the server cleans up on shutdown
+    assert fake.token_requests == 1
+    assert fake.count("GET", "/users") <= 2
+    assert server._client is None
+
+
+def test_http_session_reads_resources_and_advertises_subscribe():
+    fake = make_fake(delay=0)
+
+    async def run():
+        async with running_server(fake) as base_url:
+            async with streamable_http_client(f"{base_url}/mcp/") as streams:
+                async with ClientSession(streams[0], streams[1]) as session:
+                    init = await session.initialize()
+                    tool = await session.call_tool("get_bug", {"bug_id": 3})
+                    resource = await session.read_resource("zentao://products/1/bugs")
+        return init, tool, resource
+
+    init, tool, resource = asyncio.run(run())
+    assert init.capabilities.resources.subscribe is True
+    assert json.loads(tool.content[0].text)["title"] == "bug 3"
+    assert len(json.loads(resource.contents[0].text)["bugs"]) == 50
+
+
+def test_basic_credentials_select_a_pooled_client_per_account():
+    fake = make_fake(delay=0)
+
+    async def call(base_url, auth):
+        async with create_mcp_http_client(auth=auth) as http:
+            async with streamable_http_client(f"{base_url}/mcp/", http_client=http) as streams:
+                async with ClientSession(streams[0], streams[1]) as session:
+                    await session.initialize()
+                    product = (await session.call_tool("get_product", {"product_id": 1})).content[0].text
+                    stats = (await session.call_tool("get_server_stats", {})).content[0].text
+                    return product, stats
+
+    async def run():
+        async with running_server(fake, allow_anonymous=False) as base_url:
+            await asyncio.gather(call(base_url, ("alice", "a-pw")), call(base_url, ("bob", "b-pw")))
+            anonymous, _ = await call(base_url, None)
+            _, stats = await call(base_url, httpx.BasicAuth("alice", "a-pw"))
+            return anonymous, json.loads(stats)
+
+    anonymous, stats = asyncio.run(run())
+    # Each account logged in once; the anonymous session was refused
+    assert sorted(fake.logins) == ["alice", "bob"]
+    assert anonymous.startswith("Error: Authentication required")
+    assert stats["client_pool"]["live"] == 2 and stats["client_pool"]["hits"] >= 1
+    assert server._pool is None
@@ -0,0 +1,27 @@
+"""Tests for the JSON backend wrapper"""
+import json
+
+from zentao_mcp import jsonlib
+
+DATA = {"id": 7, "title": "登录超时", "mailto": [], "deadline": None, "deleted": False, "estimate": 1.5}
+
+
+def test_dumps_matches_stdlib_output():
+    assert jsonlib.dumps(DATA) == json.dumps(DATA, indent=2, ensure_ascii=False)
+    assert jsonlib.dumps(DATA, compact=True) == json.dumps(DATA, ensure_ascii=False, separators=(",", ":"))
+
+
+def test_loads_from_bytes_and_str():
+    body = json.dumps(DATA, ensure_ascii=False)
+    assert jsonlib.loads(body.encode("utf-8")) == DATA
+    assert jsonlib.loads(body) == DATA
+
+
+def test_falls_back_to_stdlib_for_inputs_the_fast_backend_rejects():
+    assert jsonlib.loads(b"\xef\xbb\xbf" + json.dumps(DATA).encode("utf-8")) == DATA
+    assert jsonlib.loads(jsonlib.dumps({"id": 2 ** 70})) == {"id": 2 ** 70}
+    assert jsonlib.loads(jsonlib.dumps_bytes({1: "a"})) == {"1": "a"}
+
+
+def test_dumps_bytes_round_trips():
+    assert jsonlib.loads(jsonlib.dumps_bytes(DATA)) == DATA
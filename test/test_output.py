@@ -0,0 +1,37 @@
+"""Tests for tool result projection and serialization"""
+from zentao_mcp.output import project, render
+
+BUG = {
+    "id": 7,
+    "title": "登录超时",
+    "status": "active",
+    "steps": "<p>long html</p>",
+    "assignedTo": {"id": 3, "account": "zhangsan", "avatar": "", "realname": "张三"},
+}
+
+
+def test_project_entity_with_nested_fields():
+    assert project(BUG, ["id", "assignedTo.account", "missing"]) == {
+        "id": 7,
+        "assignedTo": {"account": "zhangsan"},
+    }
+
+
+def test_project_list_envelope_keeps_pagination():
+    page = {"page": 1, "total": 2, "limit": 20, "bugs": [BUG, {**BUG, "id": 8}]}
+    assert project(page, ["id", "status"]) == {
+        "page": 1,
+        "total": 2,
+        "limit": 20,
+        "bugs": [{"id": 7, "status": "active"}, {"id": 8, "status": "active"}],
+    }
+
+
+def test_project_leaves_batch_errors_alone():
+    batch = {"total": 2, "found": 1, "bugs": [BUG], "errors": [{"id": 9, "error": "404"}]}
+    assert project(batch, ["id"])["errors"] == [{"id": 9, "error": "404"}]
+
+
+def test_render_compact_and_without_fields():
+    assert render(BUG) == render(BUG, fields=[])
+    assert render({"id": 1, "title": "标题"}, compact=True) == '{"id":1,"title":"标题"}'
@@ -0,0 +1,117 @@
+"""Tests for the per-account client pool"""
+import asyncio
+
+import pytest
+
+from fake_zentao import FakeZentao, make_config
+from zentao_mcp.pool import ClientPool, PoolFullError
+
+
+def run_pool(steps, fake: FakeZentao = None, **options):
+    fake = fake or FakeZentao()
+
+    async def run():
+        pool = ClientPool(make_config(cache_enabled=True), transport=fake.transport(), **options)
+        try:
+            return await steps(pool, fake)
+        finally:
+            await pool.aclose()
+
+    return asyncio.run(run())
+
+
+async def get_product(pool: ClientPool, account: str, password: str = "pw"):
+    async with pool.lease(account, password) as entry:
+        await entry.client.get_product(1)
+        return entry
+
+
+def test_accounts_get_their_own_token_and_cache_over_one_connection_pool():
+    async def steps(pool, fake):
+        entries = await asyncio.gather(*(get_product(pool, account) for account in ["alice", "bob", "alice"]))
+        again = await get_product(pool, "bob")
+        return entries, again
+
+    entries, again = run_pool(steps)
+    alice, bob, alice_again = entries
+    assert alice is alice_again and bob is again
+    assert alice.client is not bob.client and alice.client.cache is not bob.client.cache
+    assert alice.client.http is bob.client.http
+    assert alice.client.config.username == "alice"
+
+
+def test_each_account_logs_in_once_and_reads_are_cached_per_account():
+    async def steps(pool, fake):
+        for account in ["alice", "bob", "alice", "bob"]:
+            await get_product(pool, account)
+        return fake, pool.stats()
+
+    fake, stats = run_pool(steps)
+    assert sorted(fake.logins) == ["alice", "bob"]
+    assert fake.count("GET", "/products/1") == 2
+    assert stats["created"] == 2 and stats["hits"] == 2 and stats["live"] == 2
+
+
+def test_least_recently_used_idle_client_is_evicted_at_the_maximum():
+    async def steps(pool, fake):
+        a = await get_product(pool, "a")
+        await get_product(pool, "b")
+        await get_product(pool, "a")
+        await get_product(pool, "c")
+        return a, pool
+
+    a, pool = run_pool(steps, max_clients=2)
+    assert pool.counters["evicted_lru"] == 1
+    assert not a.retired
+
+
+def test_idle_clients_expire_and_leased_clients_are_never_evicted():
+    async def steps(pool, fake):
+        async with pool.lease("busy", "pw") as busy:
+            idle = await get_product(pool, "idle")
+            await asyncio.sleep(0.06)
+            async with pool.lease("fresh", "pw"):
+                assert idle.retired and not busy.retired
+                with pytest.raises(PoolFullError):
+                    async with pool.lease("another", "pw"):
+                        pass
+        return pool.stats()
+
+    stats = run_pool(steps, max_clients=2, idle_timeout=0.05)
+    assert stats["evicted_idle"] == 1 and stats["rejected"] == 1
+
+
+def test_a_different_password_gets_a_fresh_client():
+    async def steps(pool, fake):
+        first = await get_product(pool, "alice", "old")
+        second = await get_product(pool, "alice", "new")
+        return first, second, fake
+
+    first, second, fake = run_pool(steps)
+    assert first is not second and first.retired
+    assert fake.logins == ["alice", "alice"]
+
+
+def test_a_wrong_password_is_rejected_despite_a_warm_token_cache(tmp_path):
+    import httpx
+
+    from zentao_mcp.token_store import TokenStore
+
+    fake = FakeZentao()
+    fake.passwords["alice"] = "right"
+    token_path = str(tmp_path / "tokens.json")
+    TokenStore(token_path).save("http://zentao.test", "alice", fake.valid_token)
+
+    async def run():
+        config = make_config(token_cache=True, token_cache_path=token_path)
+        pool = ClientPool(config, transport=fake.transport())
+        try:
+            with pytest.raises(httpx.HTTPStatusError):
+                await get_product(pool, "alice", "WRONG")
+            await get_product(pool, "alice", "right")
+        finally:
+            await pool.aclose()
+
+    asyncio.run(run())
+    assert fake.logins == ["alice", "alice"]
+    assert fake.count("GET", "/products/1") == 1
@@ -0,0 +1,186 @@
+"""Tests for the local SQLite replica and its incremental sync"""
+import asyncio
+import sqlite3
+
+from fake_zentao import FakeZentao, make_async_client
+from zentao_mcp.tools import registry
+
+
+def make_fake(bugs: int = 0, **kwargs) -> FakeZentao:
+    fake = FakeZentao(**kwargs)
+    fake.add("executions", {"id": 5, "name": "Sprint", "project": 2})
+    fake.add("tasks", {"id": 1, "name": "T", "execution": 5, "project": 2})
+    for i in range(1, bugs + 1):
+        fake.add("bugs", {
+            "id": i, "title": f"bug {i}", "product": 1,
+            "lastEditedDate": f"2024-01-01 00:{i // 60:02d}:{i % 60:02d}",
+        })
+    return fake
+
+
+def replica_client(fake: FakeZentao, tmp_path, **overrides):
+    return make_async_client(
+        fake, replica_enabled=True, replica_path=str(tmp_path / "replica.sqlite3"),
+        page_size=50, **overrides
+    )
+
+
+def bug_pages(fake: FakeZentao) -> int:
+    return fake.count("GET", "/products/1/bugs")
+
+
+def test_full_sync_then_reads_are_local(tmp_path):
+    fake = make_fake(bugs=120)
+
+    async def run():
+        async with replica_client(fake, tmp_path) as client:
+            report = await client.sync_replica()
+            before = len(fake.calls)
+            page = await registry.get("get_product_bugs").invoke(client, {"product_id": 1})
+            bug = await registry.get("get_bug").invoke(client, {"bug_id": 7})
+            tasks = await registry.get("get_execution_tasks").invoke(client, {"execution_id": 5})
+            return report, before, page, bug, tasks
+
+    report, before, page, bug, tasks = asyncio.run(run())
+    assert report["kinds"]["bugs"]["upserted"] == 120
+    assert len(fake.calls) == before
+    # Paged like the live API: the default page, not the whole table
+    assert page["total"] == 120 and page["limit"] == 20
+    assert [b["id"] for b in page["bugs"]] == list(range(1, 21))
+    assert bug["title"] == "bug 7"
+    assert [t["id"] for t in tasks["tasks"]] == [1]
+
+
+def test_incremental_sync_reads_only_changes(tmp_path):
+    fake = make_fake(bugs=500)
+
+    async def run():
+        async with replica_client(fake, tmp_path) as client:
+            await client.sync_replica(["bugs"])
+            first = bug_pages(fake)
+            fake.data["bugs"][3].update(title="edited", lastEditedDate="2024-02-01 00:00:00")
+            fake.add("bugs", {"id": 501, "title": "new", "product": 1})
+            report = await client.sync_replica(["bugs"])
+            page = await client.read_replica("/products/1/bugs", limit=1000)
+            return first, report, page
+
+    first, report, page = asyncio.run(run())
+    assert first == 10
+    # One page of each ordered stream plus any prefetched pages, not another 10
+    assert bug_pages(fake) - first <= 2 * (1 + 4)
+    # Per stream: the changes, the record at the watermark and one page confirming the order
+    assert report["kinds"]["bugs"]["fetched"] <= 2 * (2 + 50)
+    records = {bug["id"]: bug for bug in page[1]["bugs"]}
+    assert records[3]["title"] == "edited" and records[501]["title"] == "new"
+    assert page[1]["total"] == 501
+
+
+def test_incremental_sync_falls_back_when_order_is_ignored(tmp_path):
+    fake = make_fake(bugs=120, honor_order=False)
+
+    async def run():
+        async with replica_client(fake, tmp_path) as client:
+            await client.sync_replica(["bugs"])
+            fake.data["bugs"][100].update(title="edited", lastEditedDate="2024-02-01 00:00:00")
+            await client.sync_replica(["bugs"])
+            return await client.read_replica("/bugs/100")
+
+    hit, bug = asyncio.run(run())
+    assert hit and bug["title"] == "edited"
+
+
+def test_sync_reads_bypass_the_response_cache(tmp_path):
+    fake = make_fake(bugs=10)
+
+    async def run():
+        async with replica_client(fake, tmp_path, cache_enabled=True) as client:
+            await client.sync_replica(["bugs"])
+            fake.data["bugs"][7].update(title="edited", lastEditedDate="2024-02-01 00:00:00")
+            await client.sync_replica(["bugs"])
+            return await client.read_replica("/bugs/7"), client.cache.stats()
+
+    (hit, bug), cache = asyncio.run(run())
+    assert hit and bug["title"] == "edited"
+    assert cache["size"] == 0
+
+
+def test_stale_replica_falls_through_and_resyncs(tmp_path):
+    fake = make_fake(bugs=3)
+
+    async def run():
+        async with replica_client(fake, tmp_path, replica_max_age=0.05) as client:
+            await client.sync_replica(["bugs"])
+            await asyncio.sleep(0.1)
+            before = fake.count("GET", "/bugs/2")
+            await registry.get("get_bug").invoke(client, {"bug_id": 2})
+            await asyncio.sleep(0.05)
+            return before, client.replica.stats()
+
+    before, stats = asyncio.run(run())
+    assert fake.count("GET", "/bugs/2") == before + 1
+    assert stats["misses"] >= 1 and stats["kinds"]["bugs"]["rows"] == 3
+
+
+def test_writes_go_through_to_replica_and_full_sync_sweeps(tmp_path):
+    fake = make_fake(bugs=3)
+
+    async def run():
+        async with replica_client(fake, tmp_path) as client:
+            await client.sync_replica(["bugs"])
+            await client.update_bug(1, {"title": "renamed"})
+            renamed = await client.read_replica("/bugs/1")
+            del fake.data["bugs"][2]
+            await client.sync_replica(["bugs"], full=True)
+            return renamed, await client.read_replica("/products/1/bugs")
+
+    renamed, page = asyncio.run(run())
+    assert renamed[1]["title"] == "renamed"
+    assert [bug["id"] for bug in page[1]["bugs"]] == [1, 3]
+
+
+def test_a_failed_replica_update_does_not_fail_the_write(tmp_path):
+    fake = make_fake(bugs=3)
+
+    def locked(*args):
+        raise sqlite3.OperationalError("database is locked")
+
+    async def run():
+        async with replica_client(fake, tmp_path) as client:
+            await client.sync_replica(["bugs"])
+            apply_write, client.replica.apply_write = client.replica.apply_write, locked
+            updated = await client.update_bug(1, {"title": "renamed"})
+            client.replica.apply_write = apply_write
+            stale, _ = await client.read_replica("/bugs/1")
+            await client.sync_replica(["bugs"])
+            return updated, stale, await client.read_replica("/bugs/1")
+
+    updated, stale, (hit, bug) = asyncio.run(run())
+    assert updated["title"] == "renamed"
+    # The kind reads live until the next sync picks the change up
+    assert not stale
+    assert hit and bug["title"] == "renamed"
+
+
+def test_replica_sqlite_work_stays_off_the_event_loop(tmp_path):
+    import threading
+
+    fake = make_fake(bugs=3)
+    threads = set()
+
+    async def run():
+        async with replica_client(fake, tmp_path) as client:
+            replica = client.replica
+            for name in ("upsert", "apply_write", "lookup", "scope_state", "save_scope", "mark_synced"):
+                method = getattr(replica, name)
+
+                def traced(*args, _method=method):
+                    threads.add(threading.current_thread().name)
+                    return _method(*args)
+
+                setattr(replica, name, traced)
+            await client.sync_replica(["bugs"])
+            await client.update_bug(1, {"title": "renamed"})
+            await client.read_replica("/bugs/1")
+
+    asyncio.run(run())
+    assert threads and all(name.startswith("zentao-replica") for name in threads)
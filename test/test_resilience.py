@@ -0,0 +1,90 @@
+"""Tests for retries with backoff and the circuit breaker"""
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from fake_zentao import FakeZentao, make_config
+from zentao_mcp.client import AsyncZentaoClient
+from zentao_mcp.resilience import CircuitBreaker, CircuitOpenError, backoff_delay
+
+
+class FlakyZentao(FakeZentao):
+    """Fails the first ``failures`` API calls (not logins) with ``error``"""
+
+    def __init__(self, failures: int, error="503"):
+        super().__init__()
+        self.failures = failures
+        self.error = error
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        if not request.url.path.endswith("/tokens") and self.failures > 0:
+            self.failures -= 1
+            self.calls.append((request.method, "failed"))
+            if self.error == "connect":
+                raise httpx.ConnectError("connection refused", request=request)
+            return httpx.Response(503, json={"error": "Service unavailable"})
+        return await super().handler(request)
+
+
+def make_client(fake: FakeZentao, **overrides) -> AsyncZentaoClient:
+    options = {"retry_backoff": 0.001, "retry_backoff_max": 0.01, **overrides}
+    return AsyncZentaoClient(make_config(**options), transport=fake.transport())
+
+
+def test_backoff_delay_is_capped():
+    assert all(0 <= backoff_delay(attempt, 0.5, 2.0) <= 2.0 for attempt in range(10))
+
+
+def test_idempotent_get_retries_5xx_and_connection_errors():
+    for error in ("503", "connect"):
+        fake = FlakyZentao(failures=2, error=error)
+
+        async def run():
+            async with make_client(fake) as client:
+                return await client.get_product(1), client.retries
+
+        product, retries = asyncio.run(run())
+        assert product["id"] == 1
+        assert retries == 2
+
+
+def test_post_is_not_retried():
+    fake = FlakyZentao(failures=1)
+
+    async def run():
+        async with make_client(fake) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.create_task(2, {"name": "A"})
+            return client.retries
+
+    assert asyncio.run(run()) == 0
+    assert fake.data["tasks"] == {}
+
+
+def test_circuit_opens_and_fails_fast():
+    fake = FlakyZentao(failures=100)
+
+    async def run():
+        async with make_client(fake, max_retries=1, breaker_threshold=4, breaker_cooldown=0.2) as client:
+            for _ in range(2):
+                with pytest.raises(httpx.HTTPStatusError):
+                    await client.get_product(1)
+            calls = len(fake.calls)
+            start = time.perf_counter()
+            with pytest.raises(CircuitOpenError):
+                await client.get_product(1)
+            assert time.perf_counter() - start < 0.01
+            assert len(fake.calls) == calls
+
+            # After the cool-down a single trial request goes through
+            fake.failures = 0
+            await asyncio.sleep(0.25)
+            assert (await client.get_product(1))["id"] == 1
+            return client.breaker.stats()
+
+    stats = asyncio.run(run())
+    assert stats["state"] == CircuitBreaker.CLOSED
+    assert stats["times_opened"] == 1
+    assert stats["rejected"] == 1
@@ -0,0 +1,136 @@
+"""Tests for zentao:// resources and change notifications"""
+import asyncio
+import json
+
+import pytest
+
+from fake_zentao import FakeZentao, make_async_client
+from zentao_mcp.resources import ResourceHub, resolve
+
+
+class FakeSession:
+    def __init__(self):
+        self.updates = []
+
+    async def send_resource_updated(self, uri):
+        self.updates.append(str(uri))
+
+
+def make_fake() -> FakeZentao:
+    fake = FakeZentao()
+    fake.add("bugs", {"id": 1, "product": 1, "title": "a", "status": "active"})
+    fake.add("bugs", {"id": 2, "product": 1, "title": "b", "status": "active"})
+    return fake
+
+
+def test_resolve_uris():
+    assert resolve("zentao://products")[1] == "/products"
+    spec, path = resolve("zentao://products/7/bugs")
+    assert path == "/products/7/bugs" and spec.key == "bugs"
+    assert resolve("zentao://bugs/3/")[0].key is None
+    for uri in ("zentao://products/x/bugs", "zentao://secrets", "http://products"):
+        with pytest.raises(ValueError):
+            resolve(uri)
+
+
+def test_reads_share_one_snapshot():
+    fake = make_fake()
+
+    async def run():
+        async with make_async_client(fake, page_size=1, cache_enabled=True) as client:
+            hub = ResourceHub(client, ttl=60)
+            texts = await asyncio.gather(*(hub.read("zentao://products/1/bugs") for _ in range(10)))
+            single = await hub.read("zentao://bugs/2")
+            return texts, single, hub.stats()
+
+    texts, single, stats = asyncio.run(run())
+    assert len(set(texts)) == 1
+    assert [bug["id"] for bug in json.loads(texts[0])["bugs"]] == [1, 2]
+    assert json.loads(single)["title"] == "b"
+    # Ten concurrent reads, two pages, one fetch
+    assert fake.count("GET", "/products/1/bugs") == 2
+    assert stats["fetches"] == 2
+
+
+def test_subscribers_are_notified_only_on_change():
+    fake = make_fake()
+    session, other = FakeSession(), FakeSession()
+
+    async def run():
+        async with make_async_client(fake) as client:
+            hub = ResourceHub(client, poll_interval=0.05)
+            hub.subscribe("zentao://products/1/bugs", session)
+            hub.subscribe("zentao://bugs/1", other)
+            await asyncio.sleep(0.12)
+            unchanged = (list(session.updates), list(other.updates))
+            fake.data["bugs"][2]["status"] = "resolved"
+            await asyncio.sleep(0.1)
+            hub.unsubscribe("zentao://products/1/bugs", session)
+            fake.data["bugs"][1]["status"] = "closed"
+            await asyncio.sleep(0.1)
+            stats = hub.stats()
+            await hub.aclose()
+            return unchanged, stats
+
+    unchanged, stats = asyncio.run(run())
+    assert unchanged == ([], [])
+    assert session.updates == ["zentao://products/1/bugs"]
+    assert other.updates == ["zentao://bugs/1"]
+    assert stats["polls"] >= 3 and stats["notifications"] == 2
+
+
+def test_a_session_that_unsubscribes_during_a_failed_send_is_dropped_quietly():
+    fake = make_fake()
+    uri = "zentao://bugs/1"
+
+    class ClosingSession:
+        """Unsubscribes while its send is in flight, then fails"""
+        def __init__(self, hub):
+            self.hub = hub
+
+        async def send_resource_updated(self, uri_):
+            self.hub.unsubscribe(uri, self)
+            raise ConnectionError("session closed")
+
+    async def run():
+        async with make_async_client(fake) as client:
+            hub = ResourceHub(client, poll_interval=60)
+            session = ClosingSession(hub)
+            hub.subscribe(uri, session)
+            await hub._notify(uri)
+            subscribed = hub.subscribed()
+            await hub.aclose()
+            return subscribed
+
+    assert asyncio.run(run()) == []
+
+
+def test_server_reads_and_notifies_over_mcp(monkeypatch):
+    from mcp.shared.memory import create_connected_server_and_client_session
+    from mcp.types import ServerNotification
+    from zentao_mcp import server
+
+    fake = make_fake()
+    monkeypatch.setattr(server, "_client", make_async_client(fake, resource_poll_interval=0.05))
+    monkeypatch.setattr(server, "_resources", None)
+    messages = []
+
+    async def on_message(message):
+        messages.append(message)
+
+    async def run():
+        async with create_connected_server_and_client_session(server.server, message_handler=on_message) as session:
+            templates = await session.list_resource_templates()
+            read = await session.read_resource("zentao://products/1/bugs")
+            await session.subscribe_resource("zentao://products/1/bugs")
+            await asyncio.sleep(0.1)
+            fake.data["bugs"][1]["status"] = "closed"
+            await asyncio.sleep(0.15)
+            await server._resources.aclose()
+            return templates, read
+
+    templates, read = asyncio.run(run())
+    assert "zentao://products/{id}/bugs" in [t.uriTemplate for t in templates.resourceTemplates]
+    assert json.loads(read.contents[0].text)["total"] == 2
+    updates = [m.root.params.uri for m in messages if isinstance(m, ServerNotification)]
+    assert [str(uri) for uri in updates] == ["zentao://products/1/bugs"]
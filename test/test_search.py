@@ -0,0 +1,68 @@
+"""Tests for the full-text search index"""
+import asyncio
+
+from fake_zentao import FakeZentao, make_async_client
+from zentao_mcp.search import match_expression, tokenize
+
+
+def test_tokenize_splits_chinese_into_bigrams():
+    assert tokenize("登录超时 Login-Page") == ["登录", "录超", "超时", "时", "login", "page"]
+    assert match_expression("登录超时 time") == '"登录 录超 超时" AND "time"*'
+    assert match_expression("卡") == '"卡"*'
+    assert match_expression("!!") is None
+
+
+def make_fake() -> FakeZentao:
+    fake = FakeZentao()
+    fake.add("bugs", {"id": 1, "title": "登录页面超时无提示", "product": 1, "status": "active",
+                      "steps": "<p>[步骤] 限速到 2G 后登录</p>"})
+    fake.add("bugs", {"id": 2, "title": "导出报表乱码", "product": 1, "status": "active",
+                      "steps": "<p>登录后导出 Excel，中文乱码</p>"})
+    fake.add("bugs", {"id": 3, "title": "Session timeout on login", "product": 2, "status": "resolved"})
+    fake.add("stories", {"id": 8, "title": "单点登录", "product": 1, "spec": "支持 LDAP 登录", "verify": ""})
+    return fake
+
+
+def search_client(fake: FakeZentao, tmp_path):
+    return make_async_client(fake, search_enabled=True, search_path=str(tmp_path / "search.sqlite3"))
+
+
+def test_fetched_entities_are_searchable_and_ranked(tmp_path):
+    fake = make_fake()
+
+    async def run():
+        async with search_client(fake, tmp_path) as client:
+            await client.get_product_bugs(1)
+            await client.get_bug(3)
+            await client.get_story(8)
+            return (
+                await client.search("登录"),
+                await client.search("超时"),
+                await client.search("timeout"),
+                await client.search("登录", kinds=["bugs"], product_id=1, limit=1),
+            )
+
+    login, timeout_zh, timeout_en, page = asyncio.run(run())
+    # Title matches outrank body-only matches
+    assert login["total"] == 3
+    assert {r["id"] for r in login["results"][:2]} == {1, 8}
+    assert login["results"][-1]["id"] == 2
+    assert [r["id"] for r in timeout_zh["results"]] == [1]
+    assert [r["id"] for r in timeout_en["results"]] == [3]
+    assert page["total"] == 2 and len(page["results"]) == 1 and page["results"][0]["kind"] == "bugs"
+    assert "限速" in login["results"][0]["snippet"] or "LDAP" in login["results"][0]["snippet"]
+
+
+def test_index_follows_writes(tmp_path):
+    fake = make_fake()
+
+    async def run():
+        async with search_client(fake, tmp_path) as client:
+            await client.get_product_bugs(1)
+            await client.update_bug(2, {"title": "导出报表空白"})
+            await client.delete_bug(1)
+            return await client.search("导出 空白"), await client.search("超时")
+
+    renamed, deleted = asyncio.run(run())
+    assert [r["id"] for r in renamed["results"]] == [2]
+    assert deleted["total"] == 0
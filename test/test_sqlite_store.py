@@ -0,0 +1,42 @@
+"""Tests for the shared SQLite store plumbing"""
+import os
+import stat
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from zentao_mcp.changes import ChangeStore
+from zentao_mcp.replica import Replica
+from zentao_mcp.search import SearchIndex
+from zentao_mcp.token_store import private_dir
+
+
+def mode(path) -> int:
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_databases_and_their_wal_files_are_owner_only(tmp_path):
+    directory = tmp_path / "cache"
+    directory.mkdir(mode=0o755)
+    old_umask = os.umask(0o022)
+    try:
+        for store_class, name in ((Replica, "replica"), (SearchIndex, "search"), (ChangeStore, "changes")):
+            path = str(directory / f"{name}.sqlite3")
+            store = store_class(path)
+            try:
+                for suffix in ("", "-wal", "-shm"):
+                    assert mode(path + suffix) == 0o600, path + suffix
+            finally:
+                store.close()
+    finally:
+        os.umask(old_umask)
+    assert mode(directory) == 0o700
+
+
+def test_shared_directories_are_left_alone(tmp_path):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    os.chmod(shared, 0o1777)
+    private_dir(str(shared))
+    assert mode(shared) == 0o1777
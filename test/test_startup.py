@@ -0,0 +1,16 @@
+"""Startup budget: the server must answer list_tools without loading the client"""
+import os
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(__file__), '..', 'src')
+
+
+def test_measure_startup_within_budget():
+    env = {**os.environ, "PYTHONPATH": os.path.abspath(SRC)}
+    proc = subprocess.run(
+        [sys.executable, "-m", "zentao_mcp", "--measure-startup", "--max-startup-ms", "5000"],
+        env=env, capture_output=True, text=True, timeout=60
+    )
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+    assert "first list_tools" in proc.stdout
@@ -0,0 +1,75 @@
+"""Tests for the persistent token cache"""
+import asyncio
+import json
+import os
+import stat
+
+from fake_zentao import FakeZentao, make_async_client
+from zentao_mcp.token_store import TokenStore
+
+
+def test_store_is_owner_only_and_keyed_by_account(tmp_path):
+    store = TokenStore(str(tmp_path / "cache" / "tokens.json"))
+    store.save("http://zentao.test/", "alice", "t-alice")
+    store.save("http://zentao.test", "bob", "t-bob")
+    assert store.load("http://zentao.test", "alice")[0] == "t-alice"
+    assert store.load("http://zentao.test", "bob")[0] == "t-bob"
+    assert stat.S_IMODE(os.stat(store.path).st_mode) == 0o600
+    assert stat.S_IMODE(os.stat(os.path.dirname(store.path)).st_mode) == 0o700
+
+
+def test_discard_keeps_a_token_refreshed_by_another_process(tmp_path):
+    store = TokenStore(str(tmp_path / "tokens.json"))
+    store.save("http://zentao.test", "alice", "new")
+    store.discard("http://zentao.test", "alice", "old")
+    assert store.load("http://zentao.test", "alice")[0] == "new"
+    store.discard("http://zentao.test", "alice", "new")
+    assert store.load("http://zentao.test", "alice") is None
+
+
+def test_new_process_reuses_cached_token_until_401(tmp_path):
+    fake = FakeZentao()
+    path = str(tmp_path / "tokens.json")
+
+    async def run():
+        async with make_async_client(fake, token_cache=True, token_cache_path=path) as first:
+            await first.get_product(1)
+        async with make_async_client(fake, token_cache=True, token_cache_path=path) as second:
+            await second.get_product(1)
+            assert second.auth_stats == {"logins": 0, "cached_tokens": 1, "proactive_refreshes": 0, "unauthorized": 0}
+            fake.valid_token = "token-2"
+            await second.get_product(1)
+            assert second.auth_stats["logins"] == 1
+
+    asyncio.run(run())
+    assert fake.token_requests == 2
+    assert TokenStore(path).load("http://zentao.test", "tester")[0] == "token-2"
+
+
+def test_existing_cache_directory_is_tightened(tmp_path):
+    directory = tmp_path / "shared"
+    directory.mkdir(mode=0o755)
+    store = TokenStore(str(directory / "tokens.json"))
+    store.save("http://zentao.test", "alice", "t-alice")
+    assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+
+
+def test_cached_token_due_for_refresh_is_not_adopted(tmp_path):
+    fake = FakeZentao()
+    path = str(tmp_path / "tokens.json")
+    store = TokenStore(path)
+    store.save("http://zentao.test", "tester", fake.valid_token)
+    with open(path) as f:
+        data = json.load(f)
+    for entry in data.values():
+        entry["issued_at"] -= 1400
+    with open(path, "w") as f:
+        json.dump(data, f)
+
+    async def run():
+        async with make_async_client(fake, token_cache=True, token_cache_path=path) as client:
+            await client.get_product(1)
+            return client.auth_stats
+
+    stats = asyncio.run(run())
+    assert stats["cached_tokens"] == 0 and stats["logins"] == 1
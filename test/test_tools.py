@@ -0,0 +1,43 @@
+"""Tests for the declarative tool registry"""
+import asyncio
+
+import pytest
+
+from fake_zentao import FakeZentao, make_async_client
+from zentao_mcp.client import AsyncZentaoClient
+from zentao_mcp.tools import ToolRegistry, ToolSpec, registry
+
+
+def test_every_tool_maps_to_a_client_method():
+    for tool in registry.tools():
+        spec = registry.get(tool.name)
+        assert spec.handler is not None or hasattr(AsyncZentaoClient, spec.method or spec.name)
+
+
+def test_read_tools_advertise_fields_and_writes_do_not():
+    assert "fields" in registry.get("get_bug").input_schema()["properties"]
+    assert "fields" not in registry.get("create_bug").input_schema()["properties"]
+    assert registry.get("update_bug").input_schema()["additionalProperties"] is True
+
+
+def test_duplicate_registration_is_rejected():
+    reg = ToolRegistry((ToolSpec(name="get_bug", description="x"),))
+    with pytest.raises(ValueError):
+        reg.register(ToolSpec(name="get_bug", description="y"))
+
+
+def test_invoke_maps_args_body_and_options():
+    fake = FakeZentao()
+    fake.add("bugs", {"id": 3, "title": "old", "product": 1})
+
+    async def run():
+        async with make_async_client(fake) as client:
+            updated = await registry.get("update_bug").invoke(
+                client, {"bug_id": 3, "title": "new", "fields": ["id"]}
+            )
+            page = await registry.get("list_projects").invoke(client, {"limit": 5})
+            return updated, page
+
+    updated, page = asyncio.run(run())
+    assert updated == {"id": 3, "title": "new", "product": 1}
+    assert page["limit"] == 5
@@ -0,0 +1,76 @@
+"""Tests for the typed client mode"""
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+
+from fake_zentao import FakeZentao, make_async_client, make_config
+from zentao_mcp.client import ZentaoClient
+from zentao_mcp.models import Bug, BugList, User
+from zentao_mcp.typed import LazyList, LazyRecord, TypedZentaoClient
+
+
+def make_fake() -> FakeZentao:
+    fake = FakeZentao()
+    for i in range(1, 6):
+        fake.add("bugs", {"id": i, "product": 1, "title": f"bug {i}", "severity": str(i % 4 + 1), "pri": 2,
+                          "status": "active", "openedBy": {"id": 3, "account": "lisi"}, "assignedTo": "zhangsan"})
+    return fake
+
+
+def test_eager_mode_validates_whole_list():
+    fake = make_fake()
+
+    async def run():
+        async with make_async_client(fake) as client:
+            typed = TypedZentaoClient(client)
+            return await typed.get_product_bugs(1), await typed.get_bug(2), await typed.list_users()
+
+    bugs, bug, users = asyncio.run(run())
+    assert isinstance(bugs, BugList) and len(bugs.bugs) == 5
+    assert all(isinstance(b, Bug) for b in bugs.bugs)
+    assert bugs.bugs[0].severity == 2 and bugs.bugs[0].pri == 2
+    assert bugs.bugs[0].openedBy == User(id=3, account="lisi")
+    assert bugs.bugs[0].assignedTo.account == "zhangsan"
+    assert isinstance(bug, Bug) and bug.id == 2
+    # Methods without a model pass through untouched
+    assert isinstance(users, dict)
+
+
+def test_lazy_mode_validates_only_fields_read():
+    fake = make_fake()
+    fake.data["bugs"][4]["severity"] = "high"
+
+    async def run():
+        async with make_async_client(fake) as client:
+            return await TypedZentaoClient(client, lazy=True).get_product_bugs(1)
+
+    bugs = asyncio.run(run())
+    assert isinstance(bugs, BugList) and isinstance(bugs.bugs, LazyList)
+    assert bugs.total == 5 and len(bugs.bugs) == 5
+    first = bugs.bugs[0]
+    assert isinstance(first, LazyRecord) and first is bugs.bugs[0]
+    assert first.severity == 2 and first.openedBy.account == "lisi"
+    assert first.status == "active"
+    assert set(first._values) == {"severity", "openedBy", "status"}
+    assert first.confirmed is None
+    with pytest.raises(AttributeError):
+        first.nonexistent
+    # The malformed record only fails once the bad field (or the whole list) is validated
+    assert bugs.bugs[3].title == "bug 4"
+    with pytest.raises(ValidationError):
+        bugs.bugs[3].severity
+    with pytest.raises(ValidationError):
+        bugs.bugs.validate()
+    assert isinstance(bugs.bugs[0].validate(), Bug)
+
+
+def test_sync_client_and_iterators():
+    fake = make_fake()
+    with ZentaoClient(make_config(page_size=2), transport=fake.transport()) as client:
+        typed = TypedZentaoClient(client)
+        bug = typed.get_bug(1)
+        streamed = list(typed.iter_product_bugs(1))
+    assert isinstance(bug, Bug) and bug.title == "bug 1"
+    assert [b.id for b in streamed] == [1, 2, 3, 4, 5]
+    assert all(isinstance(b, Bug) for b in streamed)